@@ -0,0 +1,63 @@
+"""
+Compares the aggregate builtins with the foreach loops computing the same sums and maxima, on every execution engine.
+Run from the src directory:
+
+    python -m benchmarks.aggregates
+"""
+import argparse
+import timeit
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from main import ENGINES
+from parser.parser import Parser
+
+setup = """
+let cuboid = Cuboid(width=1.5, length=2.0, height=3.0)
+let cone = Cone(radius=1, height=2)
+let sphere = Sphere(radius=2)
+let pyramid = Pyramid(width=2.0, length=2.5, height=5.0)
+let solids = [cuboid, cone, sphere, pyramid, cuboid, cone, sphere, pyramid]
+let total = 0.0
+let largest = 0.0
+let i = 0
+"""
+
+loop = """
+while (i < 1000) {
+    total = 0.0
+    largest = 0.0
+    foreach (solid in solids) {
+        total = total + solid.getVolume()
+        let area = solid.getSurfaceArea()
+        if (area > largest) {
+            largest = area
+        }
+    }
+    i = i + 1
+}
+"""
+
+builtins = """
+while (i < 1000) {
+    total = sumVolume(objects=solids)
+    largest = maxSurfaceArea(objects=solids)
+    i = i + 1
+}
+"""
+
+
+def run(engine: str, code: str) -> None:
+    ENGINES[engine](Parser(Lexer(StringSource(setup + code)))).interpret()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the aggregate builtins against interpreted foreach loops")
+    parser.add_argument("-n", "--number", type=int, default=5, help="Number of runs per engine and script")
+    args = parser.parse_args()
+    for engine in ENGINES:
+        loopSeconds = min(timeit.repeat(lambda: run(engine, loop), number=1, repeat=args.number))
+        builtinSeconds = min(timeit.repeat(lambda: run(engine, builtins), number=1, repeat=args.number))
+        print(
+            f"{engine:<10} foreach {loopSeconds * 1000:8.1f} ms  builtins {builtinSeconds * 1000:8.1f} ms"
+            f"  {loopSeconds / builtinSeconds:5.2f}x"
+        )
@@ -0,0 +1,116 @@
+"""
+Compares ending blocks with the interpreter's completion flag against the completion values blocks used to return,
+on deeply nested loops that break, continue and return. Both measure about the same, within the noise of repeated
+runs: checking the flag after every statement costs as much as checking the value every statement used to return. The
+flag is there because it's clearer, not because it's faster. Run from the src directory:
+
+    python -m benchmarks.completions
+"""
+import argparse
+import timeit
+from enum import Enum
+from interpreter.interpreter import Interpreter
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.parser import Parser
+
+code = """
+function innermost(n) {
+    let k = 0
+    while (true) {
+        k = k + 1
+        if (k > n) {
+            return k
+        }
+    }
+    return 0
+}
+let total = 0
+let i = 0
+while (i < 200) {
+    i = i + 1
+    let j = 0
+    while (j < 40) {
+        j = j + 1
+        let l = 0
+        while (true) {
+            l = l + 1
+            total = total + innermost(n=2)
+            break
+        }
+        continue
+    }
+}
+"""
+
+
+class LoopOperation(Enum):
+    CONTINUE = 1
+    BREAK = 2
+
+
+class ValueCompletionInterpreter(Interpreter):
+    """Tree-walking interpreter ending blocks like it used to, on the first statement returning a value"""
+
+    def visitIfStatement(self, node):
+        for conditionWithBlock in [node.ifCB] + (node.elifCBs or []):
+            if self.visit(conditionWithBlock.condition):
+                self.nextContext(conditionWithBlock.block.scope)
+                returnValue = self.visit(conditionWithBlock.block)
+                self.previousContext()
+                return returnValue
+        if node.elseBlock:
+            return self.visit(node.elseBlock)
+        return None
+
+    def visitBlockWithoutFunciton(self, node):
+        returnValue = None
+        for statement in node.statements:
+            returnValue = self.visit(statement)
+            if returnValue is not None:
+                break
+        return returnValue
+
+    visitWhileBlock = visitBlockWithoutFunciton
+
+    def executeBody(self, function):
+        self.returnValue = self.visit(function.body)
+
+    def visitReturnStatement(self, node):
+        return self.visit(node.expression)
+
+    def visitWhileLoop(self, node):
+        returnValue = None
+        frame = None
+        while self.visit(node.condition):
+            frame = self.enterLoopFrame(frame, node.block.scope)
+            returnValue = self.visit(node.block)
+            self.previousContext()
+            if returnValue is not None and returnValue is not LoopOperation.CONTINUE:
+                return None if returnValue is LoopOperation.BREAK else returnValue
+        return returnValue
+
+    def visitBreak(self, _):
+        return LoopOperation.BREAK
+
+    def visitContinue(self, _):
+        return LoopOperation.CONTINUE
+
+
+def run(engine: type[Interpreter]) -> None:
+    engine(Parser(Lexer(StringSource(code)))).interpret()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ending blocks on break, continue and return")
+    parser.add_argument("-n", "--number", type=int, default=5, help="Number of runs per interpreter")
+    args = parser.parse_args()
+    engines = (ValueCompletionInterpreter, Interpreter)
+    # The runs of both interpreters alternate, so they share the machine's slower and faster moments
+    times = {engine: float("inf") for engine in engines}
+    for _ in range(args.number):
+        for engine in engines:
+            times[engine] = min(times[engine], timeit.timeit(lambda: run(engine), number=1))
+    baseline = times[ValueCompletionInterpreter]
+    for engine in engines:
+        print(f"{engine.__name__:<28} {times[engine] * 1000:8.1f} ms  {baseline / times[engine]:5.2f}x")
@@ -0,0 +1,64 @@
+"""
+Measures the cost of dispatching a node to its visit method on the expressions of
+tests/interpreter/test_expressions.py. Run from the src directory:
+
+    python -m benchmarks.dispatch
+"""
+import argparse
+import inspect
+import textwrap
+import timeit
+from interpreter.interpreter import Interpreter
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.parser import Parser
+from tests.interpreter.test_expressions import TestExpressions
+
+
+class GetattrInterpreter(Interpreter):
+    """Interpreter dispatching like NodeVisitor used to, by building the method name for every node"""
+
+    def visit(self, node):
+        method_name = "visit" + type(node).__name__
+        visitor = getattr(self, method_name, self.genericVisit)
+        return visitor(node)
+
+
+class CountingInterpreter(Interpreter):
+    literalNodes = frozenset()
+
+    def __init__(self, parser: Parser) -> None:
+        super().__init__(parser)
+        self.visits = 0
+
+    def visit(self, node):
+        self.visits += 1
+        return super().visit(node)
+
+
+def expressions() -> list[str]:
+    # Sources of the tests that evaluate without errors, taken from their docstrings
+    return [
+        textwrap.dedent(method.__doc__).strip()
+        for name, method in inspect.getmembers(TestExpressions, inspect.isfunction)
+        if name.startswith("test") and not name.endswith("Fail") and method.__doc__
+    ]
+
+
+def evaluate(interpreter: Interpreter, expressions: list) -> None:
+    for expression in expressions:
+        interpreter.visit(expression)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the visitor dispatch on expression-heavy programs")
+    parser.add_argument("-n", "--number", type=int, default=20000, help="Number of evaluations of every expression")
+    args = parser.parse_args()
+    # Every program declares a single variable, only its value is evaluated
+    values = [Parser(Lexer(StringSource(code))).parse()[0].assignment.value for code in expressions()]
+    counter = CountingInterpreter(Parser(Lexer(StringSource(""))))
+    evaluate(counter, values)
+    for engine in (GetattrInterpreter, Interpreter):
+        interpreter = engine(Parser(Lexer(StringSource(""))))
+        seconds = min(timeit.repeat(lambda: evaluate(interpreter, values), number=args.number, repeat=5))
+        print(f"{engine.__name__:<20} {seconds * 1e9 / (counter.visits * args.number):6.1f} ns per visited node")
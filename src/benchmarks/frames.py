@@ -0,0 +1,50 @@
+"""
+Compares running every iteration of a loop in the loop's reused frame with allocating a new context for every
+iteration, in each execution engine. Run from the src directory:
+
+    python -m benchmarks.frames
+"""
+import argparse
+import timeit
+from interpreter.interpreter import Interpreter
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from main import ENGINES
+from parser.parser import Parser
+
+code = """
+let elements = [1, 2, 3, 4, 5]
+let total = 0
+let i = 0
+while (i < 20000) {
+    let square = i * i
+    foreach (element in elements) {
+        let product = element * square
+        total = total + product
+    }
+    i = i + 1
+}
+"""
+
+
+def freshContexts(engine: type[Interpreter]) -> type[Interpreter]:
+    # The engine as it ran loops before, with a new context for every iteration
+    def enterLoopFrame(self, frame, scope):
+        self.nextContext(scope)
+        return self.context
+
+    return type(f"Fresh{engine.__name__}", (engine,), {"enterLoopFrame": enterLoopFrame})
+
+
+def run(engine: type[Interpreter]) -> None:
+    engine(Parser(Lexer(StringSource(code)))).interpret()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark reusing a frame for every iteration of a loop")
+    parser.add_argument("-n", "--number", type=int, default=5, help="Number of runs per engine")
+    args = parser.parse_args()
+    for name, engine in ENGINES.items():
+        fresh = min(timeit.repeat(lambda: run(freshContexts(engine)), number=1, repeat=args.number))
+        reused = min(timeit.repeat(lambda: run(engine), number=1, repeat=args.number))
+        print(f"{name:<10} fresh {fresh * 1000:8.1f} ms  reused {reused * 1000:8.1f} ms  {fresh / reused:5.2f}x")
@@ -0,0 +1,33 @@
+"""
+Compares the throughput of the lexers on the sample program from main.py repeated many times. Run from the src
+directory:
+
+    python -m benchmarks.lexer
+"""
+import argparse
+import time
+from lexer.fast_lexer import FastLexer
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from lexer.token_type import TokenType
+from main import code
+
+
+def tokenize(lexer: type[Lexer], text: str) -> int:
+    tokens = 1
+    instance = lexer(StringSource(text))
+    while instance.getNextToken().type != TokenType.VT_EOF:
+        tokens += 1
+    return tokens
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the lexers")
+    parser.add_argument("-s", "--scale", type=int, default=200, help="Number of copies of the sample program")
+    args = parser.parse_args()
+    text = code * args.scale
+    for lexer in (Lexer, FastLexer):
+        start = time.perf_counter()
+        tokens = tokenize(lexer, text)
+        seconds = time.perf_counter() - start
+        print(f"{lexer.__name__:<10} {tokens} tokens in {seconds:6.3f} s, {tokens / seconds:10.0f} tokens/s")
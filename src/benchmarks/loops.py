@@ -0,0 +1,48 @@
+"""
+Compares the execution engines on a loop-heavy script. Run from the src directory:
+
+    python -m benchmarks.loops
+"""
+import argparse
+import timeit
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from main import ENGINES
+from parser.parser import Parser
+
+code = """
+let cuboid = Cuboid(width=1, length=2, height=3)
+let cone = Cone(radius=1, height=2)
+let sphere = Sphere(radius=2)
+let solids = [cuboid, cone, sphere]
+let total = 0.0
+let i = 0
+while (i < 2000) {
+    foreach (solid in solids) {
+        total = total + solid.getVolume()
+    }
+    let j = 0
+    while (j < 5) {
+        if (i * j > 100) {
+            total = total - 1
+        }
+        j = j + 1
+    }
+    i = i + 1
+}
+"""
+
+
+def run(engine: str) -> None:
+    ENGINES[engine](Parser(Lexer(StringSource(code)))).interpret()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the execution engines on while and foreach loops")
+    parser.add_argument("-n", "--number", type=int, default=5, help="Number of runs per engine")
+    args = parser.parse_args()
+    baseline = None
+    for engine in ENGINES:
+        seconds = min(timeit.repeat(lambda: run(engine), number=1, repeat=args.number))
+        baseline = baseline or seconds
+        print(f"{engine:<10} {seconds * 1000:8.1f} ms  {baseline / seconds:5.2f}x")
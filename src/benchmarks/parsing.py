@@ -0,0 +1,109 @@
+"""
+Measures the parser's throughput in statements per second on large generated programs, with statements and values
+dispatched on the current token against trying each parsing method in turn, like the parser used to. The programs
+are written to a temporary file and lexed before the timing starts, so only parsing is measured. Run from the src
+directory:
+
+    python -m benchmarks.parsing
+"""
+import argparse
+import os
+import tempfile
+import timeit
+from typing import List
+from lexer.fast_lexer import FastLexer
+from lexer.source import FileSource
+from lexer.tokens import Token
+from parser.parser import Parser
+
+# One block of the generated program, {i} keeps the names of every block apart
+BLOCK = """function volume{i}(a, b) {{
+    let cube = Cuboid(width=a, height=b, length=a * 2 + 1)
+    return cube.getVolume()
+}}
+let total{i} = 0
+let sizes{i} = [1, 2, 3, 4]
+foreach (size in sizes{i}) {{
+    if (size > 2 and not (size == 4)) {{
+        total{i} = total{i} + volume{i}(a=size, b=-size)
+    }}
+    elif (size <= 1) {{
+        total{i} = total{i} * 2
+    }}
+    else {{
+        total{i} = total{i} - 1.5
+    }}
+}}
+let i{i} = 0
+while (i{i} < 10) {{
+    i{i} = i{i} + 1
+    if (i{i} == 5) {{
+        print(out="half")
+    }}
+    print(out="step " + string(value=i{i}))
+}}
+"""
+
+# Top-level statements of a single block
+BLOCK_STATEMENTS = 6
+
+
+class SequentialParser(Parser):
+    """Parser trying each statement and value parsing method in turn, until one of them recognizes the token"""
+
+    def parseStatement(self):
+        return self.parseStatementWithoutFunction() or self.parseFunctionDefinition()
+
+    def parseStatementWithoutFunction(self):
+        return (
+            self.parseStartingWithIdentifier()
+            or self.parseForEachLoop()
+            or self.parseExpression()
+            or self.parseIfStatement()
+            or self.parseVariableDeclaration()
+            or self.parseReturnStatement()
+            or self.parseWhileLoop()
+        )
+
+    def parseStatementForWhileLoop(self):
+        return self.parseStatementWithoutFunction() or self.parseWhileOperation()
+
+    def parseValue(self):
+        return self.parseObjectConstructor() or self.parseExpression() or self.parseList()
+
+
+def generateTokens(blocks: int) -> List[Token]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "generated.lemon")
+        with open(path, "w") as file:
+            for i in range(blocks):
+                file.write(BLOCK.format(i=i))
+        lexer = FastLexer(FileSource(path))
+        return lexer._getAllTokens()
+
+
+def parse(parserType: type[Parser], tokens: List[Token]) -> list:
+    return parserType(FastLexer(FileSource(os.devnull)), tokens).parse()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parsing statements of large generated programs")
+    parser.add_argument("-b", "--blocks", type=int, default=2000, help="Number of generated blocks of statements")
+    parser.add_argument("-n", "--number", type=int, default=5, help="Number of runs per parser")
+    args = parser.parse_args()
+    tokens = generateTokens(args.blocks)
+    statements = args.blocks * BLOCK_STATEMENTS
+    parsers = (SequentialParser, Parser)
+    program = parse(Parser, tokens)
+    if len(program) != statements or program != parse(SequentialParser, tokens):
+        raise RuntimeError("The parsers don't parse the generated program the same")
+    # The runs of both parsers alternate, so they share the machine's slower and faster moments
+    times = {parserType: float("inf") for parserType in parsers}
+    for _ in range(args.number):
+        for parserType in parsers:
+            times[parserType] = min(times[parserType], timeit.timeit(lambda: parse(parserType, tokens), number=1))
+    baseline = times[SequentialParser]
+    print(f"{len(tokens)} tokens, {statements} top-level statements")
+    for parserType in parsers:
+        time = times[parserType]
+        print(f"{parserType.__name__:<18} {time * 1000:8.1f} ms  {statements / time:10.0f} statements/s  {baseline / time:5.2f}x")
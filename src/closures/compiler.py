@@ -0,0 +1,395 @@
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+from common.errors import InterpreterError
+from interpreter.interpreter import Completion
+from interpreter.lists import SolidList, TypedList, isList, makeList
+from interpreter.operations import (
+    ADDITIVE_OPERATIONS,
+    BUILTIN_FUNCTIONS,
+    COMPARISON_OPERATIONS,
+    MULTIPLICATIVE_OPERATIONS,
+    OBJECT_CLASSES,
+    callMethod,
+    expectNumberOfArguments,
+    expectSingleArgument,
+    isNumber,
+    listType,
+    logicalAnd,
+    logicalOr,
+    negate,
+    subscript,
+)
+from interpreter.visitor import NodeVisitor
+from parser.nodes import (
+    AdditiveExpression,
+    Assignment,
+    BlockWithoutFunciton,
+    Break,
+    ComparisonExpression,
+    Continue,
+    ForEachLoop,
+    FunctionCall,
+    FunctionDefinition,
+    IfStatement,
+    LemonList,
+    LiteralBool,
+    LiteralFloat,
+    LiteralIdentifier,
+    LiteralInt,
+    LiteralString,
+    LiteralSubscriptable,
+    LogicalAndExpression,
+    LogicalOrExpression,
+    MultiplicativeExpression,
+    Node,
+    ObjectConstructor,
+    ObjectMethodCall,
+    ObjectProperty,
+    PrimaryExpression,
+    ReturnStatement,
+    VariableDeclaration,
+    WhileBlock,
+    WhileLoop,
+)
+
+if TYPE_CHECKING:
+    from closures.interpreter import ClosureInterpreter
+
+# A compiled node: calling it does what visiting the node does in the tree-walking interpreter
+Evaluate = Callable[[], Any]
+
+NORMAL = Completion.NORMAL
+BREAK = Completion.BREAK
+CONTINUE = Completion.CONTINUE
+RETURN = Completion.RETURN
+
+
+def fail(error: Exception) -> Evaluate:
+    def evaluate():
+        raise error.with_traceback(None)
+
+    return evaluate
+
+
+def constant(value) -> Evaluate:
+    return lambda: value
+
+
+class ClosureCompiler(NodeVisitor):
+    """
+    Turns every node into a Python closure over its already compiled children. The node's type, operator and any
+    other decision that doesn't depend on runtime values is dispatched once, while compiling, instead of on every visit.
+    The closures read and replace the engine's current context, exactly like the tree-walking interpreter.
+    """
+
+    def __init__(self, engine: "ClosureInterpreter") -> None:
+        self.engine = engine
+
+    def compile(self, node: Node) -> Evaluate:
+        return self.visit(node)
+
+    def genericVisit(self, node) -> Evaluate:
+        # Mirrors the tree-walking interpreter, which only fails once it reaches the node
+        return fail(Exception(f"No visit{type(node).__name__} method"))
+
+    def compileBlock(self, statements: list) -> Evaluate:
+        engine = self.engine
+        compiled = [self.visit(statement) for statement in statements]
+
+        def block():
+            for statement in compiled:
+                statement()
+                if engine.completion:
+                    return
+
+        return block
+
+    # Statements
+
+    def visitVariableDeclaration(self, node: VariableDeclaration) -> Evaluate:
+        engine = self.engine
+        variableName = node.assignment.name
+        if type(variableName) != str:
+            return fail(InterpreterError("Variable declaration's name has to be an identifier, not object property", node))
+        value = self.visit(node.assignment.value)
+        position = node.startPosition
+
+        def declare():
+            engine.context.declare(variableName, value(), position)
+
+        return declare
+
+    def visitAssignment(self, node: Assignment) -> Evaluate:
+        engine = self.engine
+        variableName = node.name
+        value = self.visit(node.value)
+        position, slot = node.position, node.slot
+        if type(variableName) == str:
+
+            def assign():
+                engine.context.set(variableName, value(), position, slot)
+
+            return assign
+        elif isinstance(variableName, ObjectProperty):
+            identifier, property = variableName.identifier, variableName.property
+
+            def assignProperty():
+                engine.context.setObjectProperty(identifier, property, value(), position, slot)
+
+            return assignProperty
+        return fail(InterpreterError("Assignment's name has to be an identifier, not object property", node))
+
+    # Expressions
+
+    def compileBinary(self, node, operations: dict[str, Callable]) -> Evaluate:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operation = operations.get(node.operator)
+        if operation is None:
+            error = InterpreterError(f"Operator {node.operator} is not supported", node)
+
+            def unsupported():
+                left()
+                right()
+                raise error.with_traceback(None)
+
+            return unsupported
+        compute = operation
+        return lambda: compute(left(), right())
+
+    def visitLogicalOrExpression(self, node: LogicalOrExpression) -> Evaluate:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        return lambda: logicalOr(left(), right())
+
+    def visitLogicalAndExpression(self, node: LogicalAndExpression) -> Evaluate:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        return lambda: logicalAnd(left(), right())
+
+    def visitComparisonExpression(self, node: ComparisonExpression) -> Evaluate:
+        return self.compileBinary(node, COMPARISON_OPERATIONS)
+
+    def visitAdditiveExpression(self, node: AdditiveExpression) -> Evaluate:
+        return self.compileBinary(node, ADDITIVE_OPERATIONS)
+
+    def visitMultiplicativeExpression(self, node: MultiplicativeExpression) -> Evaluate:
+        return self.compileBinary(node, MULTIPLICATIVE_OPERATIONS)
+
+    def visitPrimaryExpression(self, node: PrimaryExpression) -> Evaluate:
+        literal = self.visit(node.literal)
+        if node.isNegated:
+            return lambda: negate(literal())
+        return literal
+
+    # Literals
+
+    def visitLiteralFloat(self, node: LiteralFloat) -> Evaluate:
+        return constant(node.value)
+
+    def visitLiteralInt(self, node: LiteralInt) -> Evaluate:
+        return constant(node.value)
+
+    def visitLiteralBool(self, node: LiteralBool) -> Evaluate:
+        return constant(node.value)
+
+    def visitLiteralString(self, node: LiteralString) -> Evaluate:
+        return constant(node.value)
+
+    def visitLiteralIdentifier(self, node: LiteralIdentifier) -> Evaluate:
+        engine = self.engine
+        name, position, slot = node.value, node.startPosition, node.slot
+        return lambda: engine.context.get(name, position, slot)
+
+    def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> Evaluate:
+        engine = self.engine
+        name, position, slot = node.value, node.startPosition, node.slot
+        index = self.visit(node.subscript)
+        return lambda: subscript(engine.context.get(name, position, slot), index())
+
+    def visitLemonList(self, node: LemonList) -> Evaluate:
+        values = [self.visit(value) for value in node.values]
+
+        def lemonList() -> List | TypedList | SolidList:
+            if len(values) == 0:
+                return []
+            firstValue = values[0]()
+            valuesType = listType(firstValue)
+            list = [firstValue]
+            for expression in values[1:]:
+                value = expression()
+                if not isinstance(value, valuesType):
+                    raise InterpreterError("List cannot contain multiple types", node)
+                list.append(value)
+            return makeList(list)
+
+        return lemonList
+
+    # If
+
+    def visitIfStatement(self, node: IfStatement) -> Evaluate:
+        engine = self.engine
+        branches = [
+            (self.visit(conditionWithBlock.condition), self.visit(conditionWithBlock.block), conditionWithBlock.block.scope)
+            for conditionWithBlock in [node.ifCB] + (node.elifCBs or [])
+        ]
+        elseBlock = self.visit(node.elseBlock) if node.elseBlock else None
+
+        def ifStatement():
+            for condition, block, scope in branches:
+                if condition():
+                    engine.nextContext(scope)
+                    block()
+                    engine.previousContext()
+                    return
+            if elseBlock is not None:
+                elseBlock()
+
+        return ifStatement
+
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> Evaluate:
+        return self.compileBlock(node.statements)
+
+    # Functions
+
+    def visitFunctionDefinition(self, node: FunctionDefinition) -> Evaluate:
+        engine = self.engine
+        return lambda: engine.visitFunctionDefinition(node)
+
+    def visitFunctionCall(self, node: FunctionCall) -> Evaluate:
+        native = BUILTIN_FUNCTIONS.get(node.name)
+        if native is not None:
+            return self.compileNativeCall(node, *native)
+        engine = self.engine
+        arguments = [self.visit(argument.value) for argument in node.arguments]
+
+        def call():
+            function, indices = engine.bindFunction(node)
+            values = []
+            for parameter, index in zip(function.parameters, indices):
+                if index is None:
+                    raise InterpreterError(f"Function {node.name} requires {parameter} argument", node)
+                values.append(arguments[index]())
+            return engine.callFunction(function, node, values)
+
+        return call
+
+    def compileNativeCall(self, node: FunctionCall, argumentName: str, function: Callable) -> Evaluate:
+        try:
+            expectSingleArgument(node.name, argumentName, node.arguments)
+        except TypeError as error:
+            return fail(error)
+        value = self.visit(node.arguments[0].value)
+        return lambda: function(value())
+
+    def visitReturnStatement(self, node: ReturnStatement) -> Evaluate:
+        engine = self.engine
+        expression = self.visit(node.expression)
+
+        def returnStatement():
+            engine.returnValue = expression()
+            engine.completion = RETURN
+
+        return returnStatement
+
+    # Loops
+
+    def visitWhileLoop(self, node: WhileLoop) -> Evaluate:
+        engine = self.engine
+        condition = self.visit(node.condition)
+        block = self.visit(node.block)
+        scope = node.block.scope
+
+        def whileLoop():
+            frame = None
+            while condition():
+                frame = engine.enterLoopFrame(frame, scope)
+                block()
+                engine.previousContext()
+                completion = engine.completion
+                if completion:
+                    if completion is not RETURN:
+                        engine.completion = NORMAL
+                    if completion is not CONTINUE:
+                        return
+
+        return whileLoop
+
+    def visitWhileBlock(self, node: WhileBlock) -> Evaluate:
+        return self.compileBlock(node.statements)
+
+    def visitForEachLoop(self, node: ForEachLoop) -> Evaluate:
+        engine = self.engine
+        iterable = self.visit(node.iterable)
+        block = self.visit(node.block)
+        scope = node.block.scope
+        identifier, position = node.identifier, node.startPosition
+
+        def forEachLoop():
+            elements = iterable()
+            if not isList(elements):
+                raise TypeError(f"Type {type(elements)} is not iterable")
+            frame = None
+            for element in elements:
+                frame = engine.enterLoopFrame(frame, scope)
+                engine.context.declare(identifier, element, position)
+                block()
+                engine.previousContext()
+                completion = engine.completion
+                if completion:
+                    if completion is not RETURN:
+                        engine.completion = NORMAL
+                    if completion is not CONTINUE:
+                        return
+
+        return forEachLoop
+
+    def visitBreak(self, _: Break) -> Evaluate:
+        engine = self.engine
+
+        def breakLoop():
+            engine.completion = BREAK
+
+        return breakLoop
+
+    def visitContinue(self, _: Continue) -> Evaluate:
+        engine = self.engine
+
+        def continueLoop():
+            engine.completion = CONTINUE
+
+        return continueLoop
+
+    # Objects
+
+    def visitObjectConstructor(self, node: ObjectConstructor) -> Evaluate:
+        objectClass = OBJECT_CLASSES.get(node.objectType.value)
+        if objectClass is None:
+            return fail(InterpreterError(f"Object type {node.objectType} is not supported", node))
+        objectType, parameters = objectClass
+        try:
+            expectNumberOfArguments(node.arguments, len(parameters), node)
+        except InterpreterError as error:
+            return fail(error)
+        arguments: list[tuple[str, Optional[Evaluate]]] = []
+        for parameter in parameters:
+            value = next((argument.value for argument in node.arguments if argument.name == parameter), None)
+            arguments.append((parameter, self.visit(value) if value is not None else None))
+
+        def construct():
+            values = []
+            for parameter, argument in arguments:
+                if argument is None:
+                    raise InterpreterError(f"{node.objectType} constructor requires {parameter} argument", node)
+                value = argument()
+                if not isNumber(value):
+                    raise InterpreterError(f"{node.objectType} constructor requires {parameter} argument to be a number", node)
+                values.append(value)
+            return objectType(*values)
+
+        return construct
+
+    def visitObjectMethodCall(self, node: ObjectMethodCall) -> Evaluate:
+        engine = self.engine
+        name, position, slot = node.identifier, node.startPosition, node.slot
+        methodName, argumentCount = node.functionCall.name, len(node.functionCall.arguments)
+        return lambda: callMethod(engine.context.get(name, position, slot), name, methodName, argumentCount, node)
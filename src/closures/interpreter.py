@@ -0,0 +1,27 @@
+from closures.compiler import ClosureCompiler, Evaluate
+from interpreter.interpreter import Interpreter
+from parser.nodes import FunctionDefinition, Node
+from parser.parser import Parser
+
+
+class ClosureInterpreter(Interpreter):
+    """
+    Interpreter running every top-level statement and function body as a tree of closures compiled from its nodes.
+    Contexts, resolved slots and the operator semantics are shared with the tree-walking interpreter.
+    """
+
+    def __init__(self, parser: Parser) -> None:
+        super().__init__(parser)
+        self.compiler = ClosureCompiler(self)
+        # id of the function definition -> (function definition, compiled body)
+        self.functions: dict[int, tuple[FunctionDefinition, Evaluate]] = {}
+
+    def execute(self, node: Node) -> None:
+        self.compiler.compile(node)()
+
+    def executeBody(self, function: FunctionDefinition) -> None:
+        compiled = self.functions.get(id(function))
+        if compiled is None or compiled[0] is not function:
+            compiled = (function, self.compiler.compile(function.body))
+            self.functions[id(function)] = compiled
+        compiled[1]()
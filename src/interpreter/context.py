@@ -1,63 +1,121 @@
 from dataclasses import dataclass, field
 from typing import Optional
 from common.errors import CriticalInterpreterError
+from interpreter.lists import valueType
 from interpreter.objects import Object
 from interpreter.types import VariableWithPosition, Values
 from lexer.tokens import Position
+from parser.nodes import Scope, Slot
+
+# Marks a slot of the frame whose variable hasn't been declared yet
+UNDEFINED = object()
 
 
 @dataclass
 class Context:
     parent: "Context | None" = None
-    local_values: VariableWithPosition = field(default_factory=dict)
-
-    def get(self, key: str, position: Position) -> Values:
-        if self.__isNameInLocalValues(key):
-            return self.local_values[key][0]
-        elif self.parent is not None:
-            return self.parent.get(key, position)
-        else:
-            raise CriticalInterpreterError(f"Variable {key} at {position} is not defined")
-
-    def __getLocal(self, key: str) -> Optional[tuple[Values, Position]]:
-        if self.__isNameInLocalValues(key):
-            return self.local_values[key]
-        return None
+    # Names are shared with the scope computed by the resolver, the frame itself is only a pair of flat lists
+    names: Scope = field(default_factory=dict)
+    values: list = field(default_factory=list, repr=False)
+    positions: list[Position | None] = field(default_factory=list, repr=False)
+    # Ancestor contexts that already resolved a name for this context. Names are only ever declared in the innermost
+    # context, so a context between this one and the cached ancestor can't start shadowing the name later on.
+    resolved: "dict[str, Context]" = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def local_values(self) -> VariableWithPosition:
+        return {
+            name: (self.values[index], self.positions[index])  # type: ignore
+            for name, index in self.names.items()
+            if index < len(self.values) and self.values[index] is not UNDEFINED
+        }
+
+    def get(self, key: str, position: Position, slot: Optional[Slot] = None) -> Values:
+        if slot is not None:
+            context = self.__atDepth(slot[0])
+            if slot[1] < len(context.values):
+                value = context.values[slot[1]]
+                if value is not UNDEFINED:
+                    return value
+        index = self.__indexOf(key)
+        if index is not None:
+            return self.values[index]
+        context = self.__resolve(key, position)
+        return context.values[context.names[key]]
+
+    def set(self, key: str, value: Values, position: Position, slot: Optional[Slot] = None) -> None:
+        context, index = self.__find(key, position, slot)
+        local = context.values[index]
+        if valueType(local) != valueType(value):
+            raise CriticalInterpreterError(
+                f"Variable {key} at {position} is already defined as {valueType(local)} at {context.positions[index]}"  # noqa: E501
+            )
+        context.values[index] = value
+        context.positions[index] = position
 
-    def set(self, key: str, value: Values, position: Position) -> None:
-        local = self.__getLocal(key)
-        if local is not None:
-            if type(local[0]) != type(value):
-                raise CriticalInterpreterError(
-                    f"Variable {key} at {position} is already defined as {type(local[0])} at {local[1]}"  # noqa: E501
-                )
-            self.local_values[key] = (value, position)
-        elif self.parent is not None:
-            self.parent.set(key, value, position)
-        else:
-            raise CriticalInterpreterError(f"Variable {key} at {position} is not defined")
-
-    def setObjectProperty(self, key: str, property: str, value: Values, position: Position) -> None:
-        local = self.__getLocal(key)
-        if local is not None:
-            if not isinstance(local[0], Object):
-                raise CriticalInterpreterError(
-                    f"Variable {key} at {position} is not an object. It's defined as {type(local[0])} at {local[1]}"  # noqa: E501
-                )
-            setattr(local[0], property, value)
-        elif self.parent is not None:
-            self.parent.setObjectProperty(key, property, value, position)
-        else:
-            raise CriticalInterpreterError(f"Variable {key} at {position} is not defined")
+    def setObjectProperty(self, key: str, property: str, value: Values, position: Position, slot: Optional[Slot] = None) -> None:
+        context, index = self.__find(key, position, slot)
+        local = context.values[index]
+        if not isinstance(local, Object):
+            raise CriticalInterpreterError(
+                f"Variable {key} at {position} is not an object. It's defined as {type(local)} at {context.positions[index]}"  # noqa: E501
+            )
+        if property not in local.dimensions:
+            raise CriticalInterpreterError(f"Object {key} at {position} has no property {property}")
+        local.setProperty(property, value)
+
+    def reset(self) -> None:
+        # Undeclares every variable of the frame, so the next iteration of a loop can run in it. The names it resolved
+        # to ancestors stay valid, the contexts around a loop don't change while it runs.
+        self.values[:] = [UNDEFINED] * len(self.values)
 
     def declare(self, key: str, value: Values, position: Position) -> None:
-        local = self.__getLocal(key)
-        if local is not None:
-            raise CriticalInterpreterError(f"Variable {key} at {position} is already defined at {local[1]}")
-        self.local_values[key] = (value, position)
+        index = self.names.get(key)
+        if index is None:
+            index = self.names[key] = len(self.names)
+        if index >= len(self.values):
+            missing = index + 1 - len(self.values)
+            self.values.extend([UNDEFINED] * missing)
+            self.positions.extend([None] * missing)
+        elif self.values[index] is not UNDEFINED:
+            raise CriticalInterpreterError(f"Variable {key} at {position} is already defined at {self.positions[index]}")
+        self.values[index] = value
+        self.positions[index] = position
+
+    def __atDepth(self, depth: int) -> "Context":
+        context = self
+        for _ in range(depth):
+            context = context.parent  # type: ignore
+        return context
+
+    def __indexOf(self, key: str) -> Optional[int]:
+        index = self.names.get(key)
+        if index is not None and index < len(self.values) and self.values[index] is not UNDEFINED:
+            return index
+        return None
+
+    def __find(self, key: str, position: Position, slot: Optional[Slot]) -> tuple["Context", int]:
+        if slot is not None:
+            context = self.__atDepth(slot[0])
+            if slot[1] < len(context.values) and context.values[slot[1]] is not UNDEFINED:
+                return context, slot[1]
+        index = self.__indexOf(key)
+        if index is not None:
+            return self, index
+        context = self.__resolve(key, position)
+        return context, context.names[key]
 
-    def __isNameInLocalValues(self, name: str) -> bool:
-        return any([name == key for key in self.local_values])
+    def __resolve(self, key: str, position: Position) -> "Context":
+        context = self.resolved.get(key)
+        if context is not None:
+            return context
+        context = self.parent
+        while context is not None:
+            if context.__indexOf(key) is not None:
+                self.resolved[key] = context
+                return context
+            context = context.parent
+        raise CriticalInterpreterError(f"Variable {key} at {position} is not defined")
 
     def __eq__(self, __value: object) -> bool:
         return self.local_values == __value
@@ -69,9 +127,9 @@ class Context:
         return f"Context(parent={self.parent}, local_values={self.local_values})"
 
     def isNameAvailable(self, name: str) -> bool:
-        if name in self.local_values:
-            return False
-        elif self.parent is not None:
-            return self.parent.isNameAvailable(name)
-        else:
-            return True
+        context: Context | None = self
+        while context is not None:
+            if context.__indexOf(name) is not None:
+                return False
+            context = context.parent
+        return True
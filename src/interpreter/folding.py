@@ -0,0 +1,206 @@
+from typing import Callable, List, Optional, Sequence, cast
+from common.errors import InterpreterError
+from interpreter.operations import (
+    ADDITIVE_OPERATIONS,
+    COMPARISON_OPERATIONS,
+    MULTIPLICATIVE_OPERATIONS,
+    logicalAnd,
+    logicalOr,
+    negate,
+)
+from interpreter.visitor import NodeVisitor
+from parser.nodes import (
+    AdditiveExpression,
+    Argument,
+    Assignment,
+    BlockWithoutFunciton,
+    ComparisonExpression,
+    ForEachLoop,
+    FunctionCall,
+    FunctionDefinition,
+    IfStatement,
+    LemonList,
+    Literal,
+    LiteralBool,
+    LiteralFloat,
+    LiteralInt,
+    LiteralString,
+    LiteralSubscriptable,
+    LogicalAndExpression,
+    LogicalOrExpression,
+    MultiplicativeExpression,
+    Node,
+    ObjectConstructor,
+    ObjectMethodCall,
+    PrimaryExpression,
+    ReturnStatement,
+    StatementWithoutFunction,
+    VariableDeclaration,
+    WhileBlock,
+    WhileLoop,
+    WhileOperation,
+)
+
+# Literal node of every type a folded expression can have
+LITERAL_NODES: dict[type, type[Literal]] = {int: LiteralInt, float: LiteralFloat, bool: LiteralBool, str: LiteralString}
+CONSTANTS = (LiteralInt, LiteralFloat, LiteralBool, LiteralString)
+
+# Errors the operators raise on values they don't support, an expression raising them is left for the interpreter
+OPERATION_ERRORS = (TypeError, ArithmeticError, InterpreterError)
+
+
+class ConstantFolder(NodeVisitor):
+    """
+    Optimisation pass run on the parsed statements before the resolver. Operators whose operands are all literals are
+    replaced with a literal of their result, computed with the interpreter's own operations, and branches of if
+    statements whose condition is a literal are dropped when they can't be taken. An operation that fails is kept, so
+    the error is still raised when the statement is executed.
+
+    Every visit returns the node replacing the visited one, or None for a statement that can be removed.
+    """
+
+    def fold(self, statements: Sequence[Node]) -> List[Node]:
+        folded = []
+        for statement in statements:
+            statement = self.visit(statement)
+            if statement is not None:
+                folded.append(statement)
+        return folded
+
+    def genericVisit(self, node: Node) -> Node:
+        return node
+
+    def constant(self, node: Node, compute: Callable) -> Node:
+        try:
+            value = compute()
+        except OPERATION_ERRORS:
+            return node
+        literal = LITERAL_NODES.get(type(value))
+        if literal is None:
+            return node
+        return literal(node.startPosition, value)  # type: ignore
+
+    def foldBinary(self, node, operation: Optional[Callable]) -> Node:
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        if operation is None or not isinstance(node.left, CONSTANTS) or not isinstance(node.right, CONSTANTS):
+            return node
+        compute = operation
+        return self.constant(node, lambda: compute(node.left.value, node.right.value))
+
+    # Statements
+
+    def visitVariableDeclaration(self, node: VariableDeclaration) -> Node:
+        node.assignment = self.visit(node.assignment)
+        return node
+
+    def visitAssignment(self, node: Assignment) -> Node:
+        node.value = self.visit(node.value)
+        return node
+
+    # Expressions
+
+    def visitLogicalOrExpression(self, node: LogicalOrExpression) -> Node:
+        return self.foldBinary(node, logicalOr)
+
+    def visitLogicalAndExpression(self, node: LogicalAndExpression) -> Node:
+        return self.foldBinary(node, logicalAnd)
+
+    def visitComparisonExpression(self, node: ComparisonExpression) -> Node:
+        return self.foldBinary(node, COMPARISON_OPERATIONS.get(node.operator))
+
+    def visitAdditiveExpression(self, node: AdditiveExpression) -> Node:
+        return self.foldBinary(node, ADDITIVE_OPERATIONS.get(node.operator))
+
+    def visitMultiplicativeExpression(self, node: MultiplicativeExpression) -> Node:
+        return self.foldBinary(node, MULTIPLICATIVE_OPERATIONS.get(node.operator))
+
+    def visitPrimaryExpression(self, node: PrimaryExpression) -> Node:
+        node.literal = self.visit(node.literal)
+        if not node.isNegated:
+            return node.literal
+        if not isinstance(node.literal, CONSTANTS):
+            return node
+        return self.constant(node, lambda: negate(node.literal.value))  # type: ignore
+
+    # Literals
+
+    def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> Node:
+        node.subscript = self.visit(node.subscript)
+        return node
+
+    def visitLemonList(self, node: LemonList) -> Node:
+        node.values = [self.visit(value) for value in node.values]
+        return node
+
+    # If
+
+    def visitIfStatement(self, node: IfStatement) -> Optional[Node]:
+        branches = []
+        elseBlock = node.elseBlock
+        for conditionWithBlock in [node.ifCB] + (node.elifCBs or []):
+            condition = conditionWithBlock.condition = self.visit(conditionWithBlock.condition)
+            isConstant = isinstance(condition, CONSTANTS)
+            if isConstant and not condition.value:  # type: ignore
+                continue
+            self.visit(conditionWithBlock.block)
+            branches.append(conditionWithBlock)
+            if isConstant:
+                # This branch is always taken, the ones after it and the else block never are
+                elseBlock = None
+                break
+        if elseBlock is not None:
+            self.visit(elseBlock)
+        if not branches:
+            # The else block runs in the enclosing context, exactly like a nested block
+            return elseBlock
+        node.ifCB, node.elifCBs, node.elseBlock = branches[0], branches[1:], elseBlock
+        return node
+
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> Node:
+        node.statements = cast(List[StatementWithoutFunction], self.fold(node.statements))
+        return node
+
+    # Functions
+
+    def visitArgument(self, node: Argument) -> Node:
+        node.value = self.visit(node.value)
+        return node
+
+    def visitFunctionDefinition(self, node: FunctionDefinition) -> Node:
+        self.visit(node.body)
+        return node
+
+    def visitFunctionCall(self, node: FunctionCall) -> Node:
+        node.arguments = [self.visit(argument) for argument in node.arguments]
+        return node
+
+    def visitReturnStatement(self, node: ReturnStatement) -> Node:
+        node.expression = self.visit(node.expression)
+        return node
+
+    # Loops
+
+    def visitWhileLoop(self, node: WhileLoop) -> Node:
+        node.condition = self.visit(node.condition)
+        self.visit(node.block)
+        return node
+
+    def visitWhileBlock(self, node: WhileBlock) -> Node:
+        node.statements = cast(List[StatementWithoutFunction | WhileOperation], self.fold(node.statements))
+        return node
+
+    def visitForEachLoop(self, node: ForEachLoop) -> Node:
+        node.iterable = self.visit(node.iterable)
+        self.visit(node.block)
+        return node
+
+    # Objects
+
+    def visitObjectConstructor(self, node: ObjectConstructor) -> Node:
+        node.arguments = [self.visit(argument) for argument in node.arguments]
+        return node
+
+    def visitObjectMethodCall(self, node: ObjectMethodCall) -> Node:
+        self.visit(node.functionCall)
+        return node
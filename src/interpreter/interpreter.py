@@ -1,10 +1,30 @@
-from enum import Enum
-from typing import List, Optional, cast
-from typing import Literal as LiteralType
+from enum import IntEnum
+from typing import Callable, Iterator, List, Optional, cast
 from common.errors import CriticalInterpreterError, InterpreterError
 from interpreter.context import Context
-from interpreter.objects import Cuboid, Object, Pyramid, Cone, Cylinder, Tetrahedron, Sphere
+from interpreter.folding import ConstantFolder
+from interpreter.lists import SolidList, TypedList, isList, makeList
+from interpreter.memo import MEMO_RESULT_TYPES, MISSING, MemoCache, PurityAnalyzer, memoKey
+from interpreter.resolver import Resolver
+from interpreter.objects import Object
+from interpreter.operations import (
+    ADDITIVE_OPERATIONS,
+    COMPARISON_OPERATIONS,
+    MULTIPLICATIVE_OPERATIONS,
+    OBJECT_CLASSES,
+    bindArguments,
+    callMethod,
+    expectNumberOfArguments,
+    expectSingleArgument,
+    isNumber,
+    listType,
+    logicalAnd,
+    logicalOr,
+    negate,
+    subscript,
+)
 from interpreter.types import Values
+from interpreter.visitor import NodeVisitor
 from parser.nodes import (
     AdditiveExpression,
     Argument,
@@ -29,9 +49,9 @@ from parser.nodes import (
     ObjectConstructor,
     ObjectMethodCall,
     ObjectProperty,
-    ObjectType,
     PrimaryExpression,
     ReturnStatement,
+    Scope,
     VariableDeclaration,
     WhileBlock,
     WhileLoop,
@@ -41,31 +61,42 @@ from parser.nodes import (
 from parser.parser import Parser
 
 
-class LoopOperation(Enum):
-    CONTINUE = 1
-    BREAK = 2
-
-
-class NodeVisitor(object):
-    def visit(self, node: Node):
-        method_name = "visit" + type(node).__name__
-        visitor = getattr(self, method_name, self.genericVisit)
-        return visitor(node)
+class Completion(IntEnum):
+    """
+    How the last statement ended. Any completion but NORMAL skips the rest of every block up to the loop it breaks or
+    continues, or up to the function it returns from. Only NORMAL is false, so a block checks it with a single test.
+    """
 
-    def genericVisit(self, node):
-        raise Exception(f"No visit{type(node).__name__} method")
+    NORMAL = 0
+    BREAK = 1
+    CONTINUE = 2
+    RETURN = 3
 
 
 class Interpreter(NodeVisitor):
+    literalNodes = frozenset({LiteralFloat, LiteralInt, LiteralBool, LiteralString})
+
     def __init__(self, parser: Parser) -> None:
         self.parser = parser
         self.context = Context()
-
-    def interpret(self):
-        nodes = self.parser.parse()
+        self.globalContext = self.context
+        self.completion = Completion.NORMAL
+        # Value of the return statement that ended the running function, until the call takes it
+        self.returnValue: Optional[Values] = None
+        self.resolver = Resolver(self.context.names)
+        # id of the function definition -> (function definition, memo of its results or None when it isn't pure)
+        self.memos: dict[int, tuple[FunctionDefinition, Optional[MemoCache]]] = {}
+
+    def interpret(self, streaming: bool = False):
+        if streaming:
+            nodes: Iterator[Node] | List[Node] = self.streamStatements()
+        else:
+            nodes = ConstantFolder().fold(self.parser.parse())
+            self.resolver.resolve(nodes)
+        globalContext = self.context
         for node in nodes:
             try:
-                self.visit(node)
+                self.execute(node)
             except TypeError as e:
                 print(f"TypeError: {e}")
                 return
@@ -74,6 +105,23 @@ class Interpreter(NodeVisitor):
                 return
             except InterpreterError as e:
                 print(e)
+                self.context = globalContext
+            # A return outside of a function only ends the top-level statement it is in
+            self.takeReturnValue()
+
+    def streamStatements(self) -> Iterator[Node]:
+        # Top-level statements parsed, folded and resolved only when the previous one has been executed, so nothing
+        # but the running statement and the defined functions is kept. The resolver handles statements in order
+        # anyway, so their slots are the same as when the whole program is resolved at once.
+        folder = ConstantFolder()
+        for node in self.parser.parseStatements():
+            folded = folder.visit(node)
+            if folded is not None:
+                self.resolver.resolve([folded])
+                yield folded
+
+    def execute(self, node: Node) -> None:
+        self.visit(node)
 
     def visitVariableDeclaration(self, node: VariableDeclaration) -> None:
         variableName = node.assignment.name
@@ -87,96 +135,48 @@ class Interpreter(NodeVisitor):
         variableName = node.name
         value = node.value
         if type(variableName) == str:
-            self.context.set(variableName, self.visit(value), node.position)
+            self.context.set(variableName, self.visit(value), node.position, node.slot)
         elif isinstance(variableName, ObjectProperty):
             self.context.setObjectProperty(
-                variableName.identifier, variableName.property, self.visit(value), node.position
+                variableName.identifier, variableName.property, self.visit(value), node.position, node.slot
             )
         else:
             raise InterpreterError("Assignment's name has to be an identifier, not object property", node)
 
     def visitLogicalOrExpression(self, node: LogicalOrExpression) -> bool:
-        left: int | float | str | bool = self.visit(node.left)
-        right: int | float | str | bool = self.visit(node.right)
-
-        if type(left) == bool and type(right) == bool:
-            return left or right
-        else:
-            raise TypeError(f"Logical and operator requires two boolean values, not {type(left)} and {type(right)}")
+        return logicalOr(self.visit(node.left), self.visit(node.right))
 
     def visitLogicalAndExpression(self, node: LogicalAndExpression) -> bool:
-        left: int | float | str | bool = self.visit(node.left)
-        right: int | float | str | bool = self.visit(node.right)
-
-        if type(left) == bool and type(right) == bool:
-            return left and right
-        else:
-            raise TypeError(f"Logical and operator requires two boolean values, not {type(left)} and {type(right)}")
+        return logicalAnd(self.visit(node.left), self.visit(node.right))
 
     def visitComparisonExpression(self, node: ComparisonExpression) -> bool:
-        left: int | float | str | bool = self.visit(node.left)
-        right: int | float | str | bool = self.visit(node.right)
-        if node.operator == "==":
-            return left == right
-        elif node.operator == "!=":
-            return left != right
-
-        if (type(left) == int or type(left) == float) and (type(right) == int or type(right) == float):
-            if node.operator == "<":
-                return left < right
-            elif node.operator == "<=":
-                return left <= right
-            elif node.operator == ">":
-                return left > right
-            elif node.operator == ">=":
-                return left >= right
-            else:
-                raise InterpreterError(f"Operator {node.operator} is not supported", node)
-        else:
-            raise TypeError(f"Unsupported operand type(s) for {node.operator}: '{type(left)}' and '{type(right)}'")
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operation = COMPARISON_OPERATIONS.get(node.operator)
+        if operation is None:
+            raise InterpreterError(f"Operator {node.operator} is not supported", node)
+        return operation(left, right)
 
     def visitAdditiveExpression(self, node: AdditiveExpression) -> int | float | str:
-        left: int | float | str | bool = self.visit(node.left)
-        right: int | float | str | bool = self.visit(node.right)
-
-        if node.operator == "+":
-            if type(left) == str and type(right) == str:
-                return left + right
-            elif (type(left) == int or type(left) == float) and (type(right) == int or type(right) == float):
-                return left + right
-            else:
-                raise TypeError(f"Unsupported operand type(s) for {node.operator}: '{type(left)}' and '{type(right)}'")
-        elif node.operator == "-":
-            if (type(left) == int or type(left) == float) and (type(right) == int or type(right) == float):
-                return left + right
-            else:
-                raise TypeError(f"Unsupported operand type(s) for {node.operator}: '{type(left)}' and '{type(right)}'")
-        else:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operation = ADDITIVE_OPERATIONS.get(node.operator)
+        if operation is None:
             raise InterpreterError(f"Operator {node.operator} is not supported", node)
+        return operation(left, right)
 
     def visitMultiplicativeExpression(self, node: MultiplicativeExpression) -> int | float:
-        left: int | float | str | bool = self.visit(node.left)
-        right: int | float | str | bool = self.visit(node.right)
-
-        if (type(left) == int or type(left) == float) and (type(right) == int or type(right) == float):
-            if node.operator == "*":
-                return left * right
-            elif node.operator == "/":
-                return left / right
-            else:
-                raise InterpreterError(f"Operator {node.operator} is not supported", node)
-        else:
-            raise TypeError(f"Unsupported operand type(s) for {node.operator}: '{type(left)}' and '{type(right)}'")
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        operation = MULTIPLICATIVE_OPERATIONS.get(node.operator)
+        if operation is None:
+            raise InterpreterError(f"Operator {node.operator} is not supported", node)
+        return operation(left, right)
 
     def visitPrimaryExpression(self, node: PrimaryExpression):
         literalValue = self.visit(node.literal)
         if node.isNegated:
-            if type(literalValue) == int or type(literalValue) == float:
-                return -literalValue
-            elif type(literalValue) == bool:
-                return not literalValue
-            else:
-                raise TypeError(f"Unsupported type for negation: '{type(literalValue)}'")
+            return negate(literalValue)
         else:
             return literalValue
 
@@ -195,59 +195,47 @@ class Interpreter(NodeVisitor):
         return node.value
 
     def visitLiteralIdentifier(self, node: LiteralIdentifier) -> Values:
-        return self.context.get(node.value, node.startPosition)
+        return self.context.get(node.value, node.startPosition, node.slot)
 
     def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> int | float | bool | str:
-        subscriptable = self.context.get(node.value, node.startPosition)
-        index = self.visit(node.subscript)
-        if type(index) != int:
-            raise TypeError(f"String indices must be integers, not {type(index)}")
-        if type(subscriptable) == str or type(subscriptable) == list:
-            subscriptable = cast(str | list, subscriptable)
-            if index >= len(subscriptable):
-                raise InterpreterError(f"Index {index} is out of range")
-            return subscriptable[index]
-        else:
-            raise TypeError(f"Type {type(subscriptable)} is not subscriptable")
+        subscriptable = self.context.get(node.value, node.startPosition, node.slot)
+        return cast(int | float | bool | str, subscript(subscriptable, self.visit(node.subscript)))
 
-    def visitLemonList(self, node: LemonList) -> List[int] | List[float] | List[bool] | List[str] | List[Object] | List:
+    def visitLemonList(self, node: LemonList) -> List[str] | List[Object] | List | TypedList | SolidList:
         if len(node.values) == 0:
             return []
         firstValue = self.visit(node.values[0])
-        if isinstance(firstValue, Object):
-            listType = Object
-        else:
-            listType = type(firstValue)
+        valuesType = listType(firstValue)
         list = [firstValue]
         for expression in node.values[1:]:
             value = self.visit(expression)
-            if not isinstance(value, listType):
+            if not isinstance(value, valuesType):
                 raise InterpreterError("List cannot contain multiple types", node)
             else:
                 list.append(value)
-        return cast(List[int] | List[float] | List[bool] | List[str], list)
+        return makeList(list)
 
     # If
 
-    def visitIfStatement(self, node: IfStatement) -> Optional[Values]:
+    def visitIfStatement(self, node: IfStatement) -> None:
         conditionsWithBlocks = [node.ifCB] + (node.elifCBs or [])
         for conditionWithBlock in conditionsWithBlocks:
             if self.visit(conditionWithBlock.condition):
-                self.nextContext()
-                returnValue = self.visit(conditionWithBlock.block)
+                self.nextContext(conditionWithBlock.block.scope)
+                for statement in conditionWithBlock.block.statements:
+                    self.visit(statement)
+                    if self.completion:
+                        break
                 self.previousContext()
-                return returnValue
+                return
         if node.elseBlock:
-            return self.visit(node.elseBlock)
-        return None
+            self.visit(node.elseBlock)
 
-    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton):
-        returnValue = None
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> None:
         for statement in node.statements:
-            returnValue = self.visit(statement)
-            if returnValue is not None:
-                break
-        return returnValue
+            self.visit(statement)
+            if self.completion:
+                return
 
     # Functions
 
@@ -263,223 +251,179 @@ class Interpreter(NodeVisitor):
         self.context.declare(functionName, node, node.position)
 
     def visitFunctionCall(self, node: FunctionCall) -> Optional[Values]:
-        result = self.visitPrint(node)
-        if result:
-            return None
-        result = self.visitString(node) or self.visitInt(node) or self.visitFloat(node)
-        if result is not None:
-            return result
-        function = self.context.get(node.name, node.startPosition)
-        if type(function) != FunctionDefinition:
-            raise TypeError(f"Type {type(function)} is not callable")
-        function = cast(FunctionDefinition, function)
-        self.nextContext()
-        self.expectNumberOfArguments(node.arguments, len(function.parameters), node, False)
-        for parameter in function.parameters:
-            argument = self.getArgumentValue(node, parameter)
+        if node.builtin is not None:
+            return self.callBuiltin(node, *node.builtin)
+        function, indices = self.bindFunction(node)
+        arguments = []
+        for parameter, index in zip(function.parameters, indices):
+            if index is None:
+                raise InterpreterError(f"Function {node.name} requires {parameter} argument", node)
+            arguments.append(self.visit(node.arguments[index].value))
+        return self.callFunction(function, node, arguments)
+
+    def callBuiltin(self, node: FunctionCall, argumentName: str, builtin: Callable) -> Optional[Values]:
+        expectSingleArgument(node.name, argumentName, node.arguments)
+        return builtin(self.visit(node.arguments[0].value))
+
+    def bindFunction(self, node: FunctionCall) -> tuple[FunctionDefinition, tuple[Optional[int], ...]]:
+        # The function is checked and the call site's arguments are bound to its parameters once, until the call
+        # site's name refers to another function
+        function = self.context.get(node.name, node.startPosition, node.slot)
+        if node.binding is None or node.binding[0] is not function:
+            if type(function) != FunctionDefinition:
+                raise TypeError(f"Type {type(function)} is not callable")
+            function = cast(FunctionDefinition, function)
+            expectNumberOfArguments(node.arguments, len(function.parameters), node, False)
+            node.binding = (function, bindArguments(node.arguments, function.parameters))
+        return node.binding
+
+    def callFunction(self, function: FunctionDefinition, node: FunctionCall, arguments: list[Values]) -> Optional[Values]:
+        memo = self.getMemo(function)
+        key = memoKey(arguments) if memo is not None and self.resolvesCallees(memo, node) else None
+        if key is not None:
+            result = memo.get(key)  # type: ignore
+            if result is not MISSING:
+                return cast(Values, result)
+        self.nextContext(function.scope)
+        for parameter, argument in zip(function.parameters, arguments):
             self.context.declare(parameter, argument, node.startPosition)
-        result = self.visit(function.body)
-        result = cast(Values | None, result)
+        self.executeBody(function)
         self.previousContext()
+        result = self.takeReturnValue()
+        if key is not None and type(result) in MEMO_RESULT_TYPES:
+            memo.put(key, result)  # type: ignore
         return result
 
-    def visitReturnStatement(self, node: ReturnStatement) -> Optional[Values]:
-        return self.visit(node.expression)
-
-    def getArgumentValue(self, node: FunctionCall, name: str) -> Values:
-        value = next((argument.value for argument in node.arguments if argument.name == name), None)
-        if value is None:
-            raise InterpreterError(f"Function {node.name} requires {name} argument", node)
-        return self.visit(value)
-
-    def visitPrint(self, node: FunctionCall) -> bool:
-        if node.name != "print":
-            return False
-        if len(node.arguments) != 1:
-            raise TypeError(f"print() takes 1 positional argument but {len(node.arguments)} were given")
-        if node.arguments[0].name != "out":
-            raise TypeError(f'print() requires "out" argument but "{node.arguments[0].name}" was given')
-        printable = self.visit(node.arguments[0].value)
-        print(printable)
-        return True
-
-    def visitString(self, node: FunctionCall):
-        if node.name != "string":
+    def getMemo(self, function: FunctionDefinition) -> Optional[MemoCache]:
+        memo = self.memos.get(id(function))
+        if memo is None or memo[0] is not function:
+            callees = PurityAnalyzer(self.findFunction).findCallees(function)
+            memo = (function, MemoCache(callees=tuple(callees.items())) if callees is not None else None)
+            self.memos[id(function)] = memo
+        return memo[1]
+
+    def resolvesCallees(self, memo: MemoCache, node: FunctionCall) -> bool:
+        # A caller's variable hiding a function the pure function calls would change its result
+        return all(self.context.get(name, node.startPosition) is callee for name, callee in memo.callees)
+
+    def findFunction(self, name: str) -> Optional[FunctionDefinition]:
+        index = self.globalContext.names.get(name)
+        if index is None or index >= len(self.globalContext.values):
             return None
-        if len(node.arguments) != 1:
-            raise TypeError(f"string() takes 1 positional argument but {len(node.arguments)} were given")
-        if node.arguments[0].name != "value":
-            raise TypeError(f'string() requires "value" argument but "{node.arguments[0].name}" was given')
-        value = self.visit(node.arguments[0].value)
-        if type(value) != int and type(value) != float:
-            raise TypeError(f"Type {type(value)} is not convertible to string. Only int and float are supported")
-        return str(self.visit(node.arguments[0].value))
-
-    def visitInt(self, node: FunctionCall):
-        if node.name != "int":
-            return None
-        if len(node.arguments) != 1:
-            raise TypeError(f"int() takes 1 positional argument but {len(node.arguments)} were given")
-        if node.arguments[0].name != "value":
-            raise TypeError(f'int() requires "value" argument but "{node.arguments[0].name}" was given')
-        value = self.visit(node.arguments[0].value)
-        if type(value) != str and type(value) != float:
-            raise TypeError(f"Type {type(value)} is not convertible to int. Only string and float is supported")
-        try:
-            return int(value)
-        except ValueError:
-            raise TypeError(f"Variable {type(value)} is not a valid number")
-
-    def visitFloat(self, node: FunctionCall):
-        if node.name != "float":
-            return None
-        if len(node.arguments) != 1:
-            raise TypeError(f"float() takes 1 positional argument but {len(node.arguments)} were given")
-        if node.arguments[0].name != "value":
-            raise TypeError(f'float() requires "value" argument but "{node.arguments[0].name}" was given')
-        value = self.visit(node.arguments[0].value)
-        if type(value) != str and type(value) != int:
-            raise TypeError(f"Type {type(value)} is not convertible to float. Only string and int is supported")
-        try:
-            return float(value)
-        except ValueError:
-            raise TypeError(f"Variable {type(value)} is not a valid number")
+        function = self.globalContext.values[index]
+        return function if type(function) == FunctionDefinition else None
+
+    def memoStatistics(self) -> dict[str, tuple[int, int]]:
+        # Name of every pure function called so far -> (hits, misses) of its memo
+        return {function.name: (memo.hits, memo.misses) for function, memo in self.memos.values() if memo is not None}
+
+    def executeBody(self, function: FunctionDefinition) -> None:
+        self.visit(function.body)
+
+    def takeReturnValue(self) -> Optional[Values]:
+        # Ends the return that completed a function's body, a body that ran out of statements returns None
+        returnValue = self.returnValue
+        self.returnValue = None
+        self.completion = Completion.NORMAL
+        return returnValue
+
+    def visitReturnStatement(self, node: ReturnStatement) -> None:
+        self.returnValue = self.visit(node.expression)
+        self.completion = Completion.RETURN
 
     # Loops
 
-    def visitWhileLoop(self, node: WhileLoop) -> Optional[Values]:
-        returnValue = None
+    def visitWhileLoop(self, node: WhileLoop) -> None:
+        # The block's statements run directly, one dispatch per iteration less
+        statements, scope = node.block.statements, node.block.scope
+        frame = None
         while self.visit(node.condition):
-            self.nextContext()
-            returnValue = self.visit(node.block)
-            if returnValue is not None:
-                if returnValue == LoopOperation.BREAK:
-                    returnValue = None
-                elif returnValue == LoopOperation.CONTINUE:
-                    self.previousContext()
-                    continue
-                self.previousContext()
-                break
+            frame = self.enterLoopFrame(frame, scope)
+            for statement in statements:
+                self.visit(statement)
+                if self.completion:
+                    break
             self.previousContext()
-        return returnValue
-
-    def visitWhileBlock(self, node: WhileBlock) -> Optional[Values]:
-        returnValue = None
+            completion = self.completion
+            if completion:
+                # A break or continue ends with the iteration, a return also ends the function the loop is in
+                if completion is not Completion.RETURN:
+                    self.completion = Completion.NORMAL
+                if completion is not Completion.CONTINUE:
+                    return
+
+    def visitWhileBlock(self, node: WhileBlock) -> None:
         for statement in node.statements:
-            returnValue = self.visit(statement)
-            if returnValue is not None:
-                break
-        return returnValue
+            self.visit(statement)
+            if self.completion:
+                return
 
-    def visitForEachLoop(self, node: ForEachLoop) -> Optional[Values]:
-        returnValue = None
+    def visitForEachLoop(self, node: ForEachLoop) -> None:
         iterable = self.visit(node.iterable)
-        if type(iterable) != list:
+        if not isList(iterable):
             raise TypeError(f"Type {type(iterable)} is not iterable")
+        statements, scope = node.block.statements, node.block.scope
+        identifier, position = node.identifier, node.startPosition
+        frame = None
         for element in iterable:
-            self.nextContext()
-            self.context.declare(node.identifier, element, node.startPosition)
-            returnValue = self.visit(node.block)
-            if returnValue is not None:
-                if returnValue == LoopOperation.BREAK:
-                    returnValue = None
-                elif returnValue == LoopOperation.CONTINUE:
-                    self.previousContext()
-                    continue
-                self.previousContext()
-                break
+            frame = self.enterLoopFrame(frame, scope)
+            self.context.declare(identifier, element, position)
+            for statement in statements:
+                self.visit(statement)
+                if self.completion:
+                    break
             self.previousContext()
-        return returnValue
+            completion = self.completion
+            if completion:
+                if completion is not Completion.RETURN:
+                    self.completion = Completion.NORMAL
+                if completion is not Completion.CONTINUE:
+                    return
+
+    def enterLoopFrame(self, frame: Optional[Context], scope: Optional[Scope]) -> Context:
+        # Every iteration of one execution of a loop runs in the same frame, emptied before the iteration starts, so the
+        # variables declared in the body are still fresh in each iteration
+        if frame is None:
+            self.nextContext(scope)
+        else:
+            frame.reset()
+            self.context = frame
+        return self.context
 
-    def visitBreak(self, _: Break) -> LiteralType[LoopOperation.BREAK]:
-        return LoopOperation.BREAK
+    def visitBreak(self, _: Break) -> None:
+        self.completion = Completion.BREAK
 
-    def visitContinue(self, _: Continue) -> LiteralType[LoopOperation.CONTINUE]:
-        return LoopOperation.CONTINUE
+    def visitContinue(self, _: Continue) -> None:
+        self.completion = Completion.CONTINUE
 
     # Objects
 
     def visitObjectConstructor(self, node: ObjectConstructor) -> Object:
-        if node.objectType == ObjectType.CUBOID:
-            self.expectNumberOfArguments(node.arguments, 3, node)
-            width = self.getObjectArgumentValue(node, "width")
-            length = self.getObjectArgumentValue(node, "length")
-            height = self.getObjectArgumentValue(node, "height")
-            return Cuboid(width=width, length=length, height=height)
-        elif node.objectType == ObjectType.PYRAMID:
-            self.expectNumberOfArguments(node.arguments, 3, node)
-            width = self.getObjectArgumentValue(node, "width")
-            length = self.getObjectArgumentValue(node, "length")
-            height = self.getObjectArgumentValue(node, "height")
-            return Pyramid(width=width, length=length, height=height)
-        elif node.objectType == ObjectType.SPHERE:
-            self.expectNumberOfArguments(node.arguments, 1, node)
-            radius = self.getObjectArgumentValue(node, "radius")
-            return Sphere(radius=radius)
-        elif node.objectType == ObjectType.CONE:
-            self.expectNumberOfArguments(node.arguments, 2, node)
-            radius = self.getObjectArgumentValue(node, "radius")
-            height = self.getObjectArgumentValue(node, "height")
-            return Cone(radius=radius, height=height)
-        elif node.objectType == ObjectType.CYLINDER:
-            self.expectNumberOfArguments(node.arguments, 2, node)
-            radius = self.getObjectArgumentValue(node, "radius")
-            height = self.getObjectArgumentValue(node, "height")
-            return Cylinder(radius=radius, height=height)
-        elif node.objectType == ObjectType.TETRAHEDRON:
-            self.expectNumberOfArguments(node.arguments, 1, node)
-            edge = self.getObjectArgumentValue(node, "edge")
-            return Tetrahedron(edge=edge)
-        else:
+        objectClass = OBJECT_CLASSES.get(node.objectType.value)
+        if objectClass is None:
             raise InterpreterError(f"Object type {node.objectType} is not supported", node)
+        objectType, parameters = objectClass
+        expectNumberOfArguments(node.arguments, len(parameters), node)
+        return objectType(*[self.getObjectArgumentValue(node, parameter) for parameter in parameters])
 
-    def expectNumberOfArguments(
-        self,
-        arguments: list[Argument],
-        expected: int,
-        node: ObjectConstructor | FunctionCall,
-        isConstructor: bool = True,
-    ) -> None:
-        if len(arguments) != expected:
-            callableType = "Constructor" if isConstructor else "Function"
-            if type(node) == FunctionCall:
-                raise InterpreterError(
-                    f"{callableType} {node.name} takes {expected} arguments, {len(arguments)} were given", node
-                )
-            elif type(node) == ObjectConstructor:
-                raise InterpreterError(
-                    f"{callableType} {node.objectType} takes {expected} arguments, {len(arguments)} were given", node
-                )
-
-    def getObjectArgumentValue(
-        self, node: ObjectConstructor, name: LiteralType["width", "length", "height", "radius", "edge"]  # noqa: F821
-    ) -> int | float:
+    def getObjectArgumentValue(self, node: ObjectConstructor, name: str) -> int | float:
         value = next((argument.value for argument in node.arguments if argument.name == name), None)
         if value is None:
             raise InterpreterError(f"{node.objectType} constructor requires {name} argument", node)
         expressionValue = self.visit(value)
-        if type(expressionValue) != int and type(expressionValue) != float:
+        if not isNumber(expressionValue):
             raise InterpreterError(f"{node.objectType} constructor requires {name} argument to be a number", node)
         return expressionValue
 
     def visitObjectMethodCall(self, node: ObjectMethodCall) -> Optional[Values]:
         objectName = node.identifier
-        object = self.context.get(objectName, node.startPosition)
-        if not isinstance(object, Object):
-            raise InterpreterError(f"{objectName} is not an object", node)
-        object = cast(Object, object)
-        methodName = node.functionCall.name
-        method = getattr(object, methodName, None)
-        if method is None:
-            raise InterpreterError(f"{objectName} object has no method {methodName}", node)
-        if len(node.functionCall.arguments) != 0:
-            raise InterpreterError(f"{methodName} method takes no arguments", node)
-        return method()
+        object = self.context.get(objectName, node.startPosition, node.slot)
+        return callMethod(object, objectName, node.functionCall.name, len(node.functionCall.arguments), node)
 
     # Context
 
-    def nextContext(self) -> None:
-        self.context = Context(self.context)
+    def nextContext(self, scope: Optional[Scope] = None) -> None:
+        self.context = Context(self.context, scope) if scope is not None else Context(self.context)
 
     def previousContext(self) -> None:
         if self.context.parent is None:
@@ -0,0 +1,147 @@
+import importlib
+from array import array
+from operator import attrgetter
+from types import ModuleType
+from typing import Iterator, Optional
+from interpreter.objects import Object
+
+# NumPy is optional, solid lists compute their quantities without it too
+numpy: Optional[ModuleType]
+try:
+    numpy = importlib.import_module("numpy")
+except ImportError:
+    numpy = None
+
+# Array type code of every element type whose lists are stored compactly
+TYPECODES: dict[type, str] = {int: "q", float: "d", bool: "b"}
+
+
+class TypedList:
+    """
+    List of ints, floats or bools stored in an array.array, a machine value per element instead of a pointer to a
+    Python object. It's read like the list it replaces: subscripted, iterated, printed and compared.
+    """
+
+    __slots__ = ("elementType", "values")
+
+    def __init__(self, elementType: type, values: array) -> None:
+        self.elementType = elementType
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> int | float | bool:
+        if self.elementType is bool:
+            return bool(self.values[index])
+        return self.values[index]
+
+    def __iter__(self) -> Iterator:
+        if self.elementType is bool:
+            return map(bool, self.values)
+        return iter(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == TypedList:
+            return self.values == other.values  # type: ignore
+        if type(other) == list:
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class SolidList:
+    """
+    List of solids of a single type. Its methods compute a quantity of every solid in one call: the dimensions are
+    gathered into one column per constructor parameter and the solid's formula runs over whole columns, with NumPy when
+    it's installed and all the dimensions are floats, otherwise with a single map over the columns.
+
+    Solids in a list are shared with the variables they came from, so the columns are gathered when a method is called
+    and a solid changed through another variable is computed with its current dimensions.
+    """
+
+    __slots__ = ("elementType", "values")
+
+    # Language method -> formula of the solid type computing it
+    METHODS: dict[str, str] = {"getVolume": "volume", "getSurfaceArea": "surfaceArea", "getBaseArea": "baseArea"}
+
+    def __init__(self, elementType: type[Object], values: list) -> None:
+        self.elementType = elementType
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Object:
+        return self.values[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) == SolidList:
+            return self.values == other.values  # type: ignore
+        if type(other) == list:
+            return self.values == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self.values)
+
+    def getMethod(self, methodName: str) -> Optional[str]:
+        # Name of the formula behind the method, None when the solids don't have it
+        formula = self.METHODS.get(methodName)
+        if formula is None or not hasattr(self.elementType, formula):
+            return None
+        return formula
+
+    def compute(self, formula: str) -> "list | TypedList | SolidList":
+        compute = getattr(self.elementType, formula)
+        dimensions = self.elementType.dimensions
+        if len(dimensions) == 1:
+            columns = [list(map(attrgetter(dimensions[0]), self.values))]
+        else:
+            columns = [list(column) for column in zip(*map(attrgetter(*dimensions), self.values))]
+        if numpy is not None and all(set(map(type, column)) == {float} for column in columns):
+            results = compute(*(numpy.array(column, dtype=numpy.float64) for column in columns), sqrt=numpy.sqrt)
+            return TypedList(float, array("d", results.tobytes()))
+        return makeList(list(map(compute, *columns)))
+
+
+def makeList(values: list) -> list | TypedList | SolidList:
+    # Values of a list literal, stored compactly when all of them are ints, floats or bools of the same type, and
+    # as a SolidList when all of them are solids of the same type
+    if not values:
+        return values
+    elementType = type(values[0])
+    if issubclass(elementType, Object):
+        if any(type(value) is not elementType for value in values):
+            return values
+        return SolidList(elementType, values)
+    typecode = TYPECODES.get(elementType)
+    if typecode is None or any(type(value) is not elementType for value in values):
+        return values
+    try:
+        return TypedList(elementType, array(typecode, values))
+    except OverflowError:
+        return values
+
+
+LIST_TYPES = (list, TypedList, SolidList)
+
+
+def isList(value) -> bool:
+    return type(value) in LIST_TYPES
+
+
+def valueType(value) -> type:
+    # Type of the value as seen by the language, compact lists are lists too
+    if type(value) in LIST_TYPES:
+        return list
+    return type(value)
@@ -0,0 +1,234 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Sequence
+from interpreter.visitor import NodeVisitor
+from parser.nodes import (
+    Argument,
+    Assignment,
+    BlockWithoutFunciton,
+    Break,
+    Continue,
+    ForEachLoop,
+    FunctionCall,
+    FunctionDefinition,
+    IfStatement,
+    LemonList,
+    LiteralIdentifier,
+    LiteralSubscriptable,
+    ObjectConstructor,
+    ObjectMethodCall,
+    PrimaryExpression,
+    ReturnStatement,
+    VariableDeclaration,
+    WhileBlock,
+    WhileLoop,
+)
+
+# Number of results remembered for every pure function
+MEMO_SIZE = 256
+
+# Builtins with side effects, a function calling them isn't pure
+IMPURE_BUILTINS = frozenset({"print"})
+# Object methods that only compute a value from the object's dimensions
+PURE_METHODS = frozenset({"getVolume", "getSurfaceArea", "getBaseArea"})
+# Immutable results a memo can return to every caller
+MEMO_RESULT_TYPES = frozenset({int, float, bool, str, type(None)})
+
+MISSING = object()
+
+
+def memoKey(arguments: list) -> Optional[tuple]:
+    # Key of the arguments' values, None when one of them is mutable. Values are paired with their types, so 1, 1.0
+    # and true are different keys, and floats are keyed by their exact bits, so 0.0 and -0.0 are too.
+    key: list[Hashable] = []
+    for value in arguments:
+        valueType = type(value)
+        if valueType is float:
+            key.append(value.hex())
+        elif valueType is int or valueType is bool or valueType is str:
+            key.append((valueType, value))
+        else:
+            return None
+    return tuple(key)
+
+
+class MemoCache:
+    """Least recently used results of a pure function by the key of their arguments"""
+
+    def __init__(self, maxSize: int = MEMO_SIZE, callees: Sequence[tuple[str, FunctionDefinition]] = ()) -> None:
+        self.results: OrderedDict[tuple, object] = OrderedDict()
+        self.maxSize = maxSize
+        # Functions the pure function calls by their names, its results only hold while the names refer to them
+        self.callees = tuple(callees)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> object:
+        result = self.results.get(key, MISSING)
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+        return result
+
+    def put(self, key: tuple, result: object) -> None:
+        self.results[key] = result
+        if len(self.results) > self.maxSize:
+            self.results.popitem(last=False)
+
+
+class PurityAnalyzer(NodeVisitor):
+    """
+    Decides whether a function's result depends only on its arguments. A pure function doesn't print, doesn't assign
+    object properties, only reads and writes variables it declares itself and only calls pure functions.
+
+    A variable counts as the function's own only where it's declared on every path reaching the access. A slot that
+    is still undeclared when it's read falls back to the name, which can find the caller's variable, so a variable
+    declared only in an else block, or in a block that has already ended, is an outer one.
+
+    Functions can only be defined in the global context, so a called function is looked up there by name. Recursive
+    calls are assumed pure while the function is being checked. Scoping is dynamic though, so a caller's variable can
+    hide a function under its name. Calling a name that any of the checked functions declares makes a function impure,
+    and the callees are returned, so the interpreter can check the caller's context still resolves their names to them.
+    """
+
+    def __init__(self, findFunction: Callable[[str], Optional[FunctionDefinition]]) -> None:
+        self.findFunction = findFunction
+        self.checked: set[int] = set()
+        # Names declared on every path so far, one set per context of the checked function
+        self.declared: list[set[str]] = []
+        # Names declared anywhere in the checked functions and the functions called by their names
+        self.names: set[str] = set()
+        self.callees: dict[str, FunctionDefinition] = {}
+
+    def findCallees(self, function: FunctionDefinition) -> Optional[dict[str, FunctionDefinition]]:
+        # Functions a pure function calls directly or through other functions by their names, None when it isn't pure
+        if not self.isPure(function) or not self.names.isdisjoint(self.callees):
+            return None
+        return self.callees
+
+    def isPure(self, function: FunctionDefinition) -> bool:
+        if id(function) in self.checked:
+            return True
+        self.checked.add(id(function))
+        self.names.update(function.parameters)
+        callerDeclared = self.declared
+        self.declared = [set(function.parameters)]
+        isPure = self.visit(function.body)
+        self.declared = callerDeclared
+        return isPure
+
+    def isDeclared(self, name: str) -> bool:
+        return any(name in names for names in self.declared)
+
+    def visitInContext(self, node, names: set[str]) -> bool:
+        # Declarations of a context that ends after the node don't outlive it
+        self.declared.append(names)
+        isPure = self.visit(node)
+        self.declared.pop()
+        return isPure
+
+    def genericVisit(self, node) -> bool:
+        return False
+
+    def visitAll(self, nodes: list) -> bool:
+        return all(self.visit(node) for node in nodes)
+
+    # Statements
+
+    def visitVariableDeclaration(self, node: VariableDeclaration) -> bool:
+        if type(node.assignment.name) != str or not self.visit(node.assignment.value):
+            return False
+        self.declared[-1].add(node.assignment.name)
+        self.names.add(node.assignment.name)
+        return True
+
+    def visitAssignment(self, node: Assignment) -> bool:
+        return type(node.name) == str and self.isDeclared(node.name) and self.visit(node.value)
+
+    # Expressions
+
+    def visitBinary(self, node) -> bool:
+        return self.visit(node.left) and self.visit(node.right)
+
+    visitLogicalOrExpression = visitLogicalAndExpression = visitBinary
+    visitComparisonExpression = visitAdditiveExpression = visitMultiplicativeExpression = visitBinary
+
+    def visitPrimaryExpression(self, node: PrimaryExpression) -> bool:
+        return self.visit(node.literal)
+
+    # Literals
+
+    def visitLiteral(self, node) -> bool:
+        return True
+
+    visitLiteralFloat = visitLiteralInt = visitLiteralBool = visitLiteralString = visitLiteral
+
+    def visitLiteralIdentifier(self, node: LiteralIdentifier) -> bool:
+        return self.isDeclared(node.value)
+
+    def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> bool:
+        return self.isDeclared(node.value) and self.visit(node.subscript)
+
+    def visitLemonList(self, node: LemonList) -> bool:
+        return self.visitAll(node.values)
+
+    # If
+
+    def visitIfStatement(self, node: IfStatement) -> bool:
+        for conditionWithBlock in [node.ifCB] + (node.elifCBs or []):
+            if not (self.visit(conditionWithBlock.condition) and self.visitInContext(conditionWithBlock.block, set())):
+                return False
+        if node.elseBlock is None:
+            return True
+        # The else block runs in the enclosing context, but only on some paths, so its declarations are dropped after it
+        declared = set(self.declared[-1])
+        isPure = self.visit(node.elseBlock)
+        self.declared[-1] = declared
+        return isPure
+
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> bool:
+        return self.visitAll(node.statements)
+
+    # Functions
+
+    def visitArgument(self, node: Argument) -> bool:
+        return self.visit(node.value)
+
+    def visitFunctionCall(self, node: FunctionCall) -> bool:
+        if node.builtin is not None:
+            return node.name not in IMPURE_BUILTINS and self.visitAll(node.arguments)
+        function = self.findFunction(node.name)
+        if function is None:
+            return False
+        self.callees[node.name] = function
+        return self.isPure(function) and self.visitAll(node.arguments)
+
+    def visitReturnStatement(self, node: ReturnStatement) -> bool:
+        return self.visit(node.expression)
+
+    # Loops
+
+    def visitWhileLoop(self, node: WhileLoop) -> bool:
+        return self.visit(node.condition) and self.visitInContext(node.block, set())
+
+    def visitWhileBlock(self, node: WhileBlock) -> bool:
+        return self.visitAll(node.statements)
+
+    def visitForEachLoop(self, node: ForEachLoop) -> bool:
+        self.names.add(node.identifier)
+        return self.visit(node.iterable) and self.visitInContext(node.block, {node.identifier})
+
+    def visitBreak(self, _: Break) -> bool:
+        return True
+
+    def visitContinue(self, _: Continue) -> bool:
+        return True
+
+    # Objects
+
+    def visitObjectConstructor(self, node: ObjectConstructor) -> bool:
+        return self.visitAll(node.arguments)
+
+    def visitObjectMethodCall(self, node: ObjectMethodCall) -> bool:
+        return self.isDeclared(node.identifier) and node.functionCall.name in PURE_METHODS
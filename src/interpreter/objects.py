@@ -1,14 +1,56 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 import math
 
+SQRT_2 = math.sqrt(2)
+SQRT_3 = math.sqrt(3)
+
 
 class Object(ABC):
+    """
+    Solid with its derived quantities computed on first use and remembered until one of its dimensions changes through
+    setProperty. The dimensions and the remembered quantities are kept in slots, without a dict per solid.
+    """
+
+    __slots__ = ("cachedSurfaceArea", "cachedVolume")
+    cachedSurfaceArea: Optional[float]
+    cachedVolume: Optional[float]
+    # Constructor parameters, the formulas below take them in this order. The formulas only use arithmetic operators and
+    # the given sqrt, so they compute the quantities of a whole column of solids at once just as well.
+    dimensions: tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self.clearCache()
+
+    def clearCache(self) -> None:
+        self.cachedSurfaceArea = None
+        self.cachedVolume = None
+
+    def setProperty(self, property: str, value) -> None:
+        setattr(self, property, value)
+        self.clearCache()
+
+    def getDimensions(self) -> tuple:
+        return tuple(getattr(self, dimension) for dimension in self.dimensions)
+
+    def getSurfaceArea(self) -> float:
+        if self.cachedSurfaceArea is None:
+            self.cachedSurfaceArea = self.surfaceArea(*self.getDimensions())
+        return self.cachedSurfaceArea
+
+    def getVolume(self) -> float:
+        if self.cachedVolume is None:
+            self.cachedVolume = self.volume(*self.getDimensions())
+        return self.cachedVolume
+
+    @staticmethod
     @abstractmethod
-    def getSurfaceArea(self):
+    def surfaceArea(*dimensions, sqrt=math.sqrt):
         raise NotImplementedError
 
+    @staticmethod
     @abstractmethod
-    def getVolume(self):
+    def volume(*dimensions, sqrt=math.sqrt):
         raise NotImplementedError
 
     @abstractmethod
@@ -17,14 +59,20 @@ class Object(ABC):
 
 
 class Sphere(Object):
+    __slots__ = ("radius",)
+    dimensions = __slots__
+
     def __init__(self, radius: float):
+        super().__init__()
         self.radius = radius
 
-    def getSurfaceArea(self) -> float:
-        return 4 * math.pi * self.radius**2
+    @staticmethod
+    def surfaceArea(radius, sqrt=math.sqrt):
+        return 4 * math.pi * radius**2
 
-    def getVolume(self) -> float:
-        return 4 / 3 * math.pi * self.radius**3
+    @staticmethod
+    def volume(radius, sqrt=math.sqrt):
+        return 4 / 3 * math.pi * radius**3
 
     def display(self) -> None:
         print(f"Sphere: radius={self.radius}")
@@ -40,28 +88,48 @@ class Sphere(Object):
 
 
 class ObjectWithBaseArea(Object):
+    __slots__ = ("cachedBaseArea",)
+    cachedBaseArea: Optional[float]
+
+    def clearCache(self) -> None:
+        super().clearCache()
+        self.cachedBaseArea = None
+
+    def getBaseArea(self) -> float:
+        if self.cachedBaseArea is None:
+            self.cachedBaseArea = self.baseArea(*self.getDimensions())
+        return self.cachedBaseArea
+
+    @staticmethod
     @abstractmethod
-    def getBaseArea(self):
+    def baseArea(*dimensions, sqrt=math.sqrt):
         raise NotImplementedError
 
 
 class Cuboid(ObjectWithBaseArea):
+    __slots__ = ("width", "length", "height")
+    dimensions = __slots__
+
     def __init__(self, width: float, length: float, height: float):
+        super().__init__()
         self.width = width
         self.length = length
         self.height = height
 
-    def getSurfaceArea(self) -> float:
-        return 2 * (self.width * self.length + self.width * self.height + self.length * self.height)
-
-    def getVolume(self) -> float:
-        return self.width * self.length * self.height
-
     def display(self) -> None:
         print(f"Cuboid: width={self.width} length={self.length} height={self.height}")
 
-    def getBaseArea(self) -> float:
-        return self.width * self.length
+    @staticmethod
+    def surfaceArea(width, length, height, sqrt=math.sqrt):
+        return 2 * (width * length + width * height + length * height)
+
+    @staticmethod
+    def volume(width, length, height, sqrt=math.sqrt):
+        return width * length * height
+
+    @staticmethod
+    def baseArea(width, length, height, sqrt=math.sqrt):
+        return width * length
 
     def __eq__(self, __value: object) -> bool:
         return (
@@ -79,23 +147,26 @@ class Cuboid(ObjectWithBaseArea):
 
 
 class Pyramid(ObjectWithBaseArea):
+    __slots__ = ("width", "length", "height")
+    dimensions = __slots__
+
     def __init__(self, width: float, length: float, height: float):
+        super().__init__()
         self.width = width
         self.length = length
         self.height = height
 
-    def getSurfaceArea(self) -> float:
-        return (
-            self.width * self.length
-            + self.width * math.sqrt((self.length / 2) ** 2 + self.height**2)
-            + self.length * math.sqrt((self.width / 2) ** 2 + self.height**2)
-        )
+    @staticmethod
+    def surfaceArea(width, length, height, sqrt=math.sqrt):
+        return width * length + width * sqrt((length / 2) ** 2 + height**2) + length * sqrt((width / 2) ** 2 + height**2)
 
-    def getVolume(self) -> float:
-        return self.width * self.length * self.height / 3
+    @staticmethod
+    def volume(width, length, height, sqrt=math.sqrt):
+        return width * length * height / 3
 
-    def getBaseArea(self) -> float:
-        return self.width * self.length
+    @staticmethod
+    def baseArea(width, length, height, sqrt=math.sqrt):
+        return width * length
 
     def display(self) -> None:
         print(f"Pyramid: width={self.width} length={self.length} height={self.height}")
@@ -116,18 +187,25 @@ class Pyramid(ObjectWithBaseArea):
 
 
 class Cone(ObjectWithBaseArea):
+    __slots__ = ("radius", "height")
+    dimensions = __slots__
+
     def __init__(self, radius: float, height: float):
+        super().__init__()
         self.radius = radius
         self.height = height
 
-    def getSurfaceArea(self) -> float:
-        return math.pi * self.radius * (self.radius + math.sqrt(self.height**2 + self.radius**2))
+    @staticmethod
+    def surfaceArea(radius, height, sqrt=math.sqrt):
+        return math.pi * radius * (radius + sqrt(height**2 + radius**2))
 
-    def getVolume(self) -> float:
-        return math.pi * self.radius**2 * self.height / 3
+    @staticmethod
+    def volume(radius, height, sqrt=math.sqrt):
+        return math.pi * radius**2 * height / 3
 
-    def getBaseArea(self) -> float:
-        return math.pi * self.radius**2
+    @staticmethod
+    def baseArea(radius, height, sqrt=math.sqrt):
+        return math.pi * radius**2
 
     def display(self) -> None:
         print(f"Cone: radius={self.radius} height={self.height}")
@@ -143,18 +221,25 @@ class Cone(ObjectWithBaseArea):
 
 
 class Cylinder(ObjectWithBaseArea):
+    __slots__ = ("radius", "height")
+    dimensions = __slots__
+
     def __init__(self, radius: float, height: float):
+        super().__init__()
         self.radius = radius
         self.height = height
 
-    def getSurfaceArea(self) -> float:
-        return 2 * math.pi * self.radius * (self.radius + self.height)
+    @staticmethod
+    def surfaceArea(radius, height, sqrt=math.sqrt):
+        return 2 * math.pi * radius * (radius + height)
 
-    def getVolume(self) -> float:
-        return math.pi * self.radius**2 * self.height
+    @staticmethod
+    def volume(radius, height, sqrt=math.sqrt):
+        return math.pi * radius**2 * height
 
-    def getBaseArea(self) -> float:
-        return math.pi * self.radius**2
+    @staticmethod
+    def baseArea(radius, height, sqrt=math.sqrt):
+        return math.pi * radius**2
 
     def display(self) -> None:
         print(f"Cylinder: radius={self.radius} height={self.height}")
@@ -170,17 +255,24 @@ class Cylinder(ObjectWithBaseArea):
 
 
 class Tetrahedron(ObjectWithBaseArea):
+    __slots__ = ("edge",)
+    dimensions = __slots__
+
     def __init__(self, edge: float):
+        super().__init__()
         self.edge = edge
 
-    def getSurfaceArea(self) -> float:
-        return math.sqrt(3) * self.edge**2
+    @staticmethod
+    def surfaceArea(edge, sqrt=math.sqrt):
+        return SQRT_3 * edge**2
 
-    def getVolume(self) -> float:
-        return math.sqrt(2) * self.edge**3 / 12
+    @staticmethod
+    def volume(edge, sqrt=math.sqrt):
+        return SQRT_2 * edge**3 / 12
 
-    def getBaseArea(self) -> float:
-        return math.sqrt(3) * self.edge**2 / 4
+    @staticmethod
+    def baseArea(edge, sqrt=math.sqrt):
+        return SQRT_3 * edge**2 / 4
 
     def display(self) -> None:
         print(f"Tetrahedron: edge={self.edge}")
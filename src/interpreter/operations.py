@@ -0,0 +1,276 @@
+from operator import methodcaller
+from typing import Callable, Optional, cast
+from common.errors import InterpreterError
+from interpreter.lists import LIST_TYPES, SolidList, isList, valueType
+from interpreter.objects import Cone, Cuboid, Cylinder, Object, Pyramid, Sphere, Tetrahedron
+from interpreter.types import Values
+from parser.nodes import Argument, FunctionCall, Node, ObjectConstructor
+
+# Semantics of the language's operators and builtins, shared by every execution engine
+
+
+def isNumber(value) -> bool:
+    return type(value) == int or type(value) == float
+
+
+def unsupportedOperands(operator: str, left, right) -> TypeError:
+    return TypeError(f"Unsupported operand type(s) for {operator}: '{type(left)}' and '{type(right)}'")
+
+
+# Logical
+
+
+def logicalOr(left, right) -> bool:
+    if type(left) == bool and type(right) == bool:
+        return left or right
+    raise TypeError(f"Logical or operator requires two boolean values, not {type(left)} and {type(right)}")
+
+
+def logicalAnd(left, right) -> bool:
+    if type(left) == bool and type(right) == bool:
+        return left and right
+    raise TypeError(f"Logical and operator requires two boolean values, not {type(left)} and {type(right)}")
+
+
+def negate(value) -> int | float | bool:
+    if isNumber(value):
+        return -value
+    elif type(value) == bool:
+        return not value
+    raise TypeError(f"Unsupported type for negation: '{type(value)}'")
+
+
+# Comparison
+
+
+def equal(left, right) -> bool:
+    return left == right
+
+
+def notEqual(left, right) -> bool:
+    return left != right
+
+
+def less(left, right) -> bool:
+    if isNumber(left) and isNumber(right):
+        return left < right
+    raise unsupportedOperands("<", left, right)
+
+
+def lessOrEqual(left, right) -> bool:
+    if isNumber(left) and isNumber(right):
+        return left <= right
+    raise unsupportedOperands("<=", left, right)
+
+
+def greater(left, right) -> bool:
+    if isNumber(left) and isNumber(right):
+        return left > right
+    raise unsupportedOperands(">", left, right)
+
+
+def greaterOrEqual(left, right) -> bool:
+    if isNumber(left) and isNumber(right):
+        return left >= right
+    raise unsupportedOperands(">=", left, right)
+
+
+# Arithmetic
+
+
+def add(left, right) -> int | float | str:
+    if type(left) == str and type(right) == str:
+        return left + right
+    elif isNumber(left) and isNumber(right):
+        return left + right
+    raise unsupportedOperands("+", left, right)
+
+
+def subtract(left, right) -> int | float:
+    if isNumber(left) and isNumber(right):
+        return left - right
+    raise unsupportedOperands("-", left, right)
+
+
+def multiply(left, right) -> int | float:
+    if isNumber(left) and isNumber(right):
+        return left * right
+    raise unsupportedOperands("*", left, right)
+
+
+def divide(left, right) -> int | float:
+    if isNumber(left) and isNumber(right):
+        return left / right
+    raise unsupportedOperands("/", left, right)
+
+
+COMPARISON_OPERATIONS: dict[str, Callable[[Values, Values], bool]] = {
+    "==": equal,
+    "!=": notEqual,
+    "<": less,
+    "<=": lessOrEqual,
+    ">": greater,
+    ">=": greaterOrEqual,
+}
+ADDITIVE_OPERATIONS: dict[str, Callable[[Values, Values], int | float | str]] = {"+": add, "-": subtract}
+MULTIPLICATIVE_OPERATIONS: dict[str, Callable[[Values, Values], int | float]] = {"*": multiply, "/": divide}
+
+
+# Lists
+
+
+def subscript(subscriptable, index) -> Values:
+    if type(index) != int:
+        raise TypeError(f"String indices must be integers, not {type(index)}")
+    if type(subscriptable) == str or isList(subscriptable):
+        subscriptable = cast(str | list, subscriptable)
+        if index >= len(subscriptable):
+            raise InterpreterError(f"Index {index} is out of range")
+        return subscriptable[index]
+    raise TypeError(f"Type {type(subscriptable)} is not subscriptable")
+
+
+# Types a value of a list can have, so every value is an instance of the type of the first one
+def listType(value) -> type | tuple[type, ...]:
+    if isinstance(value, Object):
+        return Object
+    return LIST_TYPES if isList(value) else type(value)
+
+
+# Builtins
+
+
+def expectNumberOfArguments(
+    arguments: list[Argument],
+    expected: int,
+    node: ObjectConstructor | FunctionCall,
+    isConstructor: bool = True,
+) -> None:
+    if len(arguments) != expected:
+        callableType = "Constructor" if isConstructor else "Function"
+        if type(node) == FunctionCall:
+            raise InterpreterError(f"{callableType} {node.name} takes {expected} arguments, {len(arguments)} were given", node)
+        elif type(node) == ObjectConstructor:
+            raise InterpreterError(
+                f"{callableType} {node.objectType} takes {expected} arguments, {len(arguments)} were given", node
+            )
+
+
+def bindArguments(arguments: list[Argument], parameters: list[str]) -> tuple[Optional[int], ...]:
+    # Index of the first argument named like each parameter, None when the parameter has no argument
+    indices: dict[str, int] = {}
+    for index, argument in enumerate(arguments):
+        indices.setdefault(argument.name, index)
+    return tuple(indices.get(parameter) for parameter in parameters)
+
+
+def expectSingleArgument(functionName: str, argumentName: str, arguments: list[Argument]) -> None:
+    if len(arguments) != 1:
+        raise TypeError(f"{functionName}() takes 1 positional argument but {len(arguments)} were given")
+    if arguments[0].name != argumentName:
+        raise TypeError(f'{functionName}() requires "{argumentName}" argument but "{arguments[0].name}" was given')  # noqa: E501
+
+
+def printValue(value) -> None:
+    print(value)
+
+
+def toString(value) -> str:
+    if type(value) != int and type(value) != float:
+        raise TypeError(f"Type {type(value)} is not convertible to string. Only int and float are supported")
+    return str(value)
+
+
+def toInt(value) -> int:
+    if type(value) != str and type(value) != float:
+        raise TypeError(f"Type {type(value)} is not convertible to int. Only string and float is supported")
+    try:
+        return int(value)
+    except ValueError:
+        raise TypeError(f"Variable {type(value)} is not a valid number")
+
+
+def toFloat(value) -> float:
+    if type(value) != str and type(value) != int:
+        raise TypeError(f"Type {type(value)} is not convertible to float. Only string and int is supported")
+    try:
+        return float(value)
+    except ValueError:
+        raise TypeError(f"Variable {type(value)} is not a valid number")
+
+
+def aggregateSolids(functionName: str, method: str, reduce: Callable) -> Callable:
+    # Builtin reducing a quantity of every solid of a list in a single native call
+    getQuantity = methodcaller(method)
+
+    def aggregate(objects) -> int | float:
+        if not isList(objects) or not all(isinstance(solid, Object) for solid in objects):
+            raise TypeError(f"{functionName}() requires a list of objects, {valueType(objects)} was given")
+        if len(objects) == 0 and reduce is not sum:
+            raise TypeError(f"{functionName}() requires a non-empty list of objects")
+        return reduce(map(getQuantity, objects))
+
+    return aggregate
+
+
+# (name, method of every solid, reduction) of each aggregate builtin
+AGGREGATES: tuple[tuple[str, str, Callable], ...] = (
+    ("sumVolume", "getVolume", sum),
+    ("minVolume", "getVolume", min),
+    ("maxVolume", "getVolume", max),
+    ("sumSurfaceArea", "getSurfaceArea", sum),
+    ("minSurfaceArea", "getSurfaceArea", min),
+    ("maxSurfaceArea", "getSurfaceArea", max),
+)
+
+# Aggregate builtins taking a list of solids as their objects argument: name -> implementation
+AGGREGATE_FUNCTIONS: dict[str, Callable] = {name: aggregateSolids(name, method, reduce) for name, method, reduce in AGGREGATES}
+
+
+# Builtin functions taking a single named argument: name -> (argument name, implementation). The resolver stores the entry
+# of every call site naming a builtin in its builtin attribute, builtins are called instead of user functions of that name
+BUILTIN_FUNCTIONS: dict[str, tuple[str, Callable]] = {
+    "print": ("out", printValue),
+    "string": ("value", toString),
+    "int": ("value", toInt),
+    "float": ("value", toFloat),
+    **{name: ("objects", aggregate) for name, aggregate in AGGREGATE_FUNCTIONS.items()},
+}
+
+
+# Objects
+
+# Constructor parameters of every object type, in the order their arguments are evaluated
+OBJECT_CLASSES: dict[str, tuple[type[Object], tuple[str, ...]]] = {
+    "Cuboid": (Cuboid, ("width", "length", "height")),
+    "Pyramid": (Pyramid, ("width", "length", "height")),
+    "Sphere": (Sphere, ("radius",)),
+    "Cone": (Cone, ("radius", "height")),
+    "Cylinder": (Cylinder, ("radius", "height")),
+    "Tetrahedron": (Tetrahedron, ("edge",)),
+}
+
+# Methods programs can call on an object, the rest of the object's attributes are the interpreter's own
+OBJECT_METHODS = frozenset({"getSurfaceArea", "getVolume", "getBaseArea", "display"})
+
+
+def callMethod(object: Values, objectName: str, methodName: str, argumentCount: int, node: Optional[Node]) -> Values:
+    if type(object) == SolidList:
+        return callListMethod(object, objectName, methodName, argumentCount, node)
+    if not isinstance(object, Object):
+        raise InterpreterError(f"{objectName} is not an object", node)
+    method = getattr(object, methodName, None) if methodName in OBJECT_METHODS else None
+    if method is None:
+        raise InterpreterError(f"{objectName} object has no method {methodName}", node)
+    if argumentCount != 0:
+        raise InterpreterError(f"{methodName} method takes no arguments", node)
+    return method()
+
+
+def callListMethod(solids: SolidList, objectName: str, methodName: str, argumentCount: int, node: Optional[Node]) -> Values:
+    formula = solids.getMethod(methodName)
+    if formula is None:
+        raise InterpreterError(f"{objectName} list has no method {methodName}", node)
+    if argumentCount != 0:
+        raise InterpreterError(f"{methodName} method takes no arguments", node)
+    return solids.compute(formula)
@@ -0,0 +1,203 @@
+from typing import List, Optional
+from interpreter.operations import BUILTIN_FUNCTIONS
+from interpreter.visitor import NodeVisitor
+from parser.nodes import (
+    AdditiveExpression,
+    Argument,
+    Assignment,
+    BlockWithoutFunciton,
+    Break,
+    ComparisonExpression,
+    Continue,
+    ForEachLoop,
+    FunctionCall,
+    FunctionDefinition,
+    IfStatement,
+    LemonList,
+    LiteralBool,
+    LiteralFloat,
+    LiteralIdentifier,
+    LiteralInt,
+    LiteralString,
+    LiteralSubscriptable,
+    LogicalAndExpression,
+    LogicalOrExpression,
+    MultiplicativeExpression,
+    Node,
+    ObjectConstructor,
+    ObjectMethodCall,
+    ObjectProperty,
+    PrimaryExpression,
+    ReturnStatement,
+    Scope,
+    Slot,
+    VariableDeclaration,
+    WhileBlock,
+    WhileLoop,
+)
+
+
+class Resolver(NodeVisitor):
+    """
+    Static pass run between parsing and interpreting. It mirrors the contexts the interpreter creates (if/elif blocks,
+    loop iterations and function calls) and annotates every variable access with the (depth, index) of its slot.
+
+    Functions are called in the caller's context, so names a function body doesn't declare itself are left
+    unresolved and looked up by name at runtime.
+    """
+
+    def __init__(self, globalScope: Optional[Scope] = None) -> None:
+        self.scopes: List[Scope] = [globalScope if globalScope is not None else {}]
+
+    def resolve(self, nodes: List[Node]) -> None:
+        for node in nodes:
+            self.visit(node)
+
+    def declare(self, name: str) -> None:
+        scope = self.scopes[-1]
+        if name not in scope:
+            scope[name] = len(scope)
+
+    def lookup(self, name: str) -> Optional[Slot]:
+        for depth, scope in enumerate(reversed(self.scopes)):
+            index = scope.get(name)
+            if index is not None:
+                return (depth, index)
+        return None
+
+    def resolveInScope(self, scope: Scope, statements: list) -> Scope:
+        self.scopes.append(scope)
+        for statement in statements:
+            self.visit(statement)
+        self.scopes.pop()
+        return scope
+
+    def visitVariableDeclaration(self, node: VariableDeclaration) -> None:
+        self.visit(node.assignment.value)
+        if type(node.assignment.name) == str:
+            self.declare(node.assignment.name)
+
+    def visitAssignment(self, node: Assignment) -> None:
+        self.visit(node.value)
+        if type(node.name) == str:
+            node.slot = self.lookup(node.name)
+        elif isinstance(node.name, ObjectProperty):
+            node.slot = self.lookup(node.name.identifier)
+
+    def visitLogicalOrExpression(self, node: LogicalOrExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visitLogicalAndExpression(self, node: LogicalAndExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visitComparisonExpression(self, node: ComparisonExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visitAdditiveExpression(self, node: AdditiveExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visitMultiplicativeExpression(self, node: MultiplicativeExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+
+    def visitPrimaryExpression(self, node: PrimaryExpression) -> None:
+        self.visit(node.literal)
+
+    # Literals
+
+    def visitLiteralFloat(self, node: LiteralFloat) -> None:
+        pass
+
+    def visitLiteralInt(self, node: LiteralInt) -> None:
+        pass
+
+    def visitLiteralBool(self, node: LiteralBool) -> None:
+        pass
+
+    def visitLiteralString(self, node: LiteralString) -> None:
+        pass
+
+    def visitLiteralIdentifier(self, node: LiteralIdentifier) -> None:
+        node.slot = self.lookup(node.value)
+
+    def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> None:
+        node.slot = self.lookup(node.value)
+        self.visit(node.subscript)
+
+    def visitLemonList(self, node: LemonList) -> None:
+        for value in node.values:
+            self.visit(value)
+
+    # If
+
+    def visitIfStatement(self, node: IfStatement) -> None:
+        for conditionWithBlock in [node.ifCB] + (node.elifCBs or []):
+            self.visit(conditionWithBlock.condition)
+            block = conditionWithBlock.block
+            block.scope = self.resolveInScope({}, block.statements)
+        if node.elseBlock:
+            self.visit(node.elseBlock)
+
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> None:
+        for statement in node.statements:
+            self.visit(statement)
+
+    # Functions
+
+    def visitArgument(self, node: Argument) -> None:
+        self.visit(node.value)
+
+    def visitFunctionDefinition(self, node: FunctionDefinition) -> None:
+        self.declare(node.name)
+        outerScopes = self.scopes
+        self.scopes = [{}]
+        for parameter in node.parameters:
+            self.declare(parameter)
+        node.scope = self.resolveInScope(self.scopes.pop(), node.body.statements)
+        self.scopes = outerScopes
+
+    def visitFunctionCall(self, node: FunctionCall) -> None:
+        node.builtin = BUILTIN_FUNCTIONS.get(node.name)
+        if node.builtin is None:
+            node.slot = self.lookup(node.name)
+        for argument in node.arguments:
+            self.visit(argument)
+
+    def visitReturnStatement(self, node: ReturnStatement) -> None:
+        self.visit(node.expression)
+
+    # Loops
+
+    def visitWhileLoop(self, node: WhileLoop) -> None:
+        self.visit(node.condition)
+        node.block.scope = self.resolveInScope({}, node.block.statements)
+
+    def visitWhileBlock(self, node: WhileBlock) -> None:
+        for statement in node.statements:
+            self.visit(statement)
+
+    def visitForEachLoop(self, node: ForEachLoop) -> None:
+        self.visit(node.iterable)
+        node.block.scope = self.resolveInScope({node.identifier: 0}, node.block.statements)
+
+    def visitBreak(self, _: Break) -> None:
+        pass
+
+    def visitContinue(self, _: Continue) -> None:
+        pass
+
+    # Objects
+
+    def visitObjectConstructor(self, node: ObjectConstructor) -> None:
+        for argument in node.arguments:
+            self.visit(argument)
+
+    def visitObjectMethodCall(self, node: ObjectMethodCall) -> None:
+        node.slot = self.lookup(node.identifier)
+
+    def visitObjectProperty(self, node: ObjectProperty) -> None:
+        pass
@@ -1,8 +1,9 @@
+from interpreter.lists import SolidList, TypedList
 from interpreter.objects import Object
 from parser.nodes import FunctionDefinition
 from lexer.tokens import Position
 
-Literals = int | float | bool | str | list
+Literals = int | float | bool | str | list | TypedList | SolidList
 Objects = Object
 Values = Literals | Objects | FunctionDefinition
 Variables = dict[str, Values]
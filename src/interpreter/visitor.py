@@ -0,0 +1,31 @@
+from typing import Callable
+from parser.nodes import Node
+
+
+class NodeVisitor(object):
+    # Node types whose visit method only returns node.value, visit returns it without dispatching
+    literalNodes: frozenset[type] = frozenset()
+    # Node type -> visit function of the class, filled the first time a node type is visited
+    dispatchTable: dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.dispatchTable = {}
+
+    def visit(self, node: Node):
+        nodeType = type(node)
+        if nodeType in self.literalNodes:
+            return node.value  # type: ignore
+        visitor = self.dispatchTable.get(nodeType)
+        if visitor is None:
+            visitor = self.dispatch(nodeType)
+        return visitor(self, node)
+
+    @classmethod
+    def dispatch(cls, nodeType: type) -> Callable:
+        visitor = getattr(cls, "visit" + nodeType.__name__, cls.genericVisit)
+        cls.dispatchTable[nodeType] = visitor
+        return visitor
+
+    def genericVisit(self, node):
+        raise Exception(f"No visit{type(node).__name__} method")
@@ -0,0 +1,152 @@
+import re
+from common.errors import LexerError
+from .lexer import ESCAPE_SEQUENCES, Lexer, MAX_NUMBER, MAX_STRING_LENGTH
+from .source import Source
+from .tokens import (
+    BooleanValueToken,
+    FloatValueToken,
+    IdentifierValueToken,
+    IntValueToken,
+    Position,
+    StringValueToken,
+    Token,
+)
+from .token_type import TokenType
+
+# Every token type without a value, by its text
+TOKEN_TYPES: dict[str, TokenType] = {tokenType.value: tokenType for tokenType in TokenType if not tokenType.name.startswith("V")}
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<skip>[ \t\r]+|\#[^\n]*)
+    |(?P<newline>\n)
+    |(?P<identifier>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<number>[0-9]+(?:\.[0-9]*)?)
+    |(?P<operator><=|>=|==|!=|[,.\[\]{}()+\-*/<>=])
+    |(?P<string>")
+    |(?P<invalidCharacter>[@$%^&`~?|])
+    |(?P<invalid>[^ \t\r\n]+)
+    """,
+    re.VERBOSE,
+)
+
+# Like Lexer, a keyword ends an identifier when it's followed by a digit, and true or false end it right away
+KEYWORD_PREFIX = re.compile(
+    "true|false|(?:" + "|".join(sorted((value for value in TOKEN_TYPES if value.isidentifier()), key=len)) + ")(?![A-Za-z_])"
+)
+
+STRING_PATTERN = re.compile(r'((?:[^"\\]|\\.)*)"?', re.DOTALL)
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+
+NUMBER_TAIL = re.compile(r"[0-9.]*")
+IDENTIFIER_TAIL = re.compile(r"[A-Za-z0-9_]*")
+
+
+class FastLexer(Lexer):
+    """
+    Lexer matching the whole text of the source against a single compiled pattern and looking keywords up in a dict,
+    instead of reading it character by character. It produces the same tokens as Lexer for valid code.
+    """
+
+    def __init__(self, source: Source):
+        self.source = source
+        self.tokenIterator = 0
+        self.errors = 0
+        self.text = source.readRemaining()
+        self.index = 0
+        self.line = source.line if source.line else 1
+        # Index of the first character of the current line in the text
+        self.lineStart = self.index - source.column
+
+    def getNextToken(self) -> Token:
+        text = self.text
+        while self.index < len(text):
+            match = TOKEN_PATTERN.match(text, self.index)
+            kind = match.lastgroup  # type: ignore
+            start = self.index
+            self.index = match.end()  # type: ignore
+            try:
+                if kind == "skip":
+                    continue
+                elif kind == "newline":
+                    self.line += 1
+                    self.lineStart = self.index
+                elif kind == "identifier":
+                    return self.__buildIdentifierOrKeyword(match.group(), start)  # type: ignore
+                elif kind == "operator":
+                    return Token(TOKEN_TYPES[match.group()], self.__position(start))  # type: ignore
+                elif kind == "number":
+                    return self.__buildNumber(match.group(), start)  # type: ignore
+                elif kind == "string":
+                    return self.__buildString(start)
+                elif kind == "invalidCharacter":
+                    raise LexerError(f"Invalid character `{match.group()}`", self.__position(start))  # type: ignore
+                else:
+                    raise LexerError(f"Invalid identifier ({match.group()})", self.__position(start))  # type: ignore
+            except LexerError as e:
+                print(e)
+                self.errors += 1
+        return Token(type=TokenType.VT_EOF, startPosition=self.__position(len(text)))
+
+    def __position(self, index: int) -> Position:
+        return Position(self.line, index - self.lineStart + 1)
+
+    def __buildIdentifierOrKeyword(self, identifier: str, start: int) -> Token:
+        tokenType = TOKEN_TYPES.get(identifier)
+        if tokenType is None:
+            keyword = KEYWORD_PREFIX.match(identifier)
+            if keyword is None:
+                return IdentifierValueToken(self.__position(start), len(identifier), identifier)
+            identifier = keyword.group()
+            tokenType = TOKEN_TYPES[identifier]
+            self.index = start + len(identifier)
+        if tokenType == TokenType.T_TRUE:
+            return BooleanValueToken(self.__position(start), True)
+        elif tokenType == TokenType.T_FALSE:
+            return BooleanValueToken(self.__position(start), False)
+        return Token(tokenType, self.__position(start))
+
+    def __buildNumber(self, number: str, start: int) -> FloatValueToken | IntValueToken:
+        startPosition = self.__position(start)
+        following = self.text[self.index : self.index + 1]
+        if len(number) > 1 and number[0] == "0" and number[1].isdigit():
+            self.index = NUMBER_TAIL.match(self.text, self.index).end()  # type: ignore
+            raise LexerError("Integer number can't start with zero", startPosition)
+        integerPart, isDecimal, fractionalPart = number.partition(".")
+        if int(integerPart) > MAX_NUMBER:
+            raise LexerError("Number is too big", startPosition)
+        if following == ".":
+            self.index = NUMBER_TAIL.match(self.text, self.index).end()  # type: ignore
+            raise LexerError("Number can't have more than one decimal point", startPosition)
+        if following.isascii() and following.isalpha():
+            self.index = IDENTIFIER_TAIL.match(self.text, self.index).end()  # type: ignore
+            raise LexerError(f"Invalid character `{following}` in number", startPosition)
+        if isDecimal:
+            value = int(integerPart) + int(fractionalPart or "0") / 10 ** len(fractionalPart)
+            return FloatValueToken(startPosition, len(number), value)
+        return IntValueToken(startPosition, len(number), int(integerPart))
+
+    def __buildString(self, start: int) -> StringValueToken:
+        startPosition = self.__position(start)
+        match = STRING_PATTERN.match(self.text, start + 1)
+        raw = match.group(1)  # type: ignore
+        self.index = match.end()  # type: ignore
+        invalid = next((escape for escape in ESCAPE_PATTERN.finditer(raw) if escape.group(1) not in ESCAPE_SEQUENCES), None)
+        if invalid is not None:
+            # Reported at the character after the backslash, like Lexer does
+            escapeIndex = start + 2 + invalid.start()
+            self.__countLines(start, escapeIndex)
+            errorPosition = self.__position(escapeIndex)
+            self.__countLines(escapeIndex, self.index)
+            raise LexerError(f"Invalid escape sequence `\\{invalid.group(1)}`", errorPosition)
+        self.__countLines(start, self.index)
+        if len(raw) > MAX_STRING_LENGTH:
+            raise LexerError("String is too long", startPosition)
+        string = ESCAPE_PATTERN.sub(lambda escape: ESCAPE_SEQUENCES[escape.group(1)], raw) if "\\" in raw else raw
+        return StringValueToken(startPosition, len(string) + 2, string)
+
+    def __countLines(self, start: int, end: int) -> None:
+        newLines = self.text.count("\n", start, end)
+        if newLines:
+            self.line += newLines
+            self.lineStart = self.text.rindex("\n", start, end) + 1
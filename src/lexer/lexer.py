@@ -3,17 +3,22 @@ from typing import Callable, List, Optional
 from common.errors import LexerError
 from .source import Source
 from .tokens import BooleanValueToken, StringValueToken, Token, FloatValueToken, IntValueToken, IdentifierValueToken
+from .token_table import TokenTable
 from .token_type import TokenType
 
 
 MAX_NUMBER = 2**31 - 1
 MAX_STRING_LENGTH = 2**31 - 1
 
+ESCAPE_SEQUENCES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"'}
+
 
 class Lexer:
     def __init__(self, source: Source):
         self.source = source
         self.tokenIterator = 0
+        # Errors reported while lexing, the tokens they were found in are skipped
+        self.errors = 0
         self.currentCharacter: str = self.source.readNextCharacter()
 
     def _getAllTokens(self) -> List[Token]:
@@ -25,6 +30,17 @@ class Lexer:
         allTokens.append(token)
         return allTokens
 
+    def getTokenTable(self) -> TokenTable:
+        # Every token up to and with the end of source, each stored in the table's arrays as soon as it's built
+        table = TokenTable()
+        token = self.getNextToken()
+        while token.type != TokenType.VT_EOF:
+            table.append(token)
+            token = self.getNextToken()
+        table.append(token)
+        table.compact()
+        return table
+
     def getNextToken(self) -> Token:
         self._skipWhitespace()
         if self.currentCharacter == "#":
@@ -42,6 +58,7 @@ class Lexer:
                 return Token(type=TokenType.VT_EOF, startPosition=self.source.getPosition())
         except LexerError as e:
             print(e)
+            self.errors += 1
 
         if token is not None:
             return token
@@ -49,7 +66,6 @@ class Lexer:
             return self.getNextToken()
 
     def _tryBuildNumber(self) -> Optional[FloatValueToken | IntValueToken]:
-        startPosition = self.source.getPosition()
         isDecimal = False
         decimalPart = 0
 
@@ -57,6 +73,7 @@ class Lexer:
         fractionalLength = 0
 
         if self.currentCharacter.isdigit():
+            startPosition = self.source.getPosition()
             number = ord(self.currentCharacter) - ord("0")
             startsWithZero = True if number == 0 else False
             while True:
@@ -145,13 +162,13 @@ class Lexer:
             raise LexerError(f"Invalid identifier ({identifierString})", startPosition)
 
     def _tryBuildString(self) -> Optional[StringValueToken]:
-        startPosition = self.source.position.copy()
-        string = ""
-        length = 2
-
         if self.currentCharacter != '"':
             return None
 
+        startPosition = self.source.getPosition()
+        parts: List[str] = []
+        length = 2
+
         self._nextCharacter()
 
         while not self.source.isEndOfSource() and self.currentCharacter != '"':
@@ -159,24 +176,23 @@ class Lexer:
                 raise LexerError("String is too long", self.source.position)
             if self.currentCharacter == "\\":
                 self._nextCharacter()
-                if self.currentCharacter == "n":
-                    string += "\n"
-                elif self.currentCharacter == "t":
-                    string += "\t"
-                elif self.currentCharacter == "\\":
-                    string += "\\"
-                elif self.currentCharacter == '"':
-                    string += '"'
-                else:
+                escaped = ESCAPE_SEQUENCES.get(self.currentCharacter)
+                if escaped is None:
                     raise LexerError(f"Invalid escape sequence `\\{self.currentCharacter}`", self.source.position)
+                parts.append(escaped)
+                length += 1
             else:
-                string += self.currentCharacter
-            length += 1
+                # Everything up to the next quote or backslash is taken at once, straight from the source
+                run = self.currentCharacter + self.source.readUntil('"\\')
+                if length - 2 + len(run) > MAX_STRING_LENGTH:
+                    raise LexerError("String is too long", self.source.position)
+                parts.append(run)
+                length += len(run)
             self._nextCharacter()
 
         self._nextCharacter()
 
-        return StringValueToken(startPosition, length, string)
+        return StringValueToken(startPosition, length, "".join(parts))
 
     def _isValidIdentifier(self, isFirstCharacter: bool) -> bool:
         if isFirstCharacter:
@@ -1,12 +1,24 @@
 # STDIN_EOT_TEXT = "DONE"
 
 
+import mmap
+import os
+from typing import Iterable
 from .tokens import Position
 
+# Number of characters FileSource reads from the file at once
+BUFFER_SIZE = 64 * 1024
+
 
 class Source:
+    # The position of the last read character is kept as plain integers, Position objects are only created on request
     def __init__(self) -> None:
-        self.position: Position = Position(line=0, column=0)
+        self.line = 0
+        self.column = 0
+
+    @property
+    def position(self) -> Position:
+        return Position(self.line, self.column)
 
     def readNextCharacter(self) -> str:
         return ""
@@ -14,40 +26,168 @@ class Source:
     def isEndOfSource(self) -> bool:
         return False
 
+    def readRemaining(self) -> str:
+        # Rest of the source at once, for lexers matching whole text instead of reading it character by character
+        characters = []
+        while not self.isEndOfSource():
+            characters.append(self.readNextCharacter())
+        return "".join(characters)
+
+    def readUntil(self, stop: str) -> str:
+        # Reads a run of characters up to, but without, the first one from stop. Sources that can't slice their
+        # buffer read nothing, so the caller goes on character by character.
+        return ""
+
     def getPosition(self) -> Position:
-        return self.position.copy()
+        return Position(self.line, self.column)
+
+    def _advance(self, run: str) -> None:
+        newLine = run.rfind("\n")
+        if newLine == -1:
+            self.column += len(run)
+        else:
+            self.line += run.count("\n")
+            self.column = len(run) - newLine - 1
+
+
+def findFirst(text, stop: Iterable, start: int, end: int) -> int:
+    # Index of the first character from stop in text[start:end], end if there is none
+    for character in stop:
+        index = text.find(character, start, end)
+        if index != -1:
+            end = index
+    return end
 
 
 class FileSource(Source):
-    def __init__(self, path):
+    def __init__(self, path, bufferSize: int = BUFFER_SIZE):
         self.fileStream = open(path, "r")
+        self.bufferSize = bufferSize
+        self.buffer = ""
+        self.index = 0
         self.eof = False
-        self.position = Position(line=1, column=0)
+        self.line = 1
+        self.column = 0
 
     def readNextCharacter(self) -> str:
-        char = self.fileStream.read(1)
-        self.position = self.position.getNextLine() if char == "\n" else self.position.getNextCharacter()
-        if not char:
-            self.eof = True
+        if self.index >= len(self.buffer):
+            self.buffer = self.fileStream.read(self.bufferSize)
+            self.index = 0
+            if not self.buffer:
+                self.eof = True
+                self.column += 1
+                return ""
+        char = self.buffer[self.index]
+        self.index += 1
+        if char == "\n":
+            self.line += 1
+            self.column = 0
+        else:
+            self.column += 1
         return char
 
     def isEndOfSource(self) -> bool:
         return self.eof
 
+    def readUntil(self, stop: str) -> str:
+        runs = []
+        while True:
+            end = findFirst(self.buffer, stop, self.index, len(self.buffer))
+            runs.append(self.buffer[self.index : end])
+            self.index = end
+            if end < len(self.buffer):
+                break
+            self.buffer = self.fileStream.read(self.bufferSize)
+            self.index = 0
+            if not self.buffer:
+                break
+        run = "".join(runs)
+        self._advance(run)
+        return run
+
+    def readRemaining(self) -> str:
+        text = self.buffer[self.index :] + self.fileStream.read()
+        self.buffer, self.index, self.eof = "", 0, True
+        return text
+
     def __del__(self):
         self.fileStream.close()
 
 
+# Characters of single byte UTF-8 sequences, indexed by the byte
+ASCII = [chr(byte) for byte in range(0x80)]
+
+
+class MmapSource(Source):
+    # Reads characters straight from a memory map of the UTF-8 encoded file, so the file is never copied into memory
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        # Empty files can't be mapped
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(self.file.fileno()).st_size else b""
+        self.size = len(self.map)
+        self.index = 0
+        self.eof = False
+        self.line = 1
+        self.column = 0
+
+    def readNextCharacter(self) -> str:
+        if self.index >= self.size:
+            self.eof = True
+            self.column += 1
+            return ""
+        byte = self.map[self.index]
+        if byte < 0x80:
+            char = ASCII[byte]
+            self.index += 1
+        else:
+            length = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            char = self.map[self.index : self.index + length].decode("utf-8")
+            self.index += length
+        if char == "\n":
+            self.line += 1
+            self.column = 0
+        else:
+            self.column += 1
+        return char
+
+    def isEndOfSource(self) -> bool:
+        return self.eof
+
+    def readUntil(self, stop: str) -> str:
+        # Characters of stop are ASCII, which never appear inside a multi-byte UTF-8 sequence
+        end = findFirst(self.map, [character.encode() for character in stop], self.index, self.size)
+        run = self.map[self.index : end].decode("utf-8")
+        self.index = end
+        self._advance(run)
+        return run
+
+    def readRemaining(self) -> str:
+        # Decoding copies the rest of the file, so the lexers meant for memory maps read it character by character
+        text = self.map[self.index :].decode("utf-8")
+        self.index, self.eof = self.size, True
+        return text
+
+    def __del__(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self.file.close()
+
+
 class StringSource(Source):
     def __init__(self, text):
         self.text = text + "\0"
         self.index = 0
-        self.position = Position(line=1, column=0)
+        self.line = 1
+        self.column = 0
 
     def readNextCharacter(self) -> str:
         if self.index < len(self.text):
             char = self.text[self.index]
-            self.position = self.position.getNextLine() if char == "\n" else self.position.getNextCharacter()
+            if char == "\n":
+                self.line += 1
+                self.column = 0
+            else:
+                self.column += 1
             self.index += 1
             return char
         return ""
@@ -55,6 +195,20 @@ class StringSource(Source):
     def isEndOfSource(self) -> bool:
         return self.index >= len(self.text)
 
+    def readUntil(self, stop: str) -> str:
+        # The terminating null character is never part of the run
+        end = findFirst(self.text, stop, self.index, max(self.index, len(self.text) - 1))
+        run = self.text[self.index : end]
+        self.index = end
+        self._advance(run)
+        return run
+
+    def readRemaining(self) -> str:
+        # Without the terminating null character
+        text = self.text[self.index : -1]
+        self.index = len(self.text)
+        return text
+
 
 # class StdInSource(Source):
 #     def __init__(self):
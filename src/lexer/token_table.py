@@ -0,0 +1,73 @@
+from array import array
+from typing import Iterator, List, Sequence
+from .tokens import Position, Token, ValueToken
+from .token_type import TokenType
+
+# Token types by their code in a table, and the codes by the token types
+TOKEN_TYPES: List[TokenType] = list(TokenType)
+TYPE_CODES: dict[TokenType, int] = {tokenType: code for code, tokenType in enumerate(TOKEN_TYPES)}
+
+# Value index of a token without a value
+NO_VALUE = -1
+
+
+class TokenTable(Sequence[Token]):
+    """
+    Tokens of a whole source kept in parallel arrays of type codes, lines, columns, lengths and indices into a pool of
+    values, instead of a Token and a Position object per token. Each distinct value is pooled once, so an identifier
+    used a thousand times is stored as a single string. A token object is only built when it's read from the table.
+    """
+
+    def __init__(self) -> None:
+        self.types = array("B")
+        self.lines = array("I")
+        self.columns = array("I")
+        self.lengths = array("I")
+        self.valueIndices = array("i")
+        self.values: list = []
+        # (type code, value) -> index of the value in the pool, the type keeps 1, 1.0 and true apart
+        self.valuePool: dict[tuple, int] = {}
+
+    def append(self, token: Token) -> None:
+        code = TYPE_CODES[token.type]
+        self.types.append(code)
+        self.lines.append(token.startPosition.line)
+        self.columns.append(token.startPosition.column)
+        if isinstance(token, ValueToken):
+            key = (code, token.value)
+            index = self.valuePool.get(key)
+            if index is None:
+                index = self.valuePool[key] = len(self.values)
+                self.values.append(token.value)
+            self.lengths.append(token.length)
+            self.valueIndices.append(index)
+        else:
+            self.lengths.append(0)
+            self.valueIndices.append(NO_VALUE)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.token(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Token table index out of range")
+        return self.token(index)
+
+    def __iter__(self) -> Iterator[Token]:
+        return (self.token(index) for index in range(len(self)))
+
+    def token(self, index: int) -> Token:
+        tokenType = TOKEN_TYPES[self.types[index]]
+        position = Position(self.lines[index], self.columns[index])
+        valueIndex = self.valueIndices[index]
+        if valueIndex == NO_VALUE:
+            return Token(tokenType, position)
+        return ValueToken(tokenType, position, self.lengths[index], self.values[valueIndex])
+
+    def compact(self) -> None:
+        # The pool is only needed while tokens are appended
+        self.valuePool.clear()
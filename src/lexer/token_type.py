@@ -2,6 +2,9 @@ from enum import Enum
 
 
 class TokenType(Enum):
+    # Members are only equal to themselves, so they hash by identity, in C, instead of by name like every Enum
+    __hash__ = object.__hash__
+
     def hasValue(self):
         return True if self.name.startswith("V") else False
 
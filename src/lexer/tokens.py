@@ -2,6 +2,9 @@ from .token_type import TokenType
 
 
 class Position:
+    # Every node and token holds one, slots keep it at two references
+    __slots__ = ("line", "column")
+
     def __init__(self, line: int, column: int):
         self.line = line
         self.column = column
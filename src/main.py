@@ -1,19 +1,55 @@
+from lexer.fast_lexer import FastLexer
 from lexer.lexer import Lexer
-from lexer.source import FileSource, StringSource
+from lexer.source import FileSource, MmapSource, StringSource
+from parser.cache import CACHE_DIRECTORY, CachedParser, ProgramCache
 from parser.parser import Parser
+from closures.interpreter import ClosureInterpreter
 from interpreter.interpreter import Interpreter
+from vm.machine import VirtualMachine
+from typing import Optional
 import argparse
+import sys
 
+ENGINES: dict[str, type[Interpreter]] = {"tree": Interpreter, "vm": VirtualMachine, "closures": ClosureInterpreter}
 
-def interpretCode(code: str, isFile: bool = False):
+# FastLexer matches its pattern against the whole text, which would decode the entire memory map into a string
+MMAP_WITH_FAST_LEXER_ERROR = "--mmap can't be combined with --fast-lexer, the regex based lexer needs the whole file as text"
+
+
+def interpretCode(
+    code: str,
+    isFile: bool = False,
+    engine: str = "tree",
+    useMmap: bool = False,
+    useFastLexer: bool = False,
+    streaming: bool = False,
+    cache: Optional[ProgramCache] = None,
+    useTokenTable: bool = False,
+) -> Interpreter:
+    if isFile and useMmap and useFastLexer:
+        raise ValueError(MMAP_WITH_FAST_LEXER_ERROR)
+    lexerType = FastLexer if useFastLexer else Lexer
     if isFile:
-        lexer = Lexer(FileSource(code))
+        lexer = lexerType(MmapSource(code) if useMmap else FileSource(code))
+    else:
+        lexer = lexerType(StringSource(code))
+    if cache is not None:
+        parser: Parser = CachedParser(lexer, readSource(code, isFile), cache)
+    elif useTokenTable:
+        parser = Parser(lexer, lexer.getTokenTable())
     else:
-        lexer = Lexer(StringSource(code))
-    parser = Parser(lexer)
-    interpreter = Interpreter(parser)
+        parser = Parser(lexer)
+    interpreter = ENGINES[engine](parser)
+
+    interpreter.interpret(streaming)
+    return interpreter
+
 
-    interpreter.interpret()
+def readSource(code: str, isFile: bool) -> bytes:
+    if not isFile:
+        return code.encode()
+    with open(code, "rb") as file:
+        return file.read()
 
 
 code = """
@@ -51,8 +87,42 @@ print(out=number)
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Interpret code")
     parser.add_argument("-f", "--file", type=str, help="Path to file", required=False)
+    parser.add_argument("-e", "--engine", choices=ENGINES.keys(), default="tree", help="Execution engine")
+    parser.add_argument("-m", "--mmap", action="store_true", help="Memory-map the file instead of reading it")
+    parser.add_argument("-l", "--fast-lexer", action="store_true", help="Tokenize with the regex based lexer")
+    parser.add_argument("-k", "--token-table", action="store_true", help="Lex the whole source into a token table first")
+    parser.add_argument("-t", "--stream", action="store_true", help="Parse every statement only once the previous one ran")
+    parser.add_argument(
+        "-c", "--cache", nargs="?", const=CACHE_DIRECTORY, help="Keep parsed programs in a directory and reuse them"
+    )
+    parser.add_argument("--cache-stats", action="store_true", help="Print hits and misses of the program cache")
+    parser.add_argument("-s", "--memo-stats", action="store_true", help="Print hits and misses of pure function memos")
     args = parser.parse_args()
+    if args.mmap and args.fast_lexer:
+        parser.error(MMAP_WITH_FAST_LEXER_ERROR)
+    cache = ProgramCache(args.cache) if args.cache else None
     if args.file:
-        interpretCode(args.file, isFile=True)
+        interpreter = interpretCode(
+            args.file,
+            isFile=True,
+            engine=args.engine,
+            useMmap=args.mmap,
+            useFastLexer=args.fast_lexer,
+            streaming=args.stream,
+            cache=cache,
+            useTokenTable=args.token_table,
+        )
     else:
-        interpretCode(code)
+        interpreter = interpretCode(
+            code,
+            engine=args.engine,
+            useFastLexer=args.fast_lexer,
+            streaming=args.stream,
+            cache=cache,
+            useTokenTable=args.token_table,
+        )
+    if args.memo_stats:
+        for name, (hits, misses) in interpreter.memoStatistics().items():
+            print(f"{name}: {hits} hits, {misses} misses", file=sys.stderr)
+    if cache is not None and args.cache_stats:
+        print(f"Program cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
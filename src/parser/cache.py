@@ -0,0 +1,95 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import List, Optional
+from lexer.lexer import Lexer
+from parser.nodes import Statement
+from parser.parser import Parser
+
+# Directory the parsed programs are kept in when no other one is given, like __pycache__ for Python modules
+CACHE_DIRECTORY = "__lemoncache__"
+CACHE_SUFFIX = ".ast"
+
+# Errors of reading a cached program that is truncated, corrupted or written by another version of the nodes
+LOAD_ERRORS = (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError)
+
+PACKAGES = ("lexer", "parser")
+
+
+def parserVersion() -> str:
+    # Digest of every module that decides what a source parses to, and of the Python version pickling the nodes. A
+    # change to any of them gives every program a new key, so a stale entry is never read.
+    digest = hashlib.sha256(f"{sys.version_info.major}.{sys.version_info.minor}".encode())
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in PACKAGES:
+        directory = os.path.join(root, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as file:
+                    digest.update(name.encode())
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+class ProgramCache:
+    """
+    Parsed programs on disk, keyed by the hash of their source and the parser's version. Entries are written to a
+    temporary file which then replaces the entry at once, so a reader never sees a partly written one, and an entry
+    that can't be read is parsed again and overwritten.
+    """
+
+    def __init__(self, directory: str = CACHE_DIRECTORY) -> None:
+        self.directory = directory
+        self.version = parserVersion()
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, source: bytes) -> str:
+        key = hashlib.sha256(self.version.encode() + source).hexdigest()
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def load(self, source: bytes) -> Optional[List[Statement]]:
+        try:
+            with open(self.path(source), "rb") as file:
+                statements = pickle.load(file)
+        except LOAD_ERRORS:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return statements
+
+    def store(self, source: bytes, statements: List[Statement]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporaryPath = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(statements, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporaryPath, self.path(source))
+        except BaseException:
+            os.unlink(temporaryPath)
+            raise
+
+
+class CachedParser(Parser):
+    """
+    Parser reading the program from the cache when its source was parsed before. A program is only stored when the
+    lexer reported no errors and every token was parsed, so a cached run prints the same as a parsed one.
+    """
+
+    def __init__(self, lexer: Lexer, source: bytes, cache: ProgramCache) -> None:
+        super().__init__(lexer)
+        self.source = source
+        self.cache = cache
+        self.isCacheHit = False
+
+    def parse(self) -> List:
+        statements = self.cache.load(self.source)
+        if statements is not None:
+            self.isCacheHit = True
+            return statements
+        statements = super().parse()
+        if self.lexer.errors == 0 and self.unexpectedTokens == 0:
+            self.cache.store(self.source, statements)
+        return statements
@@ -5,23 +5,34 @@ from typing import Literal as LiteralType
 
 from lexer.tokens import Position
 
+# Filled in by the resolver: a Scope maps names declared in one lexical scope to their index in the frame,
+# a Slot is the (depth, index) pair of the frame holding a variable, counted from the innermost frame.
+Scope = dict[str, int]
+Slot = tuple[int, int]
+
 
 class Node(ABC):
-    pass
+    # Nodes keep their fields in slots rather than a dict per node, large programs parse to millions of them
+    __slots__ = ()
 
 
 class Expression(Node):
+    __slots__ = ("startPosition",)
+
     def __init__(self, startPosition: Position):
         self.startPosition = startPosition
 
 
 class Assignment(Node):
+    __slots__ = ("position", "name", "value", "slot")
+
     def __init__(
         self, position: Position, name: "str | ObjectProperty", value: "Expression | ObjectConstructor | LemonList"
     ):
         self.position = position
         self.name = name
         self.value = value
+        self.slot: Optional[Slot] = None
 
     def __repr__(self):
         return f"(Assignment: {self.name} Value:{self.value})"
@@ -34,6 +45,8 @@ class Assignment(Node):
 
 
 class Argument(Node):
+    __slots__ = ("position", "name", "value")
+
     def __init__(self, position: Position, name: str, value: "Expression | ObjectConstructor | LemonList"):
         self.position = position
         self.name = name
@@ -50,14 +63,22 @@ class Argument(Node):
 
 
 class Literal(Expression):
-    pass
+    __slots__ = ()
 
 
 class FunctionCall(Literal):
+    __slots__ = ("name", "arguments", "slot", "builtin", "binding")
+
     def __init__(self, startPosition: Position, name: str, arguments: List[Argument]):
         super().__init__(startPosition)
         self.name = name
         self.arguments = arguments
+        self.slot: Optional[Slot] = None
+        # (argument name, implementation) of the builtin the call site names, filled in by the resolver
+        self.builtin: Optional[tuple] = None
+        # (function definition, index of the argument passed to each of its parameters), filled in by the interpreter
+        # the first time the call site calls that function
+        self.binding: Optional[tuple["FunctionDefinition", tuple[Optional[int], ...]]] = None
 
     def __repr__(self):
         return f"(FunctionCall:{self.name} Args:{self.arguments})"
@@ -70,6 +91,8 @@ class FunctionCall(Literal):
 
 
 class LiteralFloat(Literal):
+    __slots__ = ("value",)
+
     def __init__(self, startPosition: Position, value: float):
         super().__init__(startPosition)
         self.value = value
@@ -85,6 +108,8 @@ class LiteralFloat(Literal):
 
 
 class LiteralInt(Literal):
+    __slots__ = ("value",)
+
     def __init__(self, startPosition: Position, value: int):
         super().__init__(startPosition)
         self.value = value
@@ -100,6 +125,8 @@ class LiteralInt(Literal):
 
 
 class LiteralBool(Literal):
+    __slots__ = ("value",)
+
     def __init__(self, startPosition: Position, value: bool):
         super().__init__(startPosition)
         self.value = value
@@ -115,9 +142,12 @@ class LiteralBool(Literal):
 
 
 class LiteralIdentifier(Literal):
+    __slots__ = ("value", "slot")
+
     def __init__(self, startPosition: Position, value: str):
         super().__init__(startPosition)
         self.value = value
+        self.slot: Optional[Slot] = None
 
     def __repr__(self):
         return f"(LiteralIdentifier:{self.value})"
@@ -130,6 +160,8 @@ class LiteralIdentifier(Literal):
 
 
 class LiteralString(Literal):
+    __slots__ = ("value",)
+
     def __init__(self, startPosition: Position, value: str):
         super().__init__(startPosition)
         self.value = value
@@ -145,10 +177,13 @@ class LiteralString(Literal):
 
 
 class LiteralSubscriptable(Literal):
+    __slots__ = ("value", "subscript", "slot")
+
     def __init__(self, startPosition: Position, value: str, subscript: Expression):
         super().__init__(startPosition)
         self.value = value
         self.subscript = subscript
+        self.slot: Optional[Slot] = None
 
     def __repr__(self):
         return f"(LiteralSubscriptable:{self.value} Subscript:{self.subscript})"
@@ -165,6 +200,8 @@ class LiteralSubscriptable(Literal):
 
 
 class PrimaryExpression(Expression):
+    __slots__ = ("isNegated", "literal")
+
     def __init__(self, startPosition: Position, isNegated: bool, literal: Expression):
         super().__init__(startPosition)
         self.isNegated = isNegated
@@ -185,6 +222,8 @@ class PrimaryExpression(Expression):
 
 
 class MultiplicativeExpression(Expression):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, right: Expression, operator: LiteralType["*", "/"]):  # noqa: F722
         super().__init__(left.startPosition)
         self.left = left
@@ -207,6 +246,8 @@ class MultiplicativeExpression(Expression):
 
 
 class AdditiveExpression(Expression):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(
         self,
         left: Expression,
@@ -237,6 +278,8 @@ ComparisonOperator = LiteralType["<", ">", "<=", ">=", "==", "!="]  # noqa: F722
 
 
 class ComparisonExpression(Expression):
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, right: Expression, operator: ComparisonOperator):
         super().__init__(left.startPosition)
         self.left = left
@@ -259,6 +302,8 @@ class ComparisonExpression(Expression):
 
 
 class LogicalAndExpression(Expression):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left.startPosition)
         self.left = left
@@ -279,6 +324,8 @@ class LogicalAndExpression(Expression):
 
 
 class LogicalOrExpression(Expression):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: Expression, right: Expression):
         super().__init__(left.startPosition)
         self.left = left
@@ -299,6 +346,8 @@ class LogicalOrExpression(Expression):
 
 
 class LemonList(Node):
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Expression]) -> None:
         self.values = values
 
@@ -314,9 +363,12 @@ class LemonList(Node):
 
 # Block = LeftBrace StatementWithoutFunciton* RightBrace
 class BlockWithoutFunciton(Node):
+    __slots__ = ("startPosition", "statements", "scope")
+
     def __init__(self, startPosition: Position, statements: List["StatementWithoutFunction"]) -> None:
         self.startPosition = startPosition
         self.statements = statements
+        self.scope: Optional[Scope] = None
 
     def __repr__(self):
         return f"(BlockWithoutFunciton:{self.statements} {self.startPosition})"
@@ -330,6 +382,8 @@ class BlockWithoutFunciton(Node):
 
 # ConditionWithBlock = Condition Block
 class ConditionWithBlock(Node):
+    __slots__ = ("condition", "block")
+
     def __init__(self, condition: Expression, block: BlockWithoutFunciton) -> None:
         self.condition = condition
         self.block = block
@@ -346,6 +400,8 @@ class ConditionWithBlock(Node):
 
 # IfStatement = "if" ConditionWithBlock ( "elif" ConditionWithBlock )* ( "else" Block )? ;
 class IfStatement(Node):
+    __slots__ = ("startPosition", "ifCB", "elifCBs", "elseBlock")
+
     def __init__(
         self,
         startPosition: Position,
@@ -374,11 +430,14 @@ class IfStatement(Node):
 
 
 class FunctionDefinition(Node):
+    __slots__ = ("position", "name", "parameters", "body", "scope")
+
     def __init__(self, position: Position, name: str, parameters: List[str], body: BlockWithoutFunciton):
         self.position = position
         self.name = name
         self.parameters = parameters
         self.body = body
+        self.scope: Optional[Scope] = None
 
     def __repr__(self):
         return f"(Function:{self.name} Args:{self.parameters} Body:{self.body})"
@@ -391,6 +450,8 @@ class FunctionDefinition(Node):
 
 
 class VariableDeclaration(Node):
+    __slots__ = ("startPosition", "assignment")
+
     def __init__(self, startPosition: Position, assignment: Assignment):
         self.startPosition = startPosition
         self.assignment = assignment
@@ -406,6 +467,8 @@ class VariableDeclaration(Node):
 
 
 class ReturnStatement(Node):
+    __slots__ = ("startPosition", "expression")
+
     def __init__(self, startPosition: Position, expression: Expression):
         self.startPosition = startPosition
         self.expression = expression
@@ -421,23 +484,30 @@ class ReturnStatement(Node):
 
 
 class WhileOperation(Node):
-    pass
+    __slots__ = ()
 
 
 class Break(WhileOperation):
+    __slots__ = ()
+
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, Break)
 
 
 class Continue(WhileOperation):
+    __slots__ = ()
+
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, Continue)
 
 
 class WhileBlock(Node):
+    __slots__ = ("startPosition", "statements", "scope")
+
     def __init__(self, startPosition: Position, statements: List["StatementWithoutFunction | WhileOperation"]) -> None:
         self.startPosition = startPosition
         self.statements = statements
+        self.scope: Optional[Scope] = None
 
     def __repr__(self):
         return f"(WhileBlock:{self.statements} {self.startPosition})"
@@ -451,6 +521,8 @@ class WhileBlock(Node):
 
 # WhileLoop = "while" Condition WhileBlock ;
 class WhileLoop(Node):
+    __slots__ = ("startPosition", "condition", "block")
+
     def __init__(self, startPosition: Position, condition: Expression, block: WhileBlock) -> None:
         self.startPosition = startPosition
         self.condition = condition
@@ -472,6 +544,8 @@ class WhileLoop(Node):
 
 # ForEachLoop = "foreach" Identifier "in" Identifier WhileBlock ;
 class ForEachLoop(Node):
+    __slots__ = ("startPosition", "identifier", "iterable", "block")
+
     def __init__(self, startPosition: Position, identifier: str, iterable: Expression, block: WhileBlock) -> None:
         self.startPosition = startPosition
         self.identifier = identifier
@@ -508,6 +582,8 @@ class ObjectType(Enum):
 
 # ObjectConstructor = ObjectType LeftParenthesis Arguments RightParenthesis ;
 class ObjectConstructor(Node):
+    __slots__ = ("startPosition", "objectType", "arguments")
+
     def __init__(self, startPosition: Position, objectType: ObjectType, arguments: List[Argument]) -> None:
         self.startPosition = startPosition
         self.objectType = objectType
@@ -525,10 +601,13 @@ class ObjectConstructor(Node):
 
 # ObjectMethodCall = Identifier "." FunctionCall ;
 class ObjectMethodCall(Literal):
+    __slots__ = ("identifier", "functionCall", "slot")
+
     def __init__(self, startPosition: Position, identifier: str, functionCall: FunctionCall) -> None:
         super().__init__(startPosition)
         self.identifier = identifier
         self.functionCall = functionCall
+        self.slot: Optional[Slot] = None
 
     def __repr__(self):
         return f"(ObjectMethodCall:{self.identifier} {self.functionCall})"
@@ -546,6 +625,8 @@ class ObjectMethodCall(Literal):
 
 # ObjectProperty = Identifier "." Identifier ;
 class ObjectProperty(Literal):
+    __slots__ = ("identifier", "property")
+
     def __init__(self, startPosition: Position, identifier: str, property: str) -> None:
         super().__init__(startPosition)
         self.identifier = identifier
@@ -561,8 +642,10 @@ class ObjectProperty(Literal):
             return False
 
 
+# A block is a statement of its own only where the constant folder replaced an if statement with its else block
 StatementWithoutFunction = (
     Expression
+    | BlockWithoutFunciton
     | IfStatement
     | Assignment
     | FunctionCall
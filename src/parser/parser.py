@@ -1,6 +1,7 @@
-from typing import List, Optional, cast
+from typing import Callable, Iterator, List, Optional, cast
 from common.errors import ParserError
 from lexer.lexer import Lexer
+from lexer.token_table import TokenTable
 from parser.nodes import (
     AdditiveExpression,
     Argument,
@@ -42,64 +43,115 @@ from parser.nodes import (
 )
 from lexer.token_type import TokenType
 from lexer.tokens import Position, Token
+from parser.token_stream import TokenStream
+
+# Tokens every expression can start with, the first set of Expression
+EXPRESSION_START = (
+    TokenType.VT_BOOLEAN,
+    TokenType.VT_INT,
+    TokenType.VT_FLOAT,
+    TokenType.VT_STRING,
+    TokenType.VT_ID,
+    TokenType.T_NOT,
+    TokenType.T_MINUS,
+    TokenType.T_LPARENT,
+)
+
+OBJECT_TYPES: dict[TokenType, ObjectType] = {
+    TokenType.T_CUBOID: ObjectType.CUBOID,
+    TokenType.T_PYRAMID: ObjectType.PYRAMID,
+    TokenType.T_CONE: ObjectType.CONE,
+    TokenType.T_CYLINDER: ObjectType.CYLINDER,
+    TokenType.T_SPHERE: ObjectType.SPHERE,
+    TokenType.T_TETRAHEDRON: ObjectType.TETRAHEDRON,
+}
+
+LITERAL_TYPES: dict[TokenType, type[LiteralBool | LiteralInt | LiteralFloat | LiteralString]] = {
+    TokenType.VT_BOOLEAN: LiteralBool,
+    TokenType.VT_INT: LiteralInt,
+    TokenType.VT_FLOAT: LiteralFloat,
+    TokenType.VT_STRING: LiteralString,
+}
+
+MULTIPLICATIVE_OPERATORS = {TokenType.T_MUL: "*", TokenType.T_DIV: "/"}
+ADDITIVE_OPERATORS = {TokenType.T_PLUS: "+", TokenType.T_MINUS: "-"}
+COMPARISON_OPERATORS = frozenset(
+    (
+        TokenType.T_LESS,
+        TokenType.T_GREATER,
+        TokenType.T_LESS_OR_EQ,
+        TokenType.T_GREATER_OR_EQ,
+        TokenType.T_EQ,
+        TokenType.T_NOT_EQ,
+    )
+)
 
 
 class Parser:
-    def __init__(self, lexer: Lexer, tokens: Optional[List[Token]] = None) -> None:
+    def __init__(self, lexer: Lexer, tokens: Optional[List[Token] | TokenTable] = None) -> None:
         self.lexer = lexer
-        self.token = tokens[0] if tokens else lexer.getNextToken()
-        self.nextToken: Optional[Token] = None
-        self.tokens = tokens
-        if tokens is not None:
-            self.nextLexerToken()
+        self.stream = TokenStream(lexer, tokens)
+        self.token = self.stream.peek()
+        # Tokens skipped because no statement starts with them
+        self.unexpectedTokens = 0
+        # Every statement and value starts with a token no other one starts with, so the current token alone picks
+        # the one method that can parse it (LL(1)), instead of each method in turn checking the token again
+        self.statementParsers: dict[TokenType, Callable[[], Optional[StatementWithoutFunction]]] = {
+            TokenType.VT_ID: self.parseStartingWithIdentifier,
+            TokenType.T_FOREACH: self.parseForEachLoop,
+            **{tokenType: self.parseExpression for tokenType in EXPRESSION_START if tokenType != TokenType.VT_ID},
+            TokenType.T_IF: self.parseIfStatement,
+            TokenType.T_VARIABLE: self.parseVariableDeclaration,
+            TokenType.T_RETURN: self.parseReturnStatement,
+            TokenType.T_WHILE: self.parseWhileLoop,
+        }
+        self.topLevelParsers: dict[TokenType, Callable[[], Optional[Statement]]] = {
+            **self.statementParsers,
+            TokenType.T_FUNCTION: self.parseFunctionDefinition,
+        }
+        self.loopStatementParsers: dict[TokenType, Callable[[], Optional[StatementWithoutFunction | WhileOperation]]] = {
+            **self.statementParsers,
+            TokenType.T_BREAK: self.parseWhileOperation,
+            TokenType.T_CONTINUE: self.parseWhileOperation,
+        }
+        self.valueParsers: dict[TokenType, Callable[[], Optional[ObjectConstructor | Expression | LemonList]]] = {
+            **{tokenType: self.parseObjectConstructor for tokenType in OBJECT_TYPES},
+            **{tokenType: self.parseExpression for tokenType in EXPRESSION_START},
+            TokenType.T_LSQBRACKET: self.parseList,
+        }
 
     def nextLexerToken(self) -> None:
-        if self.nextToken is not None:
-            self.token = self.nextToken
-            self.nextToken = None
-        else:
-            if self.tokens:
-                if len(self.tokens) > 0:
-                    self.token = self.tokens.pop(0)
-                else:
-                    self.token = Token(TokenType.VT_EOF, self.token.startPosition)
-            else:
-                self.token = self.lexer.getNextToken()
+        self.token = self.stream.advance()
 
-    def peekNextLexerToken(self) -> None:
-        if self.nextToken is None:
-            if self.tokens:
-                if len(self.tokens) > 0:
-                    self.nextToken = self.tokens.pop(0)
-                else:
-                    self.nextToken = Token(TokenType.VT_EOF, self.token.startPosition)
-            else:
-                self.nextToken = self.lexer.getNextToken()
+    def peekNextLexerToken(self, offset: int = 1) -> Token:
+        return self.stream.peek(offset)
 
     def parse(self) -> List:
-        objects = []
+        return list(self.parseStatements())
+
+    def parseStatements(self) -> Iterator[Statement]:
+        # Top-level statements one at a time, the next one is parsed only when it's requested
         while self.token.type != TokenType.VT_EOF:
             node = self.parseStatement()
             if node is not None:
-                objects.append(node)
+                yield node
             else:
                 print(f"Unexpected token {self.token}")
+                self.unexpectedTokens += 1
                 self.nextLexerToken()
-        return objects
 
     def parseStatement(self) -> Optional[Statement]:
-        return self.parseStatementWithoutFunction() or self.parseFunctionDefinition()
+        parse = self.topLevelParsers.get(self.token.type)
+        return parse() if parse is not None else None
 
     def parseStatementWithoutFunction(self) -> Optional[StatementWithoutFunction]:
-        return (
-            self.parseStartingWithIdentifier()
-            or self.parseForEachLoop()
-            or self.parseExpression()
-            or self.parseIfStatement()
-            or self.parseVariableDeclaration()
-            or self.parseReturnStatement()
-            or self.parseWhileLoop()
-        )
+        parse = self.statementParsers.get(self.token.type)
+        return parse() if parse is not None else None
+
+    # Value = ObjectConstructor | Expression | List ;
+    def parseValue(self) -> Optional[ObjectConstructor | Expression | LemonList]:
+        parse = self.valueParsers.get(self.token.type)
+        return parse() if parse is not None else None
 
     def parseParameters(self) -> Optional[List[str]]:
         parameters = []
@@ -156,18 +208,10 @@ class Parser:
             return None
         self.nextLexerToken()
 
-        objectConstructor = self.parseObjectConstructor()
-        if objectConstructor is not None:
-            return Assignment(position, name, objectConstructor)
-
-        expression = self.parseExpression()
-        if expression is not None:
-            return Assignment(position, name, expression)
-
-        list = self.parseList()
-        if list is not None:
-            return Assignment(position, name, list)
-        return None
+        value = self.parseValue()
+        if value is None:
+            return None
+        return Assignment(position, name, value)
 
     def parseArgument(self) -> Optional[Argument]:
         if self.token.type != TokenType.VT_ID:
@@ -180,19 +224,12 @@ class Parser:
             return None
         self.nextLexerToken()
 
-        objectConstructor = self.parseObjectConstructor()
-        if objectConstructor is not None:
-            return Argument(position, name, objectConstructor)
-
-        expression = self.parseExpression()
-        if expression is not None:
-            return Argument(position, name, expression)
-
-        list = self.parseList()
-        if list is not None:
+        value = self.parseValue()
+        if value is None:
+            return None
+        if isinstance(value, LemonList):
             self.nextLexerToken()
-            return Argument(position, name, list)
-        return None
+        return Argument(position, name, value)
 
     def parseArguments(self) -> Optional[List[Argument]]:
         arguments = []
@@ -302,19 +339,11 @@ class Parser:
     # Literal = Identifier | Boolean | Number | Subscriptable ;
     def parseLiteral(self) -> Optional[Literal]:
         token = self.token
-        if self.token.type == TokenType.VT_BOOLEAN:
-            self.nextLexerToken()
-            return LiteralBool(token.startPosition, token.getValue())
-        if self.token.type == TokenType.VT_INT:
-            self.nextLexerToken()
-            return LiteralInt(token.startPosition, token.getValue())
-        if self.token.type == TokenType.VT_FLOAT:
+        literalType = LITERAL_TYPES.get(token.type)
+        if literalType is not None:
             self.nextLexerToken()
-            return LiteralFloat(token.startPosition, token.getValue())
-        if self.token.type == TokenType.VT_STRING:
-            self.nextLexerToken()
-            return LiteralString(token.startPosition, token.getValue())
-        if self.token.type == TokenType.VT_ID:
+            return literalType(token.startPosition, token.getValue())
+        if token.type == TokenType.VT_ID:
             self.nextLexerToken()
             subscriptable = self.parseSubscriptable(token)
             if subscriptable is not None:
@@ -367,8 +396,8 @@ class Parser:
         left = self.parsePrimaryExpression()
         if left is None:
             return None
-        if self.isType(TokenType.T_MUL, TokenType.T_DIV) and self.isNextSameLine(left.startPosition):
-            operator = "*" if self.token.type == TokenType.T_MUL else "/"
+        operator = MULTIPLICATIVE_OPERATORS.get(self.token.type)
+        if operator is not None and self.isNextSameLine(left.startPosition):
             self.nextLexerToken()
             right = self.parseMultiplicativeExpression()
             if right is None:
@@ -381,8 +410,8 @@ class Parser:
         left = self.parseMultiplicativeExpression()
         if left is None:
             return None
-        if self.isType(TokenType.T_PLUS, TokenType.T_MINUS) and self.isNextSameLine(left.startPosition):
-            operator = "+" if self.token.type == TokenType.T_PLUS else "-"
+        operator = ADDITIVE_OPERATORS.get(self.token.type)
+        if operator is not None and self.isNextSameLine(left.startPosition):
             self.nextLexerToken()
             right = self.parseAdditiveExpression()
             if right is None:
@@ -395,14 +424,7 @@ class Parser:
         left = self.parseAdditiveExpression()
         if left is None:
             return None
-        if self.isType(
-            TokenType.T_LESS,
-            TokenType.T_GREATER,
-            TokenType.T_LESS_OR_EQ,
-            TokenType.T_GREATER_OR_EQ,
-            TokenType.T_EQ,
-            TokenType.T_NOT_EQ,
-        ) and self.isNextSameLine(left.startPosition):
+        if self.token.type in COMPARISON_OPERATORS and self.isNextSameLine(left.startPosition):
             operator = cast(ComparisonOperator, self.token.type.value)
             self.nextLexerToken()
             right = self.parseComparisonExpression()
@@ -526,7 +548,8 @@ class Parser:
         return None
 
     def parseStatementForWhileLoop(self) -> Optional[StatementWithoutFunction | WhileOperation]:
-        return self.parseStatementWithoutFunction() or self.parseWhileOperation()
+        parse = self.loopStatementParsers.get(self.token.type)
+        return parse() if parse is not None else None
 
     def parseWhileBlock(self) -> Optional[WhileBlock]:
         if not self.isType(TokenType.T_LBRACKET):
@@ -584,19 +607,8 @@ class Parser:
 
     # ObjectConstructor = ObjectType LeftParenthesis Arguments RightParenthesis ;
     def parseObjectConstructor(self) -> Optional[ObjectConstructor]:
-        if self.isType(TokenType.T_CUBOID):
-            objectType = ObjectType.CUBOID
-        elif self.isType(TokenType.T_PYRAMID):
-            objectType = ObjectType.PYRAMID
-        elif self.isType(TokenType.T_CONE):
-            objectType = ObjectType.CONE
-        elif self.isType(TokenType.T_CYLINDER):
-            objectType = ObjectType.CYLINDER
-        elif self.isType(TokenType.T_SPHERE):
-            objectType = ObjectType.SPHERE
-        elif self.isType(TokenType.T_TETRAHEDRON):
-            objectType = ObjectType.TETRAHEDRON
-        else:
+        objectType = OBJECT_TYPES.get(self.token.type)
+        if objectType is None:
             return None
         startPosition = self.token.startPosition
         self.nextLexerToken()
@@ -0,0 +1,43 @@
+from typing import List, Optional
+from lexer.lexer import Lexer
+from lexer.token_table import TokenTable
+from lexer.token_type import TokenType
+from lexer.tokens import Token
+
+# Number of consumed tokens a lexer backed stream keeps before dropping them from its buffer
+COMPACT_THRESHOLD = 1024
+
+
+class TokenStream:
+    """
+    Cursor over the tokens of a lexer or of an already lexed list or token table, with lookahead of any number of
+    tokens. Tokens of the lexer are buffered only until they're consumed, already lexed ones are read in place.
+    """
+
+    def __init__(self, lexer: Lexer, tokens: Optional[List[Token] | TokenTable] = None) -> None:
+        self.lexer = lexer
+        self.isPreLexed = tokens is not None
+        self.tokens: List[Token] | TokenTable = tokens if tokens is not None else []
+        self.index = 0
+
+    def peek(self, offset: int = 0) -> Token:
+        position = self.index + offset
+        tokens = self.tokens
+        while position >= len(tokens):
+            if self.isPreLexed:
+                return self.endOfTokens()
+            tokens.append(self.lexer.getNextToken())
+        return tokens[position]
+
+    def advance(self) -> Token:
+        self.index += 1
+        if not self.isPreLexed and self.index >= COMPACT_THRESHOLD:
+            del self.tokens[: self.index]  # type: ignore
+            self.index = 0
+        return self.peek()
+
+    def endOfTokens(self) -> Token:
+        if self.tokens and self.tokens[-1].type == TokenType.VT_EOF:
+            return self.tokens[-1]
+        position = self.tokens[-1].startPosition if self.tokens else self.lexer.source.getPosition()
+        return Token(TokenType.VT_EOF, position)
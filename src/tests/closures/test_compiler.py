@@ -0,0 +1,51 @@
+import pytest
+from closures.interpreter import ClosureInterpreter
+from common.errors import InterpreterError
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.parser import Parser
+
+
+def getEngine(code: str) -> tuple[ClosureInterpreter, list]:
+    parser = Parser(Lexer(StringSource(code)))
+    engine = ClosureInterpreter(parser)
+    nodes = parser.parse()
+    engine.resolver.resolve(nodes)
+    return engine, nodes
+
+
+class TestClosureCompiler:
+    def testExpressionIsCompiledOnce(self):
+        engine, nodes = getEngine("let a = 2 * 3 - 1")
+        value = engine.compiler.compile(nodes[0].assignment.value)
+
+        assert value() == 5
+        assert value() == 5
+
+    def testClosureReadsCurrentContext(self):
+        engine, nodes = getEngine("let a = 1\nlet b = a + 1")
+        engine.execute(nodes[0])
+        expression = engine.compiler.compile(nodes[1].assignment.value)
+
+        assert expression() == 2
+        engine.context.set("a", 41, nodes[0].startPosition)
+        assert expression() == 42
+
+    def testUnsupportedOperatorFailsWhenEvaluated(self, capfd):
+        engine, nodes = getEngine("let a = 1 + 2")
+        nodes[0].assignment.value.operator = "%"
+        declaration = engine.compiler.compile(nodes[0])
+
+        out, _ = capfd.readouterr()
+        assert out == ""
+        with pytest.raises(InterpreterError) as error:
+            declaration()
+        assert "Operator % is not supported" in str(error.value)
+
+    def testFunctionBodyIsCompiledOnce(self):
+        engine, _ = getEngine("")
+        engine.parser = Parser(Lexer(StringSource("function f(a) {\n    return a + 1\n}\nlet b = f(a=1)\nlet c = f(a=b)")))
+        engine.interpret()
+
+        assert len(engine.functions) == 1
+        assert engine.context.local_values["c"][0] == 3
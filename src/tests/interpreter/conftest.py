@@ -0,0 +1,12 @@
+import pytest
+from . import interpreter_utils
+from closures.interpreter import ClosureInterpreter
+from interpreter.interpreter import Interpreter
+from vm.machine import VirtualMachine
+
+
+@pytest.fixture(autouse=True, params=[Interpreter, VirtualMachine, ClosureInterpreter], ids=["tree", "vm", "closures"])
+def engine(request, monkeypatch):
+    # Every interpreter test runs against each execution engine
+    monkeypatch.setattr(interpreter_utils, "ENGINE", request.param)
+    return request.param
@@ -5,6 +5,8 @@ from parser.nodes import Node
 from parser.parser import Parser
 from lexer.source import StringSource
 
+ENGINE: type[Interpreter] = Interpreter
+
 
 class ParserMock(Parser):
     def __init__(self, nodes: List[Node]) -> None:
@@ -18,7 +20,7 @@ class ParserMock(Parser):
 
 def getInterpreter(nodes: List[Node]) -> Interpreter:
     parser = ParserMock(nodes=nodes)
-    interpreter = Interpreter(parser)
+    interpreter = ENGINE(parser)
     interpreter.interpret()
     return interpreter
 
@@ -27,3 +29,9 @@ def assertNoOutput(capfd):
     out, err = capfd.readouterr()
     assert out == ""
     assert err == ""
+
+
+def getInterpreterFromCode(code: str, streaming: bool = False) -> Interpreter:
+    interpreter = ENGINE(Parser(Lexer(StringSource(code))))
+    interpreter.interpret(streaming)
+    return interpreter
@@ -0,0 +1,43 @@
+from interpreter.objects import Cuboid, Cylinder
+from .interpreter_utils import getInterpreterFromCode
+
+
+class TestAggregates:
+    def testAggregates(self, capfd):
+        code = """let a = Cylinder(radius=1, height=2)
+let b = Cuboid(width=1, length=2, height=3)
+let solids = [a, b]
+let total = sumVolume(objects=solids)
+let largest = maxSurfaceArea(objects=solids)
+let cuboids = [b, b]
+let smallest = minVolume(objects=cuboids)
+let empty = []
+let nothing = sumSurfaceArea(objects=empty)"""
+        interpreter = getInterpreterFromCode(code)
+        values = {name: value for name, (value, _) in interpreter.context.local_values.items()}
+        cylinder, cuboid = Cylinder(radius=1, height=2), Cuboid(width=1, length=2, height=3)
+
+        assert values["total"] == 0 + cylinder.getVolume() + cuboid.getVolume()
+        assert values["largest"] == max(cylinder.getSurfaceArea(), cuboid.getSurfaceArea())
+        assert values["smallest"] == 6
+        assert values["nothing"] == 0
+        out, _ = capfd.readouterr()
+        assert out == ""
+
+    def testAggregateErrors(self, capfd):
+        code = """let empty = []
+let a = maxVolume(objects=empty)"""
+        getInterpreterFromCode(code)
+        code = """let numbers = [1, 2]
+let a = sumVolume(objects=numbers)"""
+        getInterpreterFromCode(code)
+        code = """let solids = []
+let a = sumVolume(solids=solids)"""
+        getInterpreterFromCode(code)
+
+        out, _ = capfd.readouterr()
+        assert out == (
+            "TypeError: maxVolume() requires a non-empty list of objects\n"
+            "TypeError: sumVolume() requires a list of objects, <class 'list'> was given\n"
+            'TypeError: sumVolume() requires "objects" argument but "solids" was given\n'
+        )
@@ -0,0 +1,68 @@
+import pytest
+from common.errors import CriticalInterpreterError
+from interpreter.context import Context
+from lexer.tokens import Position
+
+POSITION = Position(0, 0)
+
+
+class TestContext:
+    def testGetFromParent(self):
+        root = Context()
+        root.declare("a", 1, POSITION)
+        child = Context(Context(root))
+
+        assert child.get("a", POSITION) == 1
+        assert child.get("a", POSITION) == 1
+        assert child.resolved == {"a": root}
+
+    def testSetThroughResolvedParent(self):
+        root = Context()
+        root.declare("a", 1, POSITION)
+        child = Context(root)
+        child.get("a", POSITION)
+        child.set("a", 2, Position(1, 0))
+
+        assert root == {"a": (2, Position(1, 0))}
+        assert child == {}
+
+    def testShadowingAfterResolve(self):
+        root = Context()
+        root.declare("a", 1, POSITION)
+        child = Context(root)
+        assert child.get("a", POSITION) == 1
+
+        child.declare("a", 2, POSITION)
+        assert child.get("a", POSITION) == 2
+        assert root.get("a", POSITION) == 1
+
+    def testNotDefined(self):
+        child = Context(Context())
+
+        with pytest.raises(CriticalInterpreterError) as error:
+            child.get("a", POSITION)
+        assert str(error.value) == "InterpreterError: Variable a at [Line 0, Column 0] is not defined"
+
+    def testManyGlobals(self):
+        root = Context()
+        for i in range(1000):
+            root.declare(f"v{i}", i, POSITION)
+        child = Context(root)
+
+        assert child.get("v999", POSITION) == 999
+        assert not child.isNameAvailable("v500")
+        assert child.isNameAvailable("v1000")
+
+    def testReset(self):
+        root = Context()
+        root.declare("a", 1, POSITION)
+        frame = Context(root)
+        frame.declare("b", 2, POSITION)
+        assert frame.get("a", POSITION) == 1
+
+        frame.reset()
+        assert frame == {}
+        assert frame.isNameAvailable("b")
+        frame.declare("b", 3, POSITION)
+        assert frame.get("b", POSITION) == 3
+        assert frame.get("a", POSITION) == 1
@@ -0,0 +1,77 @@
+from interpreter.folding import ConstantFolder
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.nodes import AdditiveExpression, BlockWithoutFunciton, IfStatement, LiteralBool, LiteralFloat, LiteralInt
+from parser.parser import Parser
+from .interpreter_utils import getInterpreterFromCode
+
+
+def fold(code: str) -> list:
+    return ConstantFolder().fold(Parser(Lexer(StringSource(code))).parse())
+
+
+class TestFolding:
+    def testArithmetic(self):
+        nodes = fold("let a = 2 + 3 * 4\nlet b = 10 / 4\nlet c = -(2 - 5)\nlet d = 1 < 2 and not false")
+
+        assert [type(node.assignment.value) for node in nodes] == [LiteralInt, LiteralFloat, LiteralInt, LiteralBool]
+        assert [node.assignment.value.value for node in nodes] == [14, 2.5, 3, True]
+
+    def testErrorsAreKept(self, capfd):
+        code = """let a = 1 + "a"
+let b = 2 * 3"""
+        nodes = fold(code)
+        getInterpreterFromCode(code)
+
+        assert type(nodes[0].assignment.value) == AdditiveExpression
+        assert nodes[1].assignment.value.value == 6
+        out, _ = capfd.readouterr()
+        assert out == "TypeError: Unsupported operand type(s) for +: '<class 'int'>' and '<class 'str'>'\n"
+
+    def testDeadBranches(self):
+        code = """if (2 > 3) {
+    let a = 1
+} elif (x) {
+    let b = 2
+} elif (true) {
+    let c = 3
+} elif (y) {
+    let d = 4
+} else {
+    let e = 5
+}
+if (false) {
+    let f = 6
+}
+if (1 == 2) {
+    let g = 7
+} else {
+    let h = 8
+}"""
+        nodes = fold(code)
+
+        assert len(nodes) == 2
+        assert type(nodes[0]) == IfStatement
+        assert nodes[0].ifCB.block.statements[0].assignment.name == "b"
+        assert [branch.block.statements[0].assignment.name for branch in nodes[0].elifCBs] == ["c"]
+        assert nodes[0].elseBlock is None
+        assert type(nodes[1]) == BlockWithoutFunciton
+        assert nodes[1].statements[0].assignment.name == "h"
+
+    def testFoldedProgram(self, capfd):
+        code = """function area(r) {
+    if (1 < 2) {
+        return r * 2 * 3
+    }
+    return 0
+}
+if (false) {
+    print(out="never")
+} else {
+    let value = area(r=2) + 1
+}
+print(out=value)"""
+        getInterpreterFromCode(code)
+
+        out, _ = capfd.readouterr()
+        assert out == "13\n"
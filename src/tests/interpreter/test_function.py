@@ -1,4 +1,4 @@
-from .interpreter_utils import assertNoOutput, getInterpreter
+from .interpreter_utils import assertNoOutput, getInterpreter, getInterpreterFromCode
 from parser.nodes import (
     AdditiveExpression,
     Argument,
@@ -345,3 +345,65 @@ class TestFunction:
 
         assert interpreter.context == {}
         assert capfd.readouterr().out == "test\n"
+
+    def testArgumentBinding(self, capfd):
+        code = """function area(width, height) {
+    return width * height
+}
+let total = 0
+let i = 0
+while (i < 3) {
+    total = total + area(height=i, width=2)
+    i = i + 1
+}
+let missing = area(width=1, length=2)"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.context.local_values["total"][0] == 6
+        out, _ = capfd.readouterr()
+        assert out.startswith("InterpreterError: Function area requires height argument")
+
+    def testOnlyReturnEndsFunction(self, capfd):
+        code = """function one() {
+    return 1
+}
+function two() {
+    one()
+    return 2
+}
+function firstAbove(limit) {
+    let i = 0
+    while (true) {
+        let values = [1, 2, 3]
+        foreach (value in values) {
+            if (i * value > limit) {
+                return i * value
+            }
+        }
+        i = i + 1
+    }
+    return 0
+}
+print(out=two())
+print(out=firstAbove(limit=10))
+if (true) {
+    return 1
+    print(out=3)
+}
+print(out=4)"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "2\n12\n4\n"
+
+    def testArgumentsEvaluatedInParameterOrder(self, capfd):
+        code = """function p(x) {
+    print(out=x)
+    return x
+}
+function f(a, b) {
+    return a + b
+}
+print(out=f(b=p(x=1), a=p(x=2)))"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "2\n1\n3\n"
@@ -1,5 +1,6 @@
 from interpreter.objects import Cuboid, Cylinder
-from .interpreter_utils import assertNoOutput, getInterpreter
+from .interpreter_utils import assertNoOutput, getInterpreter, getInterpreterFromCode
+from interpreter.lists import TypedList
 from parser.nodes import (
     Argument,
     Assignment,
@@ -160,3 +161,49 @@ class TestList:
             "cylinder": (cylinder, POSITION),
         }
         assertNoOutput(capfd)
+
+    def testCompactLists(self, capfd):
+        code = """let a = [1, 2, 3]
+let b = [1.5, 2.5]
+let c = [true, false]
+let d = ["a", "b"]
+print(out=a[1] + b[0])
+print(out=c[1])
+print(out=c)
+foreach (value in c) {
+    print(out=not value)
+}"""
+        interpreter = getInterpreterFromCode(code)
+        values = {name: value for name, (value, _) in interpreter.context.local_values.items()}
+
+        assert type(values["a"]) == TypedList
+        assert type(values["b"]) == TypedList
+        assert type(values["c"]) == TypedList
+        assert type(values["d"]) == list
+        out, _ = capfd.readouterr()
+        assert out == "3.5\nFalse\n[True, False]\nFalse\nTrue\n"
+
+    def testCompactListAssignment(self, capfd):
+        code = """let a = []
+a = [1, 2]
+let e = [3]
+let b = [a, e]
+let f = b[0]
+print(out=f[1])
+let m = [1, true]
+print(out=m)
+let big = 2147483647 * 2147483647 * 4
+let c = [big, 1]
+print(out=c)"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.context.local_values["a"][0] == [1, 2]
+        out, _ = capfd.readouterr()
+        assert out == "2\n[1, True]\n[18446744056529682436, 1]\n"
+
+    def testSignedZeros(self, capfd):
+        code = """let c = [-0.0, 0.0]
+print(out=c)"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "[-0.0, 0.0]\n"
@@ -1,4 +1,4 @@
-from .interpreter_utils import assertNoOutput, getInterpreter
+from .interpreter_utils import assertNoOutput, getInterpreter, getInterpreterFromCode
 from parser.nodes import (
     AdditiveExpression,
     Argument,
@@ -234,3 +234,64 @@ class TestLoops:
 
         assert capfd.readouterr().out == "1\n2\n3\n"
         assert interpreter.context == {"a": ([1, 2, 3], POSITION)}
+
+    def testIterationsDeclareFreshVariables(self, capfd):
+        code = """let total = 0
+let i = 0
+while (i < 3) {
+    let square = i * i
+    total = total + square
+    i = i + 1
+}
+let elements = [1, 2, 3]
+foreach (element in elements) {
+    let double = element * 2
+    print(out=double)
+}"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "2\n4\n6\n"
+        assert interpreter.context.local_values["total"][0] == 5
+
+    def testLoopFrameWithCallsAndNesting(self, capfd):
+        code = """function count(n) {
+    let found = 0
+    let elements = [1, 2, 3]
+    foreach (element in elements) {
+        if (element <= n) {
+            found = found + 1
+        }
+    }
+    return found
+}
+let i = 0
+while (i < 3) {
+    let inner = 0
+    while (inner < 2) {
+        let value = count(n=i) + inner
+        print(out=value)
+        inner = inner + 1
+    }
+    i = i + 1
+}"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "0\n1\n1\n2\n2\n3\n"
+
+    def testNestedBreakAndContinue(self, capfd):
+        code = """let i = 0
+while (i < 3) {
+    i = i + 1
+    while (true) {
+        let j = i * 10
+        print(out=j)
+        break
+        print(out=100)
+    }
+    continue
+    print(out=200)
+}
+print(out=i)"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "10\n20\n30\n3\n"
@@ -0,0 +1,158 @@
+from interpreter.memo import MISSING, MemoCache, memoKey
+from .interpreter_utils import getInterpreterFromCode
+
+
+class TestMemo:
+    def testPureRecursiveFunction(self, capfd):
+        code = """function fib(n) {
+    if (n < 2) {
+        return n
+    }
+    return fib(n=n - 1) + fib(n=n - 2)
+}
+let a = fib(n=30)
+let b = fib(n=30)"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.context.local_values["a"][0] == 832040
+        assert interpreter.context.local_values["b"][0] == 832040
+        assert interpreter.memoStatistics() == {"fib": (29, 31)}
+        out, _ = capfd.readouterr()
+        assert out == ""
+
+    def testImpureFunctions(self, capfd):
+        code = """let total = 0
+function loud(n) {
+    print(out=n)
+    return n
+}
+function outerRead(n) {
+    return n + total
+}
+function outerWrite(n) {
+    total = total + n
+    return total
+}
+function property(n) {
+    let c = Cylinder(radius=1, height=2)
+    c.radius = n
+    return n
+}
+function callsLoud(n) {
+    return loud(n=n)
+}
+function display(n) {
+    let c = Cylinder(radius=1, height=2)
+    c.display()
+    return n
+}
+let i = 0
+while (i < 2) {
+    let a = loud(n=1)
+    let b = outerRead(n=1)
+    let c = outerWrite(n=1)
+    let d = property(n=1)
+    let e = callsLoud(n=2)
+    let f = display(n=3)
+    i = i + 1
+}"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.memoStatistics() == {}
+        assert interpreter.context.local_values["total"][0] == 2
+        out, _ = capfd.readouterr()
+        assert out == "1\n2\nCylinder: radius=1 height=2\n" * 2
+
+    def testPureFunctionWithLocals(self, capfd):
+        code = """function area(r, h) {
+    let c = Cylinder(radius=r, height=h)
+    let total = 0.0
+    let values = [1, 2]
+    foreach (value in values) {
+        total = total + c.getBaseArea()
+    }
+    return total + c.getSurfaceArea()
+}
+let a = area(r=1, h=2)
+let b = area(r=1, h=2)
+let c = area(r=1.0, h=2)
+let objects = [1, 2]
+function count(values) {
+    let n = 0
+    foreach (value in values) {
+        n = n + 1
+    }
+    return n
+}
+let d = count(values=objects)
+let e = count(values=objects)"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.memoStatistics() == {"area": (1, 2), "count": (0, 0)}
+        out, _ = capfd.readouterr()
+        assert out == ""
+
+    def testVariableDeclaredOnSomePaths(self, capfd):
+        code = """function f(x) {
+    if (x > 0) {
+        let y = 1
+    }
+    else {
+        let z = 2
+    }
+    return z
+}
+let z = 10
+print(out=f(x=1))
+let i = 0
+while (i < 1) {
+    let z = 20
+    print(out=f(x=1))
+    i = i + 1
+}"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.memoStatistics() == {}
+        out, _ = capfd.readouterr()
+        assert out == "10\n20\n"
+
+    def testCalledFunctionHiddenByCallersVariable(self, capfd):
+        code = """function fn(x) {
+    return x
+}
+function printer(x) {
+    print(out="side effect")
+    return x + 100
+}
+function g(a) {
+    return fn(x=a)
+}
+function caller(fn) {
+    return g(a=1)
+}
+print(out=g(a=1))
+print(out=caller(fn=printer))
+print(out=g(a=1))"""
+        interpreter = getInterpreterFromCode(code)
+
+        assert interpreter.memoStatistics() == {"fn": (0, 1), "g": (1, 1)}
+        out, _ = capfd.readouterr()
+        assert out == "1\nside effect\n101\n1\n"
+
+    def testMemoKey(self):
+        assert memoKey([1, "a"]) == memoKey([1, "a"])
+        assert memoKey([1]) != memoKey([True])
+        assert memoKey([1]) != memoKey([1.0])
+        assert memoKey([0.0]) != memoKey([-0.0])
+        assert memoKey([[1]]) is None
+
+    def testMemoCacheEviction(self):
+        memo = MemoCache(maxSize=2)
+        memo.put((1,), "a")
+        memo.put((2,), "b")
+        memo.get((1,))
+        memo.put((3,), "c")
+
+        assert memo.get((2,)) is MISSING
+        assert memo.get((1,)) == "a"
+        assert (memo.hits, memo.misses) == (2, 1)
@@ -1,5 +1,6 @@
-from interpreter.objects import Cuboid
-from .interpreter_utils import assertNoOutput, getInterpreter
+from interpreter.lists import SolidList, TypedList
+from interpreter.objects import Cuboid, Cylinder, Pyramid
+from .interpreter_utils import assertNoOutput, getInterpreter, getInterpreterFromCode
 from parser.nodes import (
     Argument,
     Assignment,
@@ -134,3 +135,86 @@ class TestObjects:
 
         assert interpreter.context == {"cube": (cube, POSITION)}
         assertNoOutput(capfd)
+
+    def testListMethodCall(self, capfd):
+        code = """let a = Cylinder(radius=1, height=2)
+let b = Cylinder(radius=2.5, height=1)
+let cylinders = [a, b]
+let volumes = cylinders.getVolume()
+b.radius = 1
+let areas = cylinders.getBaseArea()
+print(out=areas[1] == a.getBaseArea())
+let c = Cuboid(width=2, length=3, height=4)
+let cuboids = [c, c]
+print(out=cuboids.getSurfaceArea())"""
+        interpreter = getInterpreterFromCode(code)
+        values = {name: value for name, (value, _) in interpreter.context.local_values.items()}
+
+        assert type(values["cylinders"]) == SolidList
+        assert type(values["volumes"]) == TypedList
+        assert values["volumes"] == [Cylinder(radius=1, height=2).getVolume(), Cylinder(radius=2.5, height=1).getVolume()]
+        out, _ = capfd.readouterr()
+        assert out == "True\n[52, 52]\n"
+
+    def testInternalMethodsAreNotCallable(self, capfd):
+        code = """let c = Cuboid(width=2, length=3, height=4)
+let a = c.volume()
+let b = c.clearCache()
+let s = Sphere(radius=1)
+let d = s.getBaseArea()"""
+        getInterpreterFromCode(code)
+
+        out, _ = capfd.readouterr()
+        assert out == (
+            "InterpreterError: c object has no method volume\n"
+            "InterpreterError: c object has no method clearCache\n"
+            "InterpreterError: s object has no method getBaseArea\n"
+        )
+
+    def testListMethodErrors(self, capfd):
+        code = """let s = Sphere(radius=1)
+let spheres = [s]
+let areas = spheres.getBaseArea()
+let volumes = spheres.getVolume(radius=2)
+let c = Cone(radius=1, height=2)
+let mixed = [s, c]
+let mixedVolumes = mixed.getVolume()"""
+        getInterpreterFromCode(code)
+
+        out, _ = capfd.readouterr()
+        assert out == (
+            "InterpreterError: spheres list has no method getBaseArea\n"
+            "InterpreterError: getVolume method takes no arguments\n"
+            "InterpreterError: mixed is not an object\n"
+        )
+
+    def testListFormulas(self):
+        pyramids = SolidList(Pyramid, [Pyramid(width=1.5, length=2.0, height=3.0), Pyramid(width=4, length=5, height=6)])
+
+        assert pyramids.compute("surfaceArea") == [pyramid.getSurfaceArea() for pyramid in pyramids]
+        assert pyramids.compute("volume") == [pyramid.getVolume() for pyramid in pyramids]
+
+    def testPropertyClearsCachedValues(self, capfd):
+        code = """let c = Cylinder(radius=1, height=2)
+let first = c.getVolume()
+c.radius = 2
+let second = c.getVolume()
+let cylinders = [c]
+let volumes = cylinders.getVolume()"""
+        interpreter = getInterpreterFromCode(code)
+        values = {name: value for name, (value, _) in interpreter.context.local_values.items()}
+
+        assert values["first"] == Cylinder(radius=1, height=2).getVolume()
+        assert values["second"] == Cylinder(radius=2, height=2).getVolume()
+        assert values["volumes"] == [values["second"]]
+        assert values["c"].cachedVolume == values["second"]
+        assertNoOutput(capfd)
+
+    def testUnknownProperty(self, capfd):
+        code = """let c = Cylinder(radius=1, height=2)
+c.width = 2"""
+        getInterpreterFromCode(code)
+
+        out, _ = capfd.readouterr()
+        assert out.startswith("InterpreterError: Object c at ")
+        assert out.endswith(" has no property width\n")
@@ -0,0 +1,133 @@
+from .interpreter_utils import assertNoOutput, getInterpreterFromCode
+from interpreter.operations import BUILTIN_FUNCTIONS
+from interpreter.resolver import Resolver
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from lexer.tokens import Position
+from parser.parser import Parser
+
+
+def resolve(code: str) -> tuple[list, dict[str, int]]:
+    nodes = Parser(Lexer(StringSource(code))).parse()
+    globalScope: dict[str, int] = {}
+    Resolver(globalScope).resolve(nodes)
+    return nodes, globalScope
+
+
+class TestResolver:
+    def testGlobalSlots(self):
+        nodes, globalScope = resolve("let a = 1\nlet b = a\nb = 3")
+
+        assert globalScope == {"a": 0, "b": 1}
+        assert nodes[1].assignment.value.slot == (0, 0)
+        assert nodes[2].slot == (0, 1)
+
+    def testLoopSlots(self):
+        code = """let a = 1
+let b = 2
+while (a < 3) {
+    let c = b
+    a = a + c
+}"""
+        nodes, _ = resolve(code)
+        loop = nodes[2]
+
+        assert loop.condition.left.slot == (0, 0)
+        assert loop.block.scope == {"c": 0}
+        assert loop.block.statements[0].assignment.value.slot == (1, 1)
+        assert loop.block.statements[1].slot == (1, 0)
+        assert loop.block.statements[1].value.right.slot == (0, 0)
+
+    def testFunctionSlots(self):
+        code = """function f(x) {
+    let y = x
+    return y + z
+}"""
+        nodes, globalScope = resolve(code)
+        function = nodes[0]
+
+        assert globalScope == {"f": 0}
+        assert function.scope == {"x": 0, "y": 1}
+        assert function.body.statements[0].assignment.value.slot == (0, 0)
+        assert function.body.statements[1].expression.left.slot == (0, 1)
+        assert function.body.statements[1].expression.right.slot is None
+
+    def testBuiltinCalls(self):
+        code = """function f(x) {
+    return x
+}
+let a = f(x=1)
+print(out=string(value=a))"""
+        nodes, _ = resolve(code)
+        userCall, printCall = nodes[1].assignment.value, nodes[2]
+
+        assert userCall.builtin is None
+        assert userCall.slot == (0, 0)
+        assert printCall.builtin == BUILTIN_FUNCTIONS["print"]
+        assert printCall.arguments[0].value.builtin == BUILTIN_FUNCTIONS["string"]
+        assert printCall.slot is None
+
+    def testForEachSlots(self):
+        nodes, _ = resolve("let l = [1, 2]\nforeach (i in l) {\n    print(out=i)\n}")
+        loop = nodes[1]
+
+        assert loop.block.scope == {"i": 0}
+        assert loop.iterable.slot == (0, 0)
+        assert loop.block.statements[0].arguments[0].value.slot == (0, 0)
+
+
+class TestResolvedInterpreter:
+    def testShadowing(self, capfd):
+        code = """let a = 1
+let i = 0
+while (i < 2) {
+    let a = 10
+    if (i == 1) {
+        let a = 100
+        print(out=a)
+    }
+    print(out=a)
+    i = i + 1
+}
+print(out=a)"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "10\n100\n10\n1\n"
+
+    def testFunctionUsesCallerScope(self, capfd):
+        code = """let offset = 5
+function add(a) {
+    return a + offset
+}
+let i = 0
+while (i < 2) {
+    let offset = 100
+    print(out=add(a=i))
+    i = i + 1
+}
+print(out=add(a=1))"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "100\n101\n6\n"
+
+    def testArgumentsEvaluatedInCallerScope(self, capfd):
+        code = """let a = 1
+function f(a, b) {
+    return a + b
+}
+let c = f(a=10, b=a)"""
+        interpreter = getInterpreterFromCode(code)
+
+        assertNoOutput(capfd)
+        assert interpreter.context.get("c", Position(0, 0)) == 11
+
+    def testElseDeclarationNotTaken(self, capfd):
+        code = """if (true) {
+    print(out=1)
+} else {
+    let b = 2
+}
+print(out=b)"""
+        getInterpreterFromCode(code)
+
+        assert capfd.readouterr().out == "1\nInterpreterError: Variable b at [Line 6, Column 11] is not defined\n"
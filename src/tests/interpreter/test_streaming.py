@@ -0,0 +1,43 @@
+import pytest
+from common.errors import ParserError
+from .interpreter_utils import getInterpreterFromCode
+
+PROGRAM = """function area(width, height) {
+    return width * height
+}
+let total = 0
+let i = 0
+while (i < 3) {
+    total = total + area(width=i, height=2)
+    i = i + 1
+}
+if (1 < 2) {
+    print(out=total)
+}
+let cube = Cuboid(width=1, length=2, height=3)
+print(out=cube.getVolume())"""
+
+
+class TestStreaming:
+    def testSameAsWholeProgram(self, capfd):
+        whole = getInterpreterFromCode(PROGRAM)
+        wholeOut, _ = capfd.readouterr()
+        streamed = getInterpreterFromCode(PROGRAM, streaming=True)
+        streamedOut, _ = capfd.readouterr()
+
+        assert streamedOut == wholeOut == "6\n6\n"
+        assert streamed.context.local_values["total"][0] == whole.context.local_values["total"][0]
+        assert streamed.context.names == whole.context.names
+
+    def testStatementsRunBeforeLaterOnesAreParsed(self, capfd):
+        code = """print(out=1)
+let a = 2
+print(out=a)
+let = 3"""
+        with pytest.raises(ParserError):
+            getInterpreterFromCode(code, streaming=True)
+        assert capfd.readouterr().out == "1\n2\n"
+
+        with pytest.raises(ParserError):
+            getInterpreterFromCode(code)
+        assert capfd.readouterr().out == ""
@@ -0,0 +1,36 @@
+import pytest
+from interpreter.visitor import NodeVisitor
+from lexer.tokens import Position
+from parser.nodes import LiteralInt, LiteralString
+
+POSITION = Position(0, 0)
+
+
+class IntVisitor(NodeVisitor):
+    def visitLiteralInt(self, node: LiteralInt) -> str:
+        return "int"
+
+
+class LiteralVisitor(IntVisitor):
+    literalNodes = frozenset({LiteralString})
+
+    def visitLiteralInt(self, node: LiteralInt) -> str:
+        return "overridden int"
+
+
+class TestNodeVisitor:
+    def testDispatchTableIsPerClass(self):
+        assert IntVisitor().visit(LiteralInt(POSITION, 1)) == "int"
+        assert LiteralVisitor().visit(LiteralInt(POSITION, 1)) == "overridden int"
+        assert IntVisitor.dispatchTable[LiteralInt] is IntVisitor.visitLiteralInt
+        assert LiteralVisitor.dispatchTable[LiteralInt] is LiteralVisitor.visitLiteralInt
+        assert NodeVisitor.dispatchTable == {}
+
+    def testLiteralNodesReturnTheirValue(self):
+        assert LiteralVisitor().visit(LiteralString(POSITION, "a")) == "a"
+        assert LiteralString not in LiteralVisitor.dispatchTable
+
+    def testGenericVisit(self):
+        with pytest.raises(Exception) as error:
+            IntVisitor().visit(LiteralString(POSITION, "a"))
+        assert str(error.value) == "No visitLiteralString method"
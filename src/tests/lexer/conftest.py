@@ -0,0 +1,11 @@
+import pytest
+from . import lexer_utils
+from lexer.fast_lexer import FastLexer
+from lexer.lexer import Lexer
+
+
+@pytest.fixture(autouse=True, params=[Lexer, FastLexer], ids=["lexer", "fast"])
+def lexer(request, monkeypatch):
+    # Every lexer test runs against each lexer
+    monkeypatch.setattr(lexer_utils, "LEXER", request.param)
+    return request.param
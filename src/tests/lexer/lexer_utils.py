@@ -2,6 +2,9 @@ from lexer.tokens import Token
 from lexer.source import StringSource
 from lexer.lexer import Lexer
 
+# Lexer class used by getTokens, switched by conftest to run the tests against every lexer
+LEXER: type[Lexer] = Lexer
+
 
 def removeSpaces(string: str) -> str:
     # Removes 12 spaces from the beginning of each line
@@ -11,5 +14,5 @@ def removeSpaces(string: str) -> str:
 def getTokens(code: str, ifRemoveSpaces=True) -> list[Token]:
     if ifRemoveSpaces:
         code = removeSpaces(code)
-    lexer = Lexer(source=StringSource(code))
+    lexer = LEXER(source=StringSource(code))
     return lexer._getAllTokens()
@@ -0,0 +1,45 @@
+from lexer.fast_lexer import FastLexer
+from lexer.lexer import Lexer
+from lexer.source import FileSource, StringSource
+from lexer.token_type import TokenType
+from lexer.tokens import IdentifierValueToken, Position, StringValueToken, Token
+
+
+def getTokens(code: str) -> list[Token]:
+    return FastLexer(StringSource(code))._getAllTokens()
+
+
+class TestFastLexer:
+    def testCommentLine(self):
+        tokens = getTokens("a\n# comment\nb")
+
+        assert tokens == [
+            IdentifierValueToken(Position(1, 1), 1, "a"),
+            IdentifierValueToken(Position(3, 1), 1, "b"),
+            Token(TokenType.VT_EOF, Position(3, 2)),
+        ]
+
+    def testPositionAfterMultilineString(self):
+        tokens = getTokens('"a\nbc" d')
+
+        assert tokens == [
+            StringValueToken(Position(1, 1), 6, "a\nbc"),
+            IdentifierValueToken(Position(2, 5), 1, "d"),
+            Token(TokenType.VT_EOF, Position(2, 6)),
+        ]
+
+    def testInvalidEscapeSequence(self, capfd):
+        tokens = getTokens('"a\\qb" c')
+
+        assert tokens == [IdentifierValueToken(Position(1, 8), 1, "c"), Token(TokenType.VT_EOF, Position(1, 9))]
+        out, _ = capfd.readouterr()
+        assert out == "LexerError: Invalid escape sequence `\\q` at [Line 1, Column 4]\n"
+
+    def testSameTokensAsLexer(self, tmp_path):
+        code = 'let a = Cuboid(width=2, length=3.5, height=a1)\nif (a.getVolume() >= 10 or1) {\n    print(out="x\\ty")\n}'
+        path = tmp_path / "code"
+        path.write_text(code)
+
+        expected = Lexer(StringSource(code))._getAllTokens()
+        assert FastLexer(StringSource(code))._getAllTokens() == expected
+        assert FastLexer(FileSource(path))._getAllTokens()[:-1] == expected[:-1]
@@ -0,0 +1,90 @@
+import pytest
+from lexer.lexer import Lexer
+from lexer.source import FileSource, MmapSource, StringSource
+from lexer.tokens import Position
+from main import MMAP_WITH_FAST_LEXER_ERROR, interpretCode
+
+CODE = 'let a = 2\nlet b = "text"\n\nprint(out=a)\n'
+
+
+def readAll(source) -> list[tuple[str, Position]]:
+    characters = []
+    while not source.isEndOfSource():
+        characters.append((source.readNextCharacter(), source.getPosition()))
+    return characters
+
+
+class TestFileSource:
+    def testPositions(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text("ab\nc")
+
+        assert readAll(FileSource(path)) == [
+            ("a", Position(1, 1)),
+            ("b", Position(1, 2)),
+            ("\n", Position(2, 0)),
+            ("c", Position(2, 1)),
+            ("", Position(2, 2)),
+        ]
+
+    def testBufferBoundaries(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text(CODE)
+
+        expected = readAll(FileSource(path))
+        for bufferSize in (1, 2, 3, 7):
+            assert readAll(FileSource(path, bufferSize)) == expected
+
+    def testSameTokensAsStringSource(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text(CODE)
+
+        fileTokens = Lexer(FileSource(path, bufferSize=4))._getAllTokens()
+        stringTokens = Lexer(StringSource(CODE))._getAllTokens()
+        assert [str(token) for token in fileTokens[:-1]] == [str(token) for token in stringTokens[:-1]]
+
+
+class TestMmapSource:
+    def testSameCharactersAsFileSource(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text(CODE + 'print(out="zażółć ∑ 𝔸")\n', encoding="utf-8")
+
+        assert readAll(MmapSource(path)) == readAll(FileSource(path))
+
+    def testEmptyFile(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text("")
+
+        assert readAll(MmapSource(path)) == [("", Position(1, 1))]
+
+    def testTokens(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text(CODE)
+
+        mmapTokens = Lexer(MmapSource(path))._getAllTokens()
+        fileTokens = Lexer(FileSource(path))._getAllTokens()
+        assert [str(token) for token in mmapTokens] == [str(token) for token in fileTokens]
+
+
+class TestReadUntil:
+    def testSourcesAgree(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text('ab\ncż"ef\\g', encoding="utf-8")
+
+        for source in (StringSource('ab\ncż"ef\\g'), FileSource(path, bufferSize=2), MmapSource(path)):
+            assert source.readNextCharacter() == "a"
+            assert source.readUntil('"\\') == "b\ncż"
+            assert source.getPosition() == Position(2, 2)
+            assert source.readNextCharacter() == '"'
+            assert source.readUntil('"\\') == "ef"
+            assert source.readNextCharacter() == "\\"
+            assert source.readUntil('"\\') == "g"
+            assert source.readUntil('"\\') == ""
+            assert source.getPosition() == Position(2, 7)
+
+    def testNotCombinedWithFastLexer(self, tmp_path):
+        path = tmp_path / "code"
+        path.write_text(CODE)
+
+        with pytest.raises(ValueError, match=MMAP_WITH_FAST_LEXER_ERROR):
+            interpretCode(str(path), isFile=True, useMmap=True, useFastLexer=True)
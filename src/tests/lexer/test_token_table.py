@@ -0,0 +1,22 @@
+from lexer.source import StringSource
+from lexer.token_type import TokenType
+from lexer.tokens import IdentifierValueToken, IntValueToken, Position, Token
+from . import lexer_utils
+
+CODE = 'let a = Cuboid(width=2, length=3.5, height=1)\nif (a.getVolume() >= 1 or true) {\n    print(out="x\\ty")\n}'
+
+
+class TestTokenTable:
+    def testSameTokensAsList(self):
+        table = lexer_utils.LEXER(StringSource(CODE)).getTokenTable()
+
+        assert list(table) == lexer_utils.LEXER(StringSource(CODE))._getAllTokens()
+        assert table[-1].type == TokenType.VT_EOF
+
+    def testValuesArePooled(self):
+        table = lexer_utils.LEXER(StringSource("a = 1\na = a + 1.0")).getTokenTable()
+
+        assert table.values == ["a", 1, 1.0]
+        assert table[3] == IdentifierValueToken(Position(2, 1), 1, "a")
+        assert table[2] == IntValueToken(Position(1, 5), 1, 1)
+        assert table[1:3] == [Token(TokenType.T_ASSIGN, Position(1, 3)), IntValueToken(Position(1, 5), 1, 1)]
@@ -118,6 +118,18 @@ class TestTypes:
         assert tokens[2] == StringValueToken(startPosition=Position(line=3, column=1), length=13, value="hello\tworld")
         assert tokens[3] == StringValueToken(startPosition=Position(line=4, column=1), length=13, value="hello\\world")
 
+    def testLongMultilineString(self):
+        label = "x" * 100000
+        code = f'"{label}\n{label}\\n{label}" a'
+
+        tokens = getTokens(code, ifRemoveSpaces=False)
+
+        assert len(tokens) == 3
+
+        value = f"{label}\n{label}\n{label}"
+        assert tokens[0] == StringValueToken(startPosition=Position(line=1, column=1), length=len(value) + 2, value=value)
+        assert tokens[1] == IdentifierValueToken(startPosition=Position(line=2, column=200005), length=1, value="a")
+
     def testConstants(self):
         code = """
             a = PI
@@ -0,0 +1,63 @@
+import os
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.cache import CachedParser, ProgramCache
+from parser.parser import Parser
+
+CODE = """function add(a, b) {
+    return a + b
+}
+let cube = Cuboid(width=2, height=3, length=4)
+while (cube.width < 5) {
+    cube.width = add(a=cube.width, b=1)
+}"""
+
+
+def parse(code: str, cache: ProgramCache) -> CachedParser:
+    parser = CachedParser(Lexer(StringSource(code)), code.encode(), cache)
+    parser.parse()
+    return parser
+
+
+class TestProgramCache:
+    def testMissThenHit(self, tmp_path):
+        cache = ProgramCache(str(tmp_path))
+        first = parse(CODE, cache)
+        second = CachedParser(Lexer(StringSource(CODE)), CODE.encode(), cache)
+
+        assert second.parse() == Parser(Lexer(StringSource(CODE))).parse()
+        assert not first.isCacheHit
+        assert second.isCacheHit
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def testKeys(self, tmp_path):
+        cache = ProgramCache(str(tmp_path))
+        path = cache.path(CODE.encode())
+
+        assert cache.path((CODE + "\n").encode()) != path
+        cache.version = "other"
+        assert cache.path(CODE.encode()) != path
+
+    def testCorruptedEntryIsReplaced(self, tmp_path):
+        cache = ProgramCache(str(tmp_path))
+        parse(CODE, cache)
+        with open(cache.path(CODE.encode()), "wb") as file:
+            file.write(b"\x80\x05truncated")
+
+        assert not parse(CODE, cache).isCacheHit
+        assert parse(CODE, cache).isCacheHit
+        assert os.listdir(tmp_path) == [os.path.basename(cache.path(CODE.encode()))]
+
+    def testProgramWithUnexpectedTokensIsNotStored(self, tmp_path, capfd):
+        cache = ProgramCache(str(tmp_path))
+        parse("let a = 1\n)", cache)
+
+        assert capfd.readouterr().out.startswith("Unexpected token")
+        assert os.listdir(tmp_path) == []
+
+    def testProgramWithLexerErrorsIsNotStored(self, tmp_path, capfd):
+        cache = ProgramCache(str(tmp_path))
+        parse("let a = 1 @\nprint(out=a)", cache)
+
+        assert capfd.readouterr().out.startswith("LexerError")
+        assert os.listdir(tmp_path) == []
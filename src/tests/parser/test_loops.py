@@ -193,3 +193,17 @@ class TestLoops:
                 ],
             ),
         )
+
+    def testBreakOutsideLoop(self, capfd):
+        # break a = 1
+        tokens = [
+            Token(type=TokenType.T_BREAK, startPosition=Position(0, 0)),
+            IdentifierValueToken(value="a", startPosition=Position(0, 6), length=1),
+            Token(type=TokenType.T_ASSIGN, startPosition=Position(0, 8)),
+            IntValueToken(value=1, startPosition=Position(0, 10), length=1),
+        ]
+        objects = getObjects(tokens)
+
+        assert objects == [Assignment(position=Position(0, 6), name="a", value=LiteralInt(Position(0, 10), 1))]
+        out, _ = capfd.readouterr()
+        assert out == "Unexpected token <type 'break' - Start [Line 0, Column 0]>\n"
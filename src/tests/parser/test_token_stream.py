@@ -0,0 +1,54 @@
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from lexer.token_type import TokenType
+from lexer.tokens import IdentifierValueToken, Position, Token
+from parser import token_stream
+from parser.parser import Parser
+from parser.token_stream import TokenStream
+
+
+def getLexer(code: str) -> Lexer:
+    return Lexer(StringSource(code))
+
+
+class TestTokenStream:
+    def testPeekAhead(self):
+        stream = TokenStream(getLexer("a b c"))
+
+        assert stream.peek(2) == IdentifierValueToken(Position(1, 5), 1, "c")
+        assert stream.peek() == IdentifierValueToken(Position(1, 1), 1, "a")
+        assert stream.advance() == IdentifierValueToken(Position(1, 3), 1, "b")
+        assert stream.peek(2) == Token(TokenType.VT_EOF, Position(1, 6))
+
+    def testPreLexedTokensAreNotConsumed(self):
+        tokens = getLexer("a b")._getAllTokens()[:-1]
+        stream = TokenStream(getLexer(""), tokens)
+
+        assert stream.advance() == IdentifierValueToken(Position(1, 3), 1, "b")
+        assert stream.advance() == Token(TokenType.VT_EOF, Position(1, 3))
+        assert stream.advance() == Token(TokenType.VT_EOF, Position(1, 3))
+        assert len(tokens) == 2
+
+    def testConsumedTokensAreDropped(self, monkeypatch):
+        monkeypatch.setattr(token_stream, "COMPACT_THRESHOLD", 2)
+        stream = TokenStream(getLexer("a b c d"))
+
+        stream.advance()
+        assert stream.advance() == IdentifierValueToken(Position(1, 5), 1, "c")
+        assert stream.peek(1) == IdentifierValueToken(Position(1, 7), 1, "d")
+        assert len(stream.tokens) == 2
+
+    def testParserLookahead(self):
+        parser = Parser(getLexer("let a = 1"))
+
+        assert parser.token.type == TokenType.T_VARIABLE
+        assert parser.peekNextLexerToken() == IdentifierValueToken(Position(1, 5), 1, "a")
+        assert parser.peekNextLexerToken(2) == Token(TokenType.T_ASSIGN, Position(1, 7))
+        assert parser.token.type == TokenType.T_VARIABLE
+
+    def testTokenTable(self):
+        code = "let a = Cuboid(width=2, length=3, height=1)\nwhile (a.width < 5) {\n    a.width = a.width + 1\n}"
+        parser = Parser(getLexer(""), getLexer(code).getTokenTable())
+
+        assert parser.parse() == Parser(getLexer(code)).parse()
+        assert parser.peekNextLexerToken() == Token(TokenType.VT_EOF, Position(4, 2))
@@ -0,0 +1,97 @@
+from interpreter.operations import add, less
+from lexer.lexer import Lexer
+from lexer.source import StringSource
+from parser.parser import Parser
+from vm.compiler import Code, Compiler
+from vm.opcodes import Opcode
+
+
+def compile(code: str) -> list[Code]:
+    nodes = Parser(Lexer(StringSource(code))).parse()
+    return [Compiler().compileStatement(node) for node in nodes]
+
+
+def opcodes(code: Code) -> list[Opcode]:
+    return [Opcode(code.instructions[offset]) for offset in range(0, len(code.instructions), 2)]
+
+
+class TestCompiler:
+    def testVariableDeclaration(self):
+        [code] = compile("let a = 1 + 2")
+
+        assert opcodes(code) == [
+            Opcode.LOAD_CONST,
+            Opcode.BINARY_CONST,
+            Opcode.DECLARE,
+            Opcode.RETURN,
+        ]
+        assert code.constants[:2] == [1, [add, 2]]
+
+    def testConstantsAreDeduplicated(self):
+        [code] = compile("let a = 1 + 1 + 1")
+
+        assert code.constants.count(1) == 1
+
+    def testSignedZerosAreDifferentConstants(self):
+        compiler = Compiler()
+
+        assert compiler.constant(-0.0) != compiler.constant(0.0)
+        assert compiler.constant(0.0) == compiler.constant(0.0)
+        assert compiler.constant(0.0) != compiler.constant(0)
+
+    def testConstantOperandsOfDifferentTypes(self):
+        [code] = compile("print(out=a + 1 == b + true)")
+
+        assert [add, 1] in code.constants
+        assert [add, True] in code.constants
+
+    def testWhileLoop(self):
+        [code] = compile("while (a < 3) {\n    a = a + 1\n}")
+
+        assert opcodes(code) == [
+            Opcode.LOAD_CONST,
+            Opcode.LOAD_VARIABLE,
+            Opcode.BINARY_CONST,
+            Opcode.POP_JUMP_IF_FALSE,
+            Opcode.ENTER_FRAME,
+            Opcode.LOAD_VARIABLE,
+            Opcode.BINARY_CONST,
+            Opcode.STORE_VARIABLE,
+            Opcode.POP_CONTEXT,
+            Opcode.LOOP_STEP,
+            Opcode.POP,
+            Opcode.RETURN,
+        ]
+        assert [less, 3] in code.constants
+        # The loop jumps back to its condition and leaves it past the loop step, where its frame is dropped
+        assert code.instructions[6 + 1] == 20
+        assert code.instructions[18 + 1] == 2
+
+    def testFunctionCallArguments(self):
+        [code] = compile("f(b=x, a=2)")
+
+        assert opcodes(code) == [
+            Opcode.CALL_FUNCTION,
+            Opcode.LOAD_VARIABLE,
+            Opcode.STORE_ARGUMENT,
+            Opcode.LOAD_CONST,
+            Opcode.STORE_ARGUMENT,
+            Opcode.POP,
+            Opcode.RETURN,
+        ]
+        # The call and every argument's end refer to where the arguments start and where the call continues
+        _, starts, end = code.constants[code.instructions[1]]
+        assert starts == (2, 6)
+        assert end == 10
+        assert code.instructions[5] == code.instructions[9] == code.instructions[1]
+
+    def testDisassemble(self):
+        [code] = compile("print(out=2)")
+
+        assert code.disassemble()[0] == "   0 LOAD_CONST         2"
+        assert code.disassemble()[-1] == "   6 RETURN"
+
+    def testWrongConstructorArgumentsCompileToRaise(self):
+        [code] = compile("let a = Sphere(edge=2)")
+
+        assert opcodes(code)[0] == Opcode.RAISE
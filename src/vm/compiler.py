@@ -0,0 +1,394 @@
+from array import array
+from typing import Any, Callable, Optional
+from common.errors import InterpreterError
+from interpreter.interpreter import Completion
+from interpreter.lists import makeList
+from interpreter.operations import (
+    ADDITIVE_OPERATIONS,
+    BUILTIN_FUNCTIONS,
+    COMPARISON_OPERATIONS,
+    MULTIPLICATIVE_OPERATIONS,
+    OBJECT_CLASSES,
+    expectNumberOfArguments,
+    expectSingleArgument,
+    logicalAnd,
+    logicalOr,
+)
+from interpreter.visitor import NodeVisitor
+from parser.nodes import (
+    AdditiveExpression,
+    Assignment,
+    BlockWithoutFunciton,
+    Break,
+    ComparisonExpression,
+    Continue,
+    ForEachLoop,
+    FunctionCall,
+    FunctionDefinition,
+    IfStatement,
+    LemonList,
+    LiteralBool,
+    LiteralFloat,
+    LiteralIdentifier,
+    LiteralInt,
+    LiteralString,
+    LiteralSubscriptable,
+    LogicalAndExpression,
+    LogicalOrExpression,
+    MultiplicativeExpression,
+    Node,
+    ObjectConstructor,
+    ObjectMethodCall,
+    ObjectProperty,
+    PrimaryExpression,
+    ReturnStatement,
+    VariableDeclaration,
+    WhileBlock,
+    WhileLoop,
+)
+from vm.opcodes import JUMPS, NO_OPERAND, Opcode
+
+# Nodes that don't leave a value on the stack, every other node is an expression whose value a block drops
+STATEMENTS = (
+    VariableDeclaration,
+    Assignment,
+    FunctionDefinition,
+    BlockWithoutFunciton,
+    IfStatement,
+    WhileLoop,
+    ForEachLoop,
+    ReturnStatement,
+    Break,
+    Continue,
+)
+# Literals a binary operation can take as its constant right operand
+LITERALS = (LiteralInt, LiteralFloat, LiteralBool, LiteralString)
+# Statements that always complete abruptly, the rest of their block can't run
+ABRUPT_STATEMENTS = (ReturnStatement, Break, Continue)
+# Statements that can complete abruptly, through a statement in one of their blocks. A block is a statement of its own
+# where the constant folder replaced an if statement with its else block.
+COMPOUND_STATEMENTS = (BlockWithoutFunciton, IfStatement, WhileLoop, ForEachLoop)
+
+
+class Code:
+    """
+    Compiled statement or function body: a flat stream of (opcode, operand) pairs and the constant pool the operands
+    index into. Statements complete abruptly by setting the engine's completion, like in the tree-walking interpreter,
+    and a block only checks it after the statements that can set it.
+    """
+
+    def __init__(self) -> None:
+        self.instructions = array("l")
+        self.constants: list = []
+        self.program: Optional[list[Any]] = None
+
+    def __repr__(self) -> str:
+        return "\n".join(self.disassemble())
+
+    def link(self) -> list[Any]:
+        # (opcode, argument) at the offset of every instruction, the argument being the constant the operand indexes,
+        # or the operand itself for jumps and instructions without one, so the engine decodes an instruction only once
+        program: list[Any] = [None] * len(self.instructions)
+        for offset in range(0, len(self.instructions), 2):
+            opcode = Opcode(self.instructions[offset])
+            operand = self.instructions[offset + 1]
+            program[offset] = (opcode.value, operand if opcode in NO_OPERAND or opcode in JUMPS else self.constants[operand])
+        return program
+
+    def disassemble(self) -> list[str]:
+        lines = []
+        for offset in range(0, len(self.instructions), 2):
+            opcode = Opcode(self.instructions[offset])
+            operand = self.instructions[offset + 1]
+            if opcode in NO_OPERAND:
+                lines.append(f"{offset:>4} {opcode.name}")
+            elif opcode in JUMPS:
+                lines.append(f"{offset:>4} {opcode.name:<18} -> {operand}")
+            else:
+                lines.append(f"{offset:>4} {opcode.name:<18} {self.constants[operand]!r}")
+        return lines
+
+
+class Compiler(NodeVisitor):
+    def __init__(self) -> None:
+        self.code = Code()
+        self.constantIndexes: dict = {}
+
+    def compileStatement(self, node: Node) -> Code:
+        self.visit(node)
+        if not isinstance(node, STATEMENTS):
+            self.emit(Opcode.POP)
+        self.emit(Opcode.RETURN)
+        return self.code
+
+    def compileFunction(self, node: FunctionDefinition) -> Code:
+        self.visit(node.body)
+        self.emit(Opcode.RETURN)
+        return self.code
+
+    # Emitting
+
+    def emit(self, opcode: Opcode, operand: int = 0) -> int:
+        self.code.instructions.append(opcode)
+        self.code.instructions.append(operand)
+        return len(self.code.instructions) - 2
+
+    def constant(self, value) -> int:
+        # Floats are keyed by their exact bits, like memo keys, so 0.0 and -0.0 are different constants
+        try:
+            key = (float, value.hex()) if type(value) is float else (type(value), value)
+            index = self.constantIndexes.get(key)
+        except TypeError:
+            key, index = None, None
+        if index is None:
+            index = len(self.code.constants)
+            self.code.constants.append(value)
+            if key is not None:
+                self.constantIndexes[key] = index
+        return index
+
+    def label(self) -> int:
+        return len(self.code.instructions)
+
+    def patch(self, instruction: int, target: int) -> None:
+        self.code.instructions[instruction + 1] = target
+
+    def emitRaise(self, error: Exception) -> None:
+        self.emit(Opcode.RAISE, self.constant(error))
+
+    def compileBlock(self, statements: list) -> None:
+        exits = []
+        for statement in statements:
+            self.visit(statement)
+            if isinstance(statement, ABRUPT_STATEMENTS):
+                break
+            if isinstance(statement, COMPOUND_STATEMENTS):
+                exits.append(self.emit(Opcode.JUMP_IF_ABRUPT))
+            elif not isinstance(statement, STATEMENTS):
+                self.emit(Opcode.POP)
+        for exit in exits:
+            self.patch(exit, self.label())
+
+    def genericVisit(self, node):
+        # Mirrors the tree-walking interpreter, which only fails once it reaches the node
+        self.emitRaise(Exception(f"No visit{type(node).__name__} method"))
+
+    # Statements
+
+    def visitVariableDeclaration(self, node: VariableDeclaration) -> None:
+        variableName = node.assignment.name
+        if type(variableName) != str:
+            self.emitRaise(InterpreterError("Variable declaration's name has to be an identifier, not object property", node))
+            return
+        self.visit(node.assignment.value)
+        self.emit(Opcode.DECLARE, self.constant((variableName, node.startPosition)))
+
+    def visitAssignment(self, node: Assignment) -> None:
+        variableName = node.name
+        if type(variableName) == str:
+            self.visit(node.value)
+            self.emit(Opcode.STORE_VARIABLE, self.constant((variableName, node.position, node.slot)))
+        elif isinstance(variableName, ObjectProperty):
+            self.visit(node.value)
+            self.emit(
+                Opcode.STORE_PROPERTY,
+                self.constant((variableName.identifier, variableName.property, node.position, node.slot)),
+            )
+        else:
+            self.emitRaise(InterpreterError("Assignment's name has to be an identifier, not object property", node))
+
+    # Expressions
+
+    def compileBinary(self, node, operations: dict[str, Callable]) -> None:
+        self.visit(node.left)
+        operation = operations.get(node.operator)
+        if operation is not None and isinstance(node.right, LITERALS):
+            # A literal right operand is passed along with the operation instead of going through the stack. The pair
+            # is a list, so it isn't merged with a pair of an equal operand of another type, like 1 and true.
+            self.emit(Opcode.BINARY_CONST, self.constant([operation, node.right.value]))
+            return
+        self.visit(node.right)
+        if operation is None:
+            self.emitRaise(InterpreterError(f"Operator {node.operator} is not supported", node))
+        else:
+            self.emit(Opcode.BINARY, self.constant(operation))
+
+    def visitLogicalOrExpression(self, node: LogicalOrExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+        self.emit(Opcode.BINARY, self.constant(logicalOr))
+
+    def visitLogicalAndExpression(self, node: LogicalAndExpression) -> None:
+        self.visit(node.left)
+        self.visit(node.right)
+        self.emit(Opcode.BINARY, self.constant(logicalAnd))
+
+    def visitComparisonExpression(self, node: ComparisonExpression) -> None:
+        self.compileBinary(node, COMPARISON_OPERATIONS)
+
+    def visitAdditiveExpression(self, node: AdditiveExpression) -> None:
+        self.compileBinary(node, ADDITIVE_OPERATIONS)
+
+    def visitMultiplicativeExpression(self, node: MultiplicativeExpression) -> None:
+        self.compileBinary(node, MULTIPLICATIVE_OPERATIONS)
+
+    def visitPrimaryExpression(self, node: PrimaryExpression) -> None:
+        self.visit(node.literal)
+        if node.isNegated:
+            self.emit(Opcode.NEGATE)
+
+    # Literals
+
+    def visitLiteralFloat(self, node: LiteralFloat) -> None:
+        self.emit(Opcode.LOAD_CONST, self.constant(node.value))
+
+    def visitLiteralInt(self, node: LiteralInt) -> None:
+        self.emit(Opcode.LOAD_CONST, self.constant(node.value))
+
+    def visitLiteralBool(self, node: LiteralBool) -> None:
+        self.emit(Opcode.LOAD_CONST, self.constant(node.value))
+
+    def visitLiteralString(self, node: LiteralString) -> None:
+        self.emit(Opcode.LOAD_CONST, self.constant(node.value))
+
+    def visitLiteralIdentifier(self, node: LiteralIdentifier) -> None:
+        self.emit(Opcode.LOAD_VARIABLE, self.constant((node.value, node.startPosition, node.slot)))
+
+    def visitLiteralSubscriptable(self, node: LiteralSubscriptable) -> None:
+        self.emit(Opcode.LOAD_VARIABLE, self.constant((node.value, node.startPosition, node.slot)))
+        self.visit(node.subscript)
+        self.emit(Opcode.SUBSCRIPT)
+
+    def visitLemonList(self, node: LemonList) -> None:
+        self.emit(Opcode.NEW_LIST)
+        for value in node.values:
+            self.visit(value)
+            self.emit(Opcode.LIST_APPEND, self.constant(node))
+        self.emit(Opcode.CALL_NATIVE, self.constant(makeList))
+
+    # If
+
+    def visitIfStatement(self, node: IfStatement) -> None:
+        ends = []
+        for conditionWithBlock in [node.ifCB] + (node.elifCBs or []):
+            self.visit(conditionWithBlock.condition)
+            skip = self.emit(Opcode.POP_JUMP_IF_FALSE)
+            self.emit(Opcode.PUSH_CONTEXT, self.constant(conditionWithBlock.block.scope))
+            self.compileBlock(conditionWithBlock.block.statements)
+            self.emit(Opcode.POP_CONTEXT)
+            ends.append(self.emit(Opcode.JUMP))
+            self.patch(skip, self.label())
+        if node.elseBlock:
+            self.visit(node.elseBlock)
+        for end in ends:
+            self.patch(end, self.label())
+
+    def visitBlockWithoutFunciton(self, node: BlockWithoutFunciton) -> None:
+        self.compileBlock(node.statements)
+
+    # Functions
+
+    def visitFunctionDefinition(self, node: FunctionDefinition) -> None:
+        self.emit(Opcode.DEFINE_FUNCTION, self.constant(node))
+
+    def visitFunctionCall(self, node: FunctionCall) -> None:
+        native = BUILTIN_FUNCTIONS.get(node.name)
+        if native is not None:
+            argumentName, function = native
+            try:
+                expectSingleArgument(node.name, argumentName, node.arguments)
+            except TypeError as error:
+                self.emitRaise(error)
+                return
+            self.visit(node.arguments[0].value)
+            self.emit(Opcode.CALL_NATIVE, self.constant(function))
+            return
+        # Which argument is evaluated first depends on the parameters of the function the name refers to when it's
+        # called. Every argument is compiled after the call to a sequence of its own, ending in STORE_ARGUMENT, and the
+        # call jumps to them in the order of the parameters.
+        call = self.emit(Opcode.CALL_FUNCTION)
+        starts, stores = [], []
+        for argument in node.arguments:
+            starts.append(self.label())
+            self.visit(argument.value)
+            stores.append(self.emit(Opcode.STORE_ARGUMENT))
+        site = self.constant((node, tuple(starts), self.label()))
+        for instruction in [call] + stores:
+            self.patch(instruction, site)
+
+    def visitReturnStatement(self, node: ReturnStatement) -> None:
+        self.visit(node.expression)
+        self.emit(Opcode.SET_RETURN_VALUE)
+
+    # Loops
+
+    def visitWhileLoop(self, node: WhileLoop) -> None:
+        # The loop's frame, created by the first iteration, is kept on the stack while the loop runs
+        self.emit(Opcode.LOAD_CONST, self.constant(None))
+        start = self.label()
+        self.visit(node.condition)
+        end = self.emit(Opcode.POP_JUMP_IF_FALSE)
+        self.emit(Opcode.ENTER_FRAME, self.constant((node.block.scope, 1)))
+        self.visit(node.block)
+        self.emit(Opcode.POP_CONTEXT)
+        self.emit(Opcode.LOOP_STEP, start)
+        self.patch(end, self.label())
+        self.emit(Opcode.POP)
+
+    def visitWhileBlock(self, node: WhileBlock) -> None:
+        self.compileBlock(node.statements)
+
+    def visitForEachLoop(self, node: ForEachLoop) -> None:
+        # The loop's frame, created by the first iteration, is kept under the iterator
+        self.emit(Opcode.LOAD_CONST, self.constant(None))
+        self.visit(node.iterable)
+        self.emit(Opcode.GET_ITERATOR)
+        start = self.emit(Opcode.FOR_ITER)
+        self.emit(Opcode.ENTER_FRAME, self.constant((node.block.scope, 3)))
+        self.emit(Opcode.DECLARE, self.constant((node.identifier, node.startPosition)))
+        self.visit(node.block)
+        self.emit(Opcode.POP_CONTEXT)
+        self.emit(Opcode.LOOP_STEP, start)
+        self.patch(start, self.label())
+        self.emit(Opcode.POP)
+        self.emit(Opcode.POP)
+
+    def visitBreak(self, _: Break) -> None:
+        self.emit(Opcode.SET_COMPLETION, self.constant(Completion.BREAK))
+
+    def visitContinue(self, _: Continue) -> None:
+        self.emit(Opcode.SET_COMPLETION, self.constant(Completion.CONTINUE))
+
+    # Objects
+
+    def visitObjectConstructor(self, node: ObjectConstructor) -> None:
+        objectClass = OBJECT_CLASSES.get(node.objectType.value)
+        if objectClass is None:
+            self.emitRaise(InterpreterError(f"Object type {node.objectType} is not supported", node))
+            return
+        objectType, parameters = objectClass
+        try:
+            expectNumberOfArguments(node.arguments, len(parameters), node)
+        except InterpreterError as error:
+            self.emitRaise(error)
+            return
+        for parameter in parameters:
+            value = next((argument.value for argument in node.arguments if argument.name == parameter), None)
+            if value is None:
+                self.emitRaise(InterpreterError(f"{node.objectType} constructor requires {parameter} argument", node))
+                return
+            self.visit(value)
+            self.emit(
+                Opcode.CHECK_NUMBER,
+                self.constant(
+                    InterpreterError(f"{node.objectType} constructor requires {parameter} argument to be a number", node)
+                ),
+            )
+        self.emit(Opcode.BUILD_OBJECT, self.constant((objectType, len(parameters))))
+
+    def visitObjectMethodCall(self, node: ObjectMethodCall) -> None:
+        self.emit(Opcode.LOAD_VARIABLE, self.constant((node.identifier, node.startPosition, node.slot)))
+        self.emit(
+            Opcode.CALL_METHOD,
+            self.constant((node.identifier, node.functionCall.name, len(node.functionCall.arguments), node)),
+        )
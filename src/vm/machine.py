@@ -0,0 +1,227 @@
+from typing import Optional
+from common.errors import InterpreterError
+from interpreter.context import UNDEFINED
+from interpreter.interpreter import Completion, Interpreter
+from interpreter.lists import isList
+from interpreter.operations import callMethod, isNumber, listType, negate, subscript
+from parser.nodes import FunctionCall, FunctionDefinition, Node
+from parser.parser import Parser
+from vm.compiler import Code, Compiler
+from vm.opcodes import Opcode
+
+LOAD_CONST = Opcode.LOAD_CONST.value
+LOAD_VARIABLE = Opcode.LOAD_VARIABLE.value
+STORE_VARIABLE = Opcode.STORE_VARIABLE.value
+STORE_PROPERTY = Opcode.STORE_PROPERTY.value
+DECLARE = Opcode.DECLARE.value
+POP = Opcode.POP.value
+BINARY = Opcode.BINARY.value
+BINARY_CONST = Opcode.BINARY_CONST.value
+NEGATE = Opcode.NEGATE.value
+SUBSCRIPT = Opcode.SUBSCRIPT.value
+NEW_LIST = Opcode.NEW_LIST.value
+LIST_APPEND = Opcode.LIST_APPEND.value
+JUMP = Opcode.JUMP.value
+POP_JUMP_IF_FALSE = Opcode.POP_JUMP_IF_FALSE.value
+JUMP_IF_ABRUPT = Opcode.JUMP_IF_ABRUPT.value
+LOOP_STEP = Opcode.LOOP_STEP.value
+GET_ITERATOR = Opcode.GET_ITERATOR.value
+FOR_ITER = Opcode.FOR_ITER.value
+PUSH_CONTEXT = Opcode.PUSH_CONTEXT.value
+POP_CONTEXT = Opcode.POP_CONTEXT.value
+ENTER_FRAME = Opcode.ENTER_FRAME.value
+SET_COMPLETION = Opcode.SET_COMPLETION.value
+SET_RETURN_VALUE = Opcode.SET_RETURN_VALUE.value
+RAISE = Opcode.RAISE.value
+RETURN = Opcode.RETURN.value
+DEFINE_FUNCTION = Opcode.DEFINE_FUNCTION.value
+STORE_ARGUMENT = Opcode.STORE_ARGUMENT.value
+CALL_FUNCTION = Opcode.CALL_FUNCTION.value
+CALL_NATIVE = Opcode.CALL_NATIVE.value
+CALL_METHOD = Opcode.CALL_METHOD.value
+CHECK_NUMBER = Opcode.CHECK_NUMBER.value
+BUILD_OBJECT = Opcode.BUILD_OBJECT.value
+
+NORMAL_COMPLETION = Completion.NORMAL
+CONTINUE_COMPLETION = Completion.CONTINUE
+RETURN_COMPLETION = Completion.RETURN
+EXHAUSTED = object()
+
+
+class VirtualMachine(Interpreter):
+    """
+    Stack based alternative to the tree-walking interpreter. Every top-level statement and function body is compiled
+    to bytecode once and then run in a single dispatch loop. Contexts, resolved slots and the operator semantics are
+    shared with the tree-walking interpreter.
+    """
+
+    def __init__(self, parser: Parser) -> None:
+        super().__init__(parser)
+        # id of the statement or function definition -> (the node, its compiled code). An entry keeps its node alive, so
+        # no other node can get the same id while it's cached.
+        self.statements: dict[int, tuple[Node, Code]] = {}
+        self.functions: dict[int, tuple[FunctionDefinition, Code]] = {}
+
+    def execute(self, node: Node) -> None:
+        compiled = self.statements.get(id(node))
+        if compiled is None or compiled[0] is not node:
+            compiled = self.statements[id(node)] = (node, Compiler().compileStatement(node))
+        self.run(compiled[1])
+
+    def executeBody(self, function: FunctionDefinition) -> None:
+        compiled = self.functions.get(id(function))
+        if compiled is None or compiled[0] is not function:
+            compiled = self.functions[id(function)] = (function, Compiler().compileFunction(function))
+        self.run(compiled[1])
+
+    def run(self, code: Code) -> None:
+        program = code.program
+        if program is None:
+            program = code.program = code.link()
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        while True:
+            opcode, argument = program[pc]
+            pc += 2
+            if opcode == LOAD_VARIABLE:
+                # The frame of a resolved slot is read in place, Context.get only runs for a variable that isn't there
+                name, position, slot = argument
+                if slot is not None:
+                    context = self.context
+                    depth, index = slot
+                    while depth:
+                        context = context.parent  # type: ignore
+                        depth -= 1
+                    values = context.values
+                    if index < len(values):
+                        value = values[index]
+                        if value is not UNDEFINED:
+                            push(value)
+                            continue
+                push(self.context.get(name, position, slot))
+            elif opcode == LOAD_CONST:
+                push(argument)
+            elif opcode == BINARY_CONST:
+                operation, right = argument
+                stack[-1] = operation(stack[-1], right)
+            elif opcode == BINARY:
+                right = pop()
+                stack[-1] = argument(stack[-1], right)
+            elif opcode == STORE_VARIABLE:
+                name, position, slot = argument
+                self.context.set(name, pop(), position, slot)
+            elif opcode == POP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = argument
+            elif opcode == POP_CONTEXT:
+                self.previousContext()
+            elif opcode == ENTER_FRAME:
+                scope, depth = argument
+                stack[-depth] = self.enterLoopFrame(stack[-depth], scope)
+            elif opcode == LOOP_STEP:
+                completion = self.completion
+                if not completion:
+                    pc = argument
+                elif completion is not RETURN_COMPLETION:
+                    self.completion = NORMAL_COMPLETION
+                    if completion is CONTINUE_COMPLETION:
+                        pc = argument
+            elif opcode == JUMP_IF_ABRUPT:
+                if self.completion:
+                    pc = argument
+            elif opcode == STORE_ARGUMENT:
+                value = pop()
+                values = stack[-1]
+                values.append(value)
+                binding = stack[-2]
+                node, starts, end = argument
+                if len(values) < len(binding[1]):
+                    pc = starts[self.argumentIndex(node, binding, len(values))]
+                else:
+                    del stack[-2:]
+                    push(self.callFunction(binding[0], node, values))
+                    pc = end
+            elif opcode == CALL_FUNCTION:
+                # The function and its binding stay under the values of the arguments until the last one is stored
+                node, starts, end = argument
+                binding = self.bindFunction(node)
+                if binding[1]:
+                    push(binding)
+                    push([])
+                    pc = starts[self.argumentIndex(node, binding, 0)]
+                else:
+                    push(self.callFunction(binding[0], node, []))
+            elif opcode == SET_RETURN_VALUE:
+                self.returnValue = pop()
+                self.completion = RETURN_COMPLETION
+            elif opcode == RETURN:
+                return None
+            elif opcode == DECLARE:
+                name, position = argument
+                self.context.declare(name, pop(), position)
+            elif opcode == FOR_ITER:
+                element = next(stack[-1], EXHAUSTED)
+                if element is EXHAUSTED:
+                    pc = argument
+                else:
+                    push(element)
+            elif opcode == PUSH_CONTEXT:
+                self.nextContext(argument)
+            elif opcode == JUMP:
+                pc = argument
+            elif opcode == POP:
+                pop()
+            elif opcode == CALL_METHOD:
+                objectName, methodName, argumentCount, node = argument
+                stack[-1] = callMethod(stack[-1], objectName, methodName, argumentCount, node)
+            elif opcode == GET_ITERATOR:
+                iterable = stack[-1]
+                if not isList(iterable):
+                    raise TypeError(f"Type {type(iterable)} is not iterable")
+                stack[-1] = iter(iterable)
+            elif opcode == SET_COMPLETION:
+                self.completion = argument
+            elif opcode == NEGATE:
+                stack[-1] = negate(stack[-1])
+            elif opcode == SUBSCRIPT:
+                index = pop()
+                stack[-1] = subscript(stack[-1], index)
+            elif opcode == CALL_NATIVE:
+                stack[-1] = argument(stack[-1])
+            elif opcode == STORE_PROPERTY:
+                name, property, position, slot = argument
+                self.context.setObjectProperty(name, property, pop(), position, slot)
+            elif opcode == NEW_LIST:
+                push([])
+            elif opcode == LIST_APPEND:
+                value = pop()
+                values = stack[-1]
+                if values and not isinstance(value, listType(values[0])):
+                    raise InterpreterError("List cannot contain multiple types", argument)
+                values.append(value)
+            elif opcode == CHECK_NUMBER:
+                if not isNumber(stack[-1]):
+                    raise argument.with_traceback(None)
+            elif opcode == BUILD_OBJECT:
+                objectType, count = argument
+                arguments = stack[-count:]
+                del stack[-count:]
+                push(objectType(*arguments))
+            elif opcode == DEFINE_FUNCTION:
+                self.visitFunctionDefinition(argument)
+            elif opcode == RAISE:
+                raise argument.with_traceback(None)
+            else:
+                raise InterpreterError(f"Unknown opcode {opcode}")
+
+    def argumentIndex(
+        self, node: FunctionCall, binding: tuple[FunctionDefinition, tuple[Optional[int], ...]], parameter: int
+    ) -> int:
+        # Like the tree-walking interpreter, the arguments are evaluated in the order of the function's parameters
+        function, indices = binding
+        index = indices[parameter]
+        if index is None:
+            raise InterpreterError(f"Function {node.name} requires {function.parameters[parameter]} argument", node)
+        return index
@@ -0,0 +1,59 @@
+from enum import IntEnum
+
+
+class Opcode(IntEnum):
+    # Values
+    LOAD_CONST = 0
+    LOAD_VARIABLE = 1
+    STORE_VARIABLE = 2
+    STORE_PROPERTY = 3
+    DECLARE = 4
+    POP = 5
+
+    # Expressions
+    BINARY = 10
+    BINARY_CONST = 15
+    NEGATE = 11
+    SUBSCRIPT = 12
+    NEW_LIST = 13
+    LIST_APPEND = 14
+
+    # Control flow
+    JUMP = 20
+    POP_JUMP_IF_FALSE = 21
+    JUMP_IF_ABRUPT = 22
+    LOOP_STEP = 23
+    GET_ITERATOR = 24
+    FOR_ITER = 25
+    PUSH_CONTEXT = 26
+    POP_CONTEXT = 27
+    ENTER_FRAME = 28
+    SET_COMPLETION = 29
+    SET_RETURN_VALUE = 30
+    RAISE = 31
+    RETURN = 32
+
+    # Calls
+    DEFINE_FUNCTION = 40
+    STORE_ARGUMENT = 41
+    CALL_FUNCTION = 42
+    CALL_NATIVE = 43
+    CALL_METHOD = 44
+    CHECK_NUMBER = 45
+    BUILD_OBJECT = 46
+
+
+# Instructions whose operand is a jump target rather than an index into the constant pool
+JUMPS = {Opcode.JUMP, Opcode.POP_JUMP_IF_FALSE, Opcode.JUMP_IF_ABRUPT, Opcode.LOOP_STEP, Opcode.FOR_ITER}
+
+# Instructions that ignore their operand
+NO_OPERAND = {
+    Opcode.POP,
+    Opcode.NEGATE,
+    Opcode.SUBSCRIPT,
+    Opcode.NEW_LIST,
+    Opcode.GET_ITERATOR,
+    Opcode.POP_CONTEXT,
+    Opcode.SET_RETURN_VALUE,
+    Opcode.RETURN,
+}